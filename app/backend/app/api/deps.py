@@ -1,85 +1,82 @@
-from typing import Generator
+from typing import AsyncGenerator, Generator, Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy import create_engine, event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
-from ..core.config import DATABASE_URL
+from ..core.config import (
+    DATABASE_ASYNC_URL,
+    DATABASE_READ_LAG_CHECK_SECONDS,
+    DATABASE_READ_MAX_LAG_SECONDS,
+    DATABASE_READ_URL,
+    DATABASE_URL,
+    DB_POOL_TIMEOUT_SECONDS,
+    SQLITE_PERFORMANCE_PROFILE,
+)
+from ..core.db_migrations import ensure_schema_current
+from ..core.db_pool import async_database_url, engine_options, instrument_engine, is_memory_sqlite
+from ..core.db_replica import READ_REPLICA_SESSION_KEY, ReadReplica
+from ..core.db_sqlite import SerializedWriteSession, WriteGate, configure_sqlite_connections, writer_engine_options
 from ..core.enums import UserRole
+from ..core.identity_cache import expire_bulk_write_targets
 from ..core.security import AuthenticatedUser, decode_access_token
 from ..models import *  # noqa: F401,F403
 from ..models.base import Base
 
 is_sqlite = DATABASE_URL.startswith("sqlite")
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if is_sqlite else {},
-)
+engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL))
+instrument_engine(engine)
+
+# Same database through its asyncio driver, for endpoints declared with ``async def``.
+ASYNC_DATABASE_URL = DATABASE_ASYNC_URL or async_database_url(DATABASE_URL)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **engine_options(ASYNC_DATABASE_URL, asynchronous=True))
+instrument_engine(async_engine.sync_engine)
+
+
+# Opt-in SQLite tuning; in-memory databases keep the defaults since they live in one connection anyway.
+sqlite_performance_profile = is_sqlite and SQLITE_PERFORMANCE_PROFILE and not is_memory_sqlite(DATABASE_URL)
+write_engine = None
+async_write_engine = None
+write_gate = None
+if sqlite_performance_profile:
+    # Write queue: sessions move onto these single-connection pools at their first write, and
+    # one gate shared by sync and async sessions admits a single write transaction at a time.
+    write_gate = WriteGate(DB_POOL_TIMEOUT_SECONDS)
+    write_engine = create_engine(DATABASE_URL, **writer_engine_options(engine_options(DATABASE_URL)))
+    instrument_engine(write_engine)
+    async_write_engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        **writer_engine_options(engine_options(ASYNC_DATABASE_URL, asynchronous=True)),
+    )
+    instrument_engine(async_write_engine.sync_engine)
 
 if is_sqlite:
-    @event.listens_for(engine, "connect")
-    def _set_sqlite_pragma(dbapi_connection, _):
-        cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
-
-
-def _ensure_sqlite_schema() -> None:
-    if not is_sqlite:
-        return
-
-    with engine.begin() as conn:
-        Base.metadata.create_all(bind=conn)
-
-        def ensure_column(table_name: str, column_name: str, ddl: str) -> None:
-            columns = {
-                row[1]
-                for row in conn.exec_driver_sql(f"PRAGMA table_info('{table_name}')").fetchall()
-            }
-            if columns and column_name not in columns:
-                conn.exec_driver_sql(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {ddl}")
-
-        columns = {
-            row[1]
-            for row in conn.exec_driver_sql("PRAGMA table_info('technicians')").fetchall()
-        }
-        if columns and "password" not in columns:
-            conn.exec_driver_sql("ALTER TABLE technicians ADD COLUMN password VARCHAR(255)")
-        ensure_column("technicians", "full_name", "VARCHAR(255)")
-        ensure_column("technicians", "profile_picture_url", "TEXT")
-        ensure_column("technicians", "working_days", "TEXT DEFAULT '[]' NOT NULL")
-        ensure_column("technicians", "working_hours_start", "TIME")
-        ensure_column("technicians", "working_hours_end", "TIME")
-        ensure_column("technicians", "after_hours_enabled", "BOOLEAN DEFAULT 0 NOT NULL")
-        ensure_column("technicians", "updated_by", "CHAR(32)")
-
-        ensure_column("jobs", "dealership_id", "CHAR(32)")
-        ensure_column("jobs", "customer_name", "VARCHAR(255)")
-        ensure_column("jobs", "customer_address", "TEXT")
-        ensure_column("jobs", "customer_city", "VARCHAR(128)")
-        ensure_column("jobs", "customer_state", "VARCHAR(128)")
-        ensure_column("jobs", "customer_zip_code", "VARCHAR(32)")
-        ensure_column("jobs", "ship_to_name", "VARCHAR(255)")
-        ensure_column("jobs", "ship_to_address", "TEXT")
-        ensure_column("jobs", "ship_to_city", "VARCHAR(128)")
-        ensure_column("jobs", "ship_to_state", "VARCHAR(128)")
-        ensure_column("jobs", "ship_to_zip_code", "VARCHAR(32)")
-        ensure_column("jobs", "service_type", "VARCHAR(255)")
-        ensure_column("jobs", "hours_worked", "NUMERIC(10,2)")
-        ensure_column("jobs", "rate", "NUMERIC(12,2)")
-        ensure_column("jobs", "location", "TEXT")
-        ensure_column("jobs", "vehicle", "VARCHAR(255)")
-        ensure_column("jobs", "tax_code", "VARCHAR(32)")
-        ensure_column("jobs", "tax_rate", "NUMERIC(8,5)")
-        ensure_column("jobs", "completed_at", "DATETIME")
-        ensure_column("jobs", "invoice_id", "CHAR(32)")
-
-
-_ensure_sqlite_schema()
-
-
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    sqlite_engines = [engine, async_engine.sync_engine]
+    if write_engine is not None:
+        sqlite_engines += [write_engine, async_write_engine.sync_engine]
+    for sqlite_engine in sqlite_engines:
+        configure_sqlite_connections(sqlite_engine, sqlite_performance_profile)
+
+
+if is_sqlite:
+    # Postgres is migrated by scripts/migrate.py; local SQLite databases catch up on startup.
+    ensure_schema_current(engine, Base.metadata)
+
+
+# Request sessions double as an identity cache for by-id lookups; bulk writes expire what they touch.
+event.listen(SerializedWriteSession, "do_orm_execute", expire_bulk_write_targets)
+
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    class_=SerializedWriteSession,
+    writer=write_engine,
+    write_gate=write_gate,
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
@@ -91,6 +88,74 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    sync_session_class=SerializedWriteSession,
+    writer=async_write_engine.sync_engine if async_write_engine is not None else None,
+    write_gate=write_gate,
+)
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Async session for ``async def`` endpoints.
+
+    Services and repositories take a sync ``Session``; run them on this session's
+    connection with ``await db.run_sync(lambda session: Service(session).method())``.
+    Database waits then suspend the request on the event loop instead of holding one
+    of the threadpool workers that sync endpoints run on. Build the response inside
+    the callable, since lazy loads cannot run once it returns.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+read_replica: Optional[ReadReplica] = (
+    ReadReplica(
+        engine,
+        DATABASE_READ_URL,
+        max_lag_seconds=DATABASE_READ_MAX_LAG_SECONDS,
+        check_interval_seconds=DATABASE_READ_LAG_CHECK_SECONDS,
+    )
+    if DATABASE_READ_URL
+    else None
+)
+
+
+def get_read_db() -> Generator[Session, None, None]:
+    """Session for read-only endpoints: the replica while it is caught up, otherwise the primary.
+
+    Sessions on the replica carry ``READ_REPLICA_SESSION_KEY`` so services skip their
+    incidental writes. A replica that fails a query serves no reads until the next lag check.
+    """
+    replica = read_replica
+    use_replica = replica is not None and replica.is_current()
+    db = replica.SessionLocal() if use_replica else SessionLocal()
+    db.info[READ_REPLICA_SESSION_KEY] = use_replica
+    try:
+        yield db
+    except OperationalError:
+        if use_replica:
+            replica.mark_unavailable()
+        raise
+    finally:
+        db.close()
+
+
+async def get_async_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Async counterpart of ``get_read_db``."""
+    replica = read_replica
+    use_replica = replica is not None and await replica.is_current_async()
+    async with (replica.AsyncSessionLocal() if use_replica else AsyncSessionLocal()) as db:
+        db.sync_session.info[READ_REPLICA_SESSION_KEY] = use_replica
+        try:
+            yield db
+        except OperationalError:
+            if use_replica:
+                replica.mark_unavailable()
+            raise
+
+
 def get_current_user(token: str = Depends(oauth2_scheme)) -> AuthenticatedUser:
     return decode_access_token(token)
 
@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends
+
+from ...api import deps
+from ...core.db_pool import pool_status
+from ...core.enums import UserRole
+from ...core.security import AuthenticatedUser
+from ...schemas.metrics import DatabasePoolMetricsResponse
+
+router = APIRouter(prefix="/admin/metrics", tags=["admin-metrics"])
+
+
+@router.get("/database-pool", response_model=DatabasePoolMetricsResponse)
+def get_database_pool_metrics(
+    current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.ADMIN)),
+):
+    _ = current_user
+    pools = [
+        pool_status("primary", deps.engine),
+        pool_status("primary-async", deps.async_engine.sync_engine),
+    ]
+    if deps.write_engine is not None:
+        pools += [
+            pool_status("primary-writer", deps.write_engine),
+            pool_status("primary-async-writer", deps.async_write_engine.sync_engine),
+        ]
+    replica = deps.read_replica
+    if replica is None:
+        return DatabasePoolMetricsResponse(pools=pools)
+    pools += [
+        pool_status("replica", replica.engine),
+        pool_status("replica-async", replica.async_engine.sync_engine),
+    ]
+    return DatabasePoolMetricsResponse(
+        pools=pools,
+        replica_in_use=replica.cached(),
+        replica_lag_seconds=replica.lag_seconds,
+    )
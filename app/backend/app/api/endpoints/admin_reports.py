@@ -1,7 +1,7 @@
 from datetime import date, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...api import deps
 from ...core.enums import UserRole
@@ -13,10 +13,10 @@ router = APIRouter(prefix="/admin/reports", tags=["admin-reports"])
 
 
 @router.get("/overview", response_model=ReportsOverviewResponse)
-def get_reports_overview(
+async def get_reports_overview(
     from_date: date | None = Query(default=None),
     to_date: date | None = Query(default=None),
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_read_db),
     current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.ADMIN)),
 ):
     _ = current_user
@@ -28,4 +28,6 @@ def get_reports_overview(
             detail="from_date cannot be later than to_date",
         )
 
-    return ReportsService(db).get_overview(from_date=resolved_from, to_date=resolved_to)
+    return await db.run_sync(
+        lambda session: ReportsService(session).get_overview(from_date=resolved_from, to_date=resolved_to)
+    )
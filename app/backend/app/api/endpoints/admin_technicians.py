@@ -1,7 +1,10 @@
-from typing import Dict, List
+import tempfile
+from datetime import date, timedelta
+from typing import Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from ...api import deps
@@ -10,9 +13,19 @@ from ...core.security import AuthenticatedUser
 from ...schemas.technician_profile import (
     AdminTimeOffCreateRequest,
     AssignmentReadinessResponse,
+    BulkAssignmentResponse,
+    BulkSkillAssignmentRequest,
+    BulkTechnicianStatusRequest,
+    BulkTechnicianStatusResponse,
+    BulkZoneAssignmentRequest,
+    EarliestSlotsResponse,
+    JobProximityResponse,
     SkillCreateRequest,
     SkillResponse,
+    TeamCalendarResponse,
     TechnicianCreateRequest,
+    TechnicianImportFormat,
+    TechnicianImportResponse,
     TechnicianListItemResponse,
     TechnicianProfileResponse,
     TechnicianSkillAssignRequest,
@@ -25,14 +38,28 @@ from ...schemas.technician_profile import (
     ZoneResponse,
 )
 from ...services.assignment_service import AssignmentService
+from ...services.proximity_service import ProximityService
+from ...services.slot_search_service import MAX_SEARCH_HORIZON_DAYS, SlotSearchService
+from ...services.team_calendar_service import (
+    MAX_CALENDAR_DAYS,
+    TeamCalendarService,
+    calendar_etag,
+    etag_matches,
+)
 from ...services.technician_admin_service import TechnicianAdminService
+from ...services.technician_import_service import (
+    IMPORT_SPOOL_MEMORY_BYTES,
+    MAX_IMPORT_BYTES,
+    TechnicianImportService,
+    resolve_import_format,
+)
 
 router = APIRouter(prefix="/admin/technicians", tags=["admin-technicians"])
 
 
 @router.get("", response_model=List[TechnicianListItemResponse])
 def list_admin_technicians(
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_read_db),
     current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.ADMIN)),
 ):
     return TechnicianAdminService(db, current_user).list_technicians()
@@ -47,6 +74,36 @@ def create_admin_technician(
     return TechnicianAdminService(db, current_user).create_technician(payload)
 
 
+@router.post("/import", response_model=TechnicianImportResponse)
+async def import_technicians(
+    request: Request,
+    format: Optional[TechnicianImportFormat] = Query(default=None, description="defaults to the Content-Type"),
+    db: Session = Depends(deps.get_db),
+    current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.ADMIN)),
+):
+    import_format = format or resolve_import_format(request.headers.get("content-type"))
+    if import_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="send text/csv or application/x-ndjson, or pass ?format=",
+        )
+
+    # The body is spooled (to disk past the memory threshold) and parsed batch by batch in a worker thread.
+    with tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_MEMORY_BYTES) as spool:
+        received = 0
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > MAX_IMPORT_BYTES:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"import cannot exceed {MAX_IMPORT_BYTES} bytes",
+                )
+            spool.write(chunk)
+        spool.seek(0)
+        service = TechnicianImportService(db, current_user)
+        return await run_in_threadpool(service.import_stream, spool, import_format)
+
+
 @router.get("/zones/catalog", response_model=List[ZoneResponse])
 def list_zone_catalog(
     db: Session = Depends(deps.get_db),
@@ -81,6 +138,97 @@ def create_skill_catalog_entry(
     return TechnicianAdminService(db, current_user).create_skill(payload)
 
 
+@router.post("/zones/bulk", response_model=BulkAssignmentResponse)
+def bulk_update_technician_zones(
+    payload: BulkZoneAssignmentRequest,
+    db: Session = Depends(deps.get_db),
+    current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.ADMIN)),
+):
+    return TechnicianAdminService(db, current_user).bulk_update_zone_assignments(payload)
+
+
+@router.post("/skills/bulk", response_model=BulkAssignmentResponse)
+def bulk_update_technician_skills(
+    payload: BulkSkillAssignmentRequest,
+    db: Session = Depends(deps.get_db),
+    current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.ADMIN)),
+):
+    return TechnicianAdminService(db, current_user).bulk_update_skill_assignments(payload)
+
+
+@router.post("/status/bulk", response_model=BulkTechnicianStatusResponse)
+def bulk_update_technician_status(
+    payload: BulkTechnicianStatusRequest,
+    db: Session = Depends(deps.get_db),
+    current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.ADMIN)),
+):
+    return TechnicianAdminService(db, current_user).bulk_update_status(payload)
+
+
+@router.get("/calendar", response_model=TeamCalendarResponse)
+def get_team_availability_calendar(
+    request: Request,
+    response: Response,
+    from_date: date | None = Query(default=None),
+    to_date: date | None = Query(default=None),
+    db: Session = Depends(deps.get_db),
+    current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.ADMIN)),
+):
+    _ = current_user
+    resolved_from = from_date or date.today()
+    resolved_to = to_date or (resolved_from + timedelta(days=13))
+    if resolved_from > resolved_to:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="from_date cannot be later than to_date",
+        )
+    if (resolved_to - resolved_from).days + 1 > MAX_CALENDAR_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"date range cannot exceed {MAX_CALENDAR_DAYS} days",
+        )
+
+    calendar = TeamCalendarService(db).build_calendar(from_date=resolved_from, to_date=resolved_to)
+    etag = calendar_etag(calendar)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    return calendar
+
+
+@router.get("/earliest-slots/{job_id}", response_model=EarliestSlotsResponse)
+def get_earliest_available_slots(
+    job_id: UUID,
+    limit: int = Query(default=5, ge=1, le=50),
+    horizon_days: int = Query(default=7, ge=1, le=MAX_SEARCH_HORIZON_DAYS),
+    duration_minutes: int = Query(default=120, ge=15, le=720),
+    slots_per_technician: int = Query(default=1, ge=1, le=10),
+    db: Session = Depends(deps.get_db),
+    current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.ADMIN)),
+):
+    _ = current_user
+    return SlotSearchService(db).find_earliest_slots_for_job(
+        job_id,
+        limit=limit,
+        horizon_days=horizon_days,
+        min_duration=timedelta(minutes=duration_minutes),
+        max_slots_per_technician=slots_per_technician,
+    )
+
+
+@router.get("/nearest/{job_id}", response_model=JobProximityResponse)
+def get_nearest_eligible_technicians(
+    job_id: UUID,
+    limit: int = Query(default=20, ge=1, le=200),
+    max_distance_km: Optional[float] = Query(default=None, gt=0),
+    db: Session = Depends(deps.get_db),
+    current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.ADMIN)),
+):
+    _ = current_user
+    return ProximityService(db).rank_candidates_for_job(job_id, limit=limit, max_distance_km=max_distance_km)
+
+
 @router.get("/{technician_id}", response_model=TechnicianProfileResponse)
 def get_admin_technician_profile(
     technician_id: UUID,
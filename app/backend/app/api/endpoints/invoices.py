@@ -2,7 +2,7 @@ from typing import List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...api import deps
 from ...core.enums import UserRole
@@ -20,66 +20,68 @@ router = APIRouter(prefix="/invoices", tags=["invoices"])
 
 
 @router.get("", response_model=List[InvoiceResponse])
-def list_invoices(
-    db: Session = Depends(deps.get_db),
+async def list_invoices(
+    db: AsyncSession = Depends(deps.get_async_read_db),
     current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.ADMIN)),
 ):
-    return InvoiceService(db, current_user).list_invoices()
+    return await db.run_sync(lambda session: InvoiceService(session, current_user).list_invoices())
 
 
 @router.get("/pending-approvals", response_model=List[InvoicePendingApprovalResponse])
-def list_pending_invoice_approvals(
-    db: Session = Depends(deps.get_db),
+async def list_pending_invoice_approvals(
+    db: AsyncSession = Depends(deps.get_async_read_db),
     current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.ADMIN)),
 ):
-    return InvoiceService(db, current_user).list_pending_approvals()
+    return await db.run_sync(lambda session: InvoiceService(session, current_user).list_pending_approvals())
 
 
 @router.post("", response_model=InvoiceResponse, status_code=status.HTTP_201_CREATED)
-def create_invoice(
+async def create_invoice(
     payload: InvoiceCreateRequest,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.ADMIN)),
 ):
-    return InvoiceService(db, current_user).create_invoice(payload)
+    return await db.run_sync(lambda session: InvoiceService(session, current_user).create_invoice(payload))
 
 
 @router.get("/{invoice_id}", response_model=InvoiceResponse)
-def get_invoice(
+async def get_invoice(
     invoice_id: UUID,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.ADMIN)),
 ):
-    return InvoiceService(db, current_user).get_invoice(invoice_id)
+    return await db.run_sync(lambda session: InvoiceService(session, current_user).get_invoice(invoice_id))
 
 
 @router.put("/{invoice_id}", response_model=InvoiceResponse)
-def update_invoice(
+async def update_invoice(
     invoice_id: UUID,
     payload: InvoiceUpdateRequest,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.ADMIN)),
 ):
-    return InvoiceService(db, current_user).update_invoice(invoice_id, payload)
+    return await db.run_sync(lambda session: InvoiceService(session, current_user).update_invoice(invoice_id, payload))
 
 
 @router.delete("/{invoice_id}", response_model=InvoiceResponse)
-def void_invoice(
+async def void_invoice(
     invoice_id: UUID,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.ADMIN)),
 ):
-    return InvoiceService(db, current_user).void_invoice(invoice_id)
+    return await db.run_sync(lambda session: InvoiceService(session, current_user).void_invoice(invoice_id))
 
 
 @router.post("/{invoice_id}/mark-paid", response_model=InvoiceResponse)
-def mark_invoice_paid(
+async def mark_invoice_paid(
     invoice_id: UUID,
     payload: InvoiceMarkPaidRequest,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.ADMIN)),
 ):
-    return InvoiceService(db, current_user).mark_invoice_paid(
-        invoice_id,
-        payment_recorded_at=payload.payment_recorded_at,
+    return await db.run_sync(
+        lambda session: InvoiceService(session, current_user).mark_invoice_paid(
+            invoice_id,
+            payment_recorded_at=payload.payment_recorded_at,
+        )
     )
@@ -1,61 +1,150 @@
-from typing import List
+import asyncio
+from typing import AsyncIterator, List, Optional
+from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from ...api import deps
+from ...core.broadcast import get_broadcast_hub
+from ...core.config import BROADCAST_HEARTBEAT_SECONDS
 from ...core.enums import UserRole
 from ...core.security import AuthenticatedUser
 from ...schemas.technician_profile import (
+    AvailableJobsPage,
     EmailChangeRequestCreateRequest,
     EmailChangeRequestResponse,
+    JobAcceptanceResponse,
     TechnicianAvailabilityUpdateRequest,
     TechnicianProfileResponse,
     TechnicianProfileUpdateRequest,
+    TechnicianSyncResponse,
 )
+from ...services.job_acceptance_service import JobAcceptanceService
 from ...services.technician_profile_service import TechnicianProfileService
 
 router = APIRouter(prefix="/technicians/me", tags=["technician-profile"])
 
 
 @router.get("", response_model=TechnicianProfileResponse)
-def get_my_profile(
-    db: Session = Depends(deps.get_db),
+async def get_my_profile(
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.TECHNICIAN)),
 ):
-    return TechnicianProfileService(db, current_user).get_profile()
+    return await db.run_sync(lambda session: TechnicianProfileService(session, current_user).get_profile())
+
+
+@router.get("/sync", response_model=TechnicianSyncResponse)
+async def sync_my_profile(
+    request: Request,
+    response: Response,
+    since: Optional[str] = Query(None, description="sync_token from the previous sync"),
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.TECHNICIAN)),
+):
+    if_none_match = request.headers.get("if-none-match")
+
+    def load(session: Session):
+        service = TechnicianProfileService(session, current_user)
+        if if_none_match and service.is_sync_current(if_none_match):
+            return None
+        return service.get_sync_bundle(since=since or if_none_match)
+
+    bundle = await db.run_sync(load)
+    if bundle is None:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": if_none_match})
+    response.headers["ETag"] = f'"{bundle.sync_token}"'
+    response.headers["Cache-Control"] = "private, no-cache"
+    return bundle
 
 
 @router.put("", response_model=TechnicianProfileResponse)
-def update_my_profile(
+async def update_my_profile(
     payload: TechnicianProfileUpdateRequest,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.TECHNICIAN)),
 ):
-    return TechnicianProfileService(db, current_user).update_profile(payload)
+    return await db.run_sync(lambda session: TechnicianProfileService(session, current_user).update_profile(payload))
 
 
 @router.put("/availability", response_model=TechnicianProfileResponse)
-def update_my_availability(
+async def update_my_availability(
     payload: TechnicianAvailabilityUpdateRequest,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.TECHNICIAN)),
 ):
-    return TechnicianProfileService(db, current_user).update_availability(payload)
+    return await db.run_sync(
+        lambda session: TechnicianProfileService(session, current_user).update_availability(payload)
+    )
 
 
 @router.post("/email-change-request", response_model=EmailChangeRequestResponse, status_code=201)
-def request_email_change(
+async def request_email_change(
     payload: EmailChangeRequestCreateRequest,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.TECHNICIAN)),
 ):
-    return TechnicianProfileService(db, current_user).request_email_change(payload)
+    return await db.run_sync(
+        lambda session: TechnicianProfileService(session, current_user).request_email_change(payload)
+    )
 
 
 @router.get("/email-change-requests", response_model=List[EmailChangeRequestResponse])
-def list_my_email_change_requests(
-    db: Session = Depends(deps.get_db),
+async def list_my_email_change_requests(
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.TECHNICIAN)),
+):
+    return await db.run_sync(
+        lambda session: TechnicianProfileService(session, current_user).list_my_email_change_requests()
+    )
+
+
+@router.get("/jobs/available", response_model=AvailableJobsPage)
+async def list_my_available_jobs(
+    after: Optional[UUID] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.TECHNICIAN)),
+):
+    return await db.run_sync(
+        lambda session: TechnicianProfileService(session, current_user).list_available_jobs(after=after, limit=limit)
+    )
+
+
+@router.post("/jobs/{job_id}/accept", response_model=JobAcceptanceResponse)
+async def accept_job(
+    job_id: UUID,
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.TECHNICIAN)),
+):
+    return await db.run_sync(lambda session: JobAcceptanceService(session).accept_job(current_user.user_id, job_id))
+
+
+async def _event_stream(request: Request, technician_id) -> AsyncIterator[str]:
+    hub = get_broadcast_hub()
+    subscription = hub.subscribe(technician_id)
+    try:
+        yield f"retry: {BROADCAST_HEARTBEAT_SECONDS * 1000}\n\n"
+        while not await request.is_disconnected():
+            try:
+                item = await asyncio.wait_for(subscription.get(), timeout=BROADCAST_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            yield item.to_sse()
+    finally:
+        hub.unsubscribe(subscription)
+
+
+@router.get("/events")
+def stream_my_job_events(
+    request: Request,
     current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.TECHNICIAN)),
 ):
-    return TechnicianProfileService(db, current_user).list_my_email_change_requests()
+    return StreamingResponse(
+        _event_stream(request, current_user.user_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,7 +1,7 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...api import deps
 from ...core.enums import UserRole
@@ -13,18 +13,20 @@ router = APIRouter(prefix="/technician/time-off", tags=["technician-time-off"])
 
 
 @router.post("", response_model=TimeOffResponseItem)
-def create_technician_time_off(
+async def create_technician_time_off(
     payload: TimeOffCreateRequest,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.TECHNICIAN)),
 ):
-    return TechnicianTimeOffService(db, current_user).create_time_off(payload)
+    return await db.run_sync(lambda session: TechnicianTimeOffService(session, current_user).create_time_off(payload))
 
 
 @router.delete("/{time_off_id}", response_model=TimeOffResponseItem)
-def cancel_technician_time_off(
+async def cancel_technician_time_off(
     time_off_id: UUID,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: AuthenticatedUser = Depends(deps.require_roles(UserRole.TECHNICIAN)),
 ):
-    return TechnicianTimeOffService(db, current_user).cancel_time_off(time_off_id)
+    return await db.run_sync(
+        lambda session: TechnicianTimeOffService(session, current_user).cancel_time_off(time_off_id)
+    )
@@ -0,0 +1,218 @@
+import asyncio
+import json
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+PENDING_EVENTS_KEY = "pending_broadcast_events"
+RESYNC_EVENT = "feed.resync"
+
+
+@dataclass(frozen=True)
+class BroadcastEvent:
+    event: str
+    technician_ids: tuple
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    def to_message(self) -> Dict[str, Any]:
+        return {
+            "event": self.event,
+            "technician_ids": [str(item) for item in self.technician_ids],
+            "data": self.data,
+        }
+
+    @classmethod
+    def from_message(cls, message: Dict[str, Any]) -> "BroadcastEvent":
+        return cls(
+            event=message["event"],
+            technician_ids=tuple(UUID(item) for item in message["technician_ids"]),
+            data=message.get("data") or {},
+        )
+
+    def to_sse(self) -> str:
+        return f"event: {self.event}\ndata: {json.dumps(self.data, default=str)}\n\n"
+
+
+class BroadcastBroker(ABC):
+    """Transport between hubs.
+
+    Every API worker owns one hub. A hub publishes through the broker and receives
+    whatever the broker delivers, including its own events, so a shared broker
+    (Redis pub/sub, Postgres LISTEN/NOTIFY) fans events out to all workers.
+    """
+
+    @abstractmethod
+    def attach(self, deliver: Callable[[BroadcastEvent], None]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def publish(self, item: BroadcastEvent) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        return None
+
+
+class InMemoryBroker(BroadcastBroker):
+    """Single-process stand-in: events round-trip through the same message format a shared broker would carry."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._deliveries: List[Callable[[BroadcastEvent], None]] = []
+
+    def attach(self, deliver: Callable[[BroadcastEvent], None]) -> None:
+        with self._lock:
+            self._deliveries.append(deliver)
+
+    def publish(self, item: BroadcastEvent) -> None:
+        message = json.loads(json.dumps(item.to_message(), default=str))
+        with self._lock:
+            deliveries = list(self._deliveries)
+        for deliver in deliveries:
+            deliver(BroadcastEvent.from_message(message))
+
+
+class Subscription:
+    """One connected client. Events are queued on the client's event loop with a bounded buffer.
+
+    A client that falls behind by more than ``max_queue`` events has its backlog
+    discarded and receives a single resync event, telling it to refetch its feed.
+    Events arriving before it reads the resync are dropped as well.
+    """
+
+    def __init__(self, technician_id: UUID, loop: asyncio.AbstractEventLoop, max_queue: int):
+        self.technician_id = technician_id
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+        self.overflowed = False
+
+    def offer(self, item: BroadcastEvent) -> None:
+        if self.loop.is_closed():
+            return
+        self.loop.call_soon_threadsafe(self._put, item)
+
+    def _put(self, item: BroadcastEvent) -> None:
+        if self.overflowed:
+            self.dropped += 1
+            return
+        try:
+            self.queue.put_nowait(item)
+            return
+        except asyncio.QueueFull:
+            pass
+        while not self.queue.empty():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.dropped += 1
+        self.overflowed = True
+        self.queue.put_nowait(BroadcastEvent(event=RESYNC_EVENT, technician_ids=(self.technician_id,)))
+
+    async def get(self) -> BroadcastEvent:
+        item = await self.queue.get()
+        if item.event == RESYNC_EVENT:
+            self.overflowed = False
+        return item
+
+
+class BroadcastHub:
+    def __init__(self, broker: BroadcastBroker, max_queue: int):
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._subscriptions: Dict[UUID, Set[Subscription]] = {}
+        self.broker = broker
+        self.broker.attach(self._deliver)
+
+    def use_broker(self, broker: BroadcastBroker) -> None:
+        self.broker.close()
+        self.broker = broker
+        self.broker.attach(self._deliver)
+
+    def subscribe(self, technician_id: UUID) -> Subscription:
+        subscription = Subscription(technician_id, asyncio.get_running_loop(), self.max_queue)
+        with self._lock:
+            self._subscriptions.setdefault(technician_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            active = self._subscriptions.get(subscription.technician_id)
+            if active is None:
+                return
+            active.discard(subscription)
+            if not active:
+                del self._subscriptions[subscription.technician_id]
+
+    def connection_count(self) -> int:
+        with self._lock:
+            return sum(len(items) for items in self._subscriptions.values())
+
+    def publish(self, item: BroadcastEvent) -> None:
+        if item.technician_ids:
+            self.broker.publish(item)
+
+    def _deliver(self, item: BroadcastEvent) -> None:
+        with self._lock:
+            targets = [
+                subscription
+                for technician_id in item.technician_ids
+                for subscription in self._subscriptions.get(technician_id, ())
+            ]
+        for subscription in targets:
+            subscription.offer(item)
+
+
+def queue_broadcast(
+    session: Optional[Session],
+    event_name: str,
+    technician_ids: Iterable[UUID],
+    data: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Hold an event on the session until its transaction commits; rolled-back work is never announced."""
+    recipients = tuple(dict.fromkeys(item for item in technician_ids if item is not None))
+    if session is None or not recipients:
+        return
+    session.info.setdefault(PENDING_EVENTS_KEY, []).append(
+        BroadcastEvent(event=event_name, technician_ids=recipients, data=dict(data or {}))
+    )
+
+
+def _build_broker(name: str) -> BroadcastBroker:
+    if name == "memory":
+        return InMemoryBroker()
+    raise RuntimeError(f"Unsupported BROADCAST_BROKER: {name}")
+
+
+_hub: Optional[BroadcastHub] = None
+_hub_lock = threading.Lock()
+
+
+def get_broadcast_hub() -> BroadcastHub:
+    # Built on first use: models import this module, and settings must not be read at model import time.
+    global _hub
+    with _hub_lock:
+        if _hub is None:
+            from .config import BROADCAST_BROKER, BROADCAST_QUEUE_SIZE
+
+            _hub = BroadcastHub(_build_broker(BROADCAST_BROKER), max_queue=BROADCAST_QUEUE_SIZE)
+        return _hub
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_broadcasts(session: Session) -> None:
+    pending = session.info.pop(PENDING_EVENTS_KEY, [])
+    if not pending:
+        return
+    hub = get_broadcast_hub()
+    for item in pending:
+        hub.publish(item)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_broadcasts(session: Session) -> None:
+    session.info.pop(PENDING_EVENTS_KEY, None)
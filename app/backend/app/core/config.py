@@ -58,6 +58,23 @@ def get_env_csv(name: str, default: str) -> list[str]:
     return [item.strip() for item in value.split(",") if item.strip()]
 
 
+def get_env_int(name: str, default: int) -> int:
+    value = get_env(name, str(default))
+    try:
+        return int(value.strip())
+    except ValueError as exc:
+        raise RuntimeError(f"Environment variable {name} must be an integer") from exc
+
+
+def get_env_bool(name: str, default: bool) -> bool:
+    value = get_env(name, "true" if default else "false").strip().lower()
+    if value in {"1", "true", "yes", "on"}:
+        return True
+    if value in {"0", "false", "no", "off"}:
+        return False
+    raise RuntimeError(f"Environment variable {name} must be a boolean")
+
+
 def normalize_database_url(value: str) -> str:
     return value.strip()
 
@@ -70,6 +87,33 @@ DATABASE_URL = (
     else normalize_database_url(get_required_env("DATABASE_URL"))
 )
 
+# asyncio DSN for the async session; derived from DATABASE_URL (aiosqlite / asyncpg) when unset.
+DATABASE_ASYNC_URL = get_env("DATABASE_ASYNC_URL", "").strip()
+
+# Optional read replica for read-only endpoints. Reads fall back to the primary while the replica
+# trails it by more than DATABASE_READ_MAX_LAG_SECONDS; lag is re-checked every
+# DATABASE_READ_LAG_CHECK_SECONDS, which should stay below the maximum lag.
+DATABASE_READ_URL = get_env("DATABASE_READ_URL", "").strip()
+DATABASE_READ_MAX_LAG_SECONDS = get_env_int("DATABASE_READ_MAX_LAG_SECONDS", 10)
+DATABASE_READ_LAG_CHECK_SECONDS = get_env_int("DATABASE_READ_LAG_CHECK_SECONDS", 5)
+
+# Connection pool for file and server databases (in-memory SQLite keeps a single connection).
+DB_POOL_SIZE = get_env_int("DB_POOL_SIZE", 5)
+DB_MAX_OVERFLOW = get_env_int("DB_MAX_OVERFLOW", 10)
+DB_POOL_TIMEOUT_SECONDS = get_env_int("DB_POOL_TIMEOUT_SECONDS", 30)
+DB_POOL_RECYCLE_SECONDS = get_env_int("DB_POOL_RECYCLE_SECONDS", 1800)
+DB_POOL_PRE_PING = get_env_bool("DB_POOL_PRE_PING", True)
+
+# Opt-in profile for single-box SQLite deployments: WAL journaling, synchronous=NORMAL, a larger
+# page cache and mmap window, a busy timeout, and writes funnelled through one connection per engine.
+SQLITE_PERFORMANCE_PROFILE = get_env_bool("SQLITE_PERFORMANCE_PROFILE", False)
+SQLITE_BUSY_TIMEOUT_MS = get_env_int("SQLITE_BUSY_TIMEOUT_MS", 5000)
+SQLITE_CACHE_SIZE_KIB = get_env_int("SQLITE_CACHE_SIZE_KIB", 65536)
+SQLITE_MMAP_SIZE_BYTES = get_env_int("SQLITE_MMAP_SIZE_BYTES", 268435456)
+
+# Adds `Server-Timing: db;dur=<ms>;desc="<n> queries"` to every response. Queries are counted either way.
+SERVER_TIMING_ENABLED = get_env_bool("SERVER_TIMING_ENABLED", True)
+
 JWT_SECRET_KEY = (
     get_env("JWT_SECRET_KEY", "change-me-dev-only")
     if APP_ENV == "development"
@@ -81,6 +125,14 @@ CORS_ALLOW_ORIGINS = get_env_csv(
     "http://localhost:5173,http://127.0.0.1:5173",
 )
 
+MAX_ACTIVE_JOBS_PER_TECHNICIAN = get_env_int("MAX_ACTIVE_JOBS_PER_TECHNICIAN", 2)
+
+BROADCAST_BROKER = get_env("BROADCAST_BROKER", "memory").strip().lower()
+BROADCAST_QUEUE_SIZE = get_env_int("BROADCAST_QUEUE_SIZE", 100)
+BROADCAST_HEARTBEAT_SECONDS = get_env_int("BROADCAST_HEARTBEAT_SECONDS", 15)
+
+GEO_INDEX_TTL_SECONDS = get_env_int("GEO_INDEX_TTL_SECONDS", 300)
+
 COMPANY_LOGO_URL = get_env("COMPANY_LOGO_URL", "")
 COMPANY_NAME = get_env("COMPANY_NAME", "SM2 Dispatch")
 COMPANY_STREET_ADDRESS = get_env("COMPANY_STREET_ADDRESS", "123 Dispatch Ave")
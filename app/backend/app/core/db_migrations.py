@@ -0,0 +1,213 @@
+import hashlib
+import pathlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterable, Optional, Sequence, Tuple
+
+from sqlalchemy import MetaData, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+MIGRATIONS_DIR = pathlib.Path(__file__).resolve().parents[2] / "migrations"
+
+# schema_migrations row holding the fingerprint of the schema the database was last synced to.
+FINGERPRINT_PREFIX = "fingerprint:"
+
+# Columns added to the models after their tables first shipped: (table, column, SQLite DDL).
+LEGACY_SQLITE_COLUMNS: Tuple[Tuple[str, str, str], ...] = (
+    ("technicians", "password", "VARCHAR(255)"),
+    ("technicians", "full_name", "VARCHAR(255)"),
+    ("technicians", "profile_picture_url", "TEXT"),
+    ("technicians", "working_days", "TEXT DEFAULT '[]' NOT NULL"),
+    ("technicians", "working_hours_start", "TIME"),
+    ("technicians", "working_hours_end", "TIME"),
+    ("technicians", "after_hours_enabled", "BOOLEAN DEFAULT 0 NOT NULL"),
+    ("technicians", "updated_by", "CHAR(32)"),
+    ("technicians", "active_jobs", "INTEGER DEFAULT 0 NOT NULL"),
+    ("technicians", "profile_version", "INTEGER DEFAULT 0 NOT NULL"),
+    ("technicians", "postal_code", "VARCHAR(32)"),
+    ("technicians", "latitude", "FLOAT"),
+    ("technicians", "longitude", "FLOAT"),
+    ("technician_working_hours", "updated_at", "DATETIME"),
+    ("technician_time_off", "updated_at", "DATETIME"),
+    ("jobs", "dealership_id", "CHAR(32)"),
+    ("jobs", "customer_name", "VARCHAR(255)"),
+    ("jobs", "customer_address", "TEXT"),
+    ("jobs", "customer_city", "VARCHAR(128)"),
+    ("jobs", "customer_state", "VARCHAR(128)"),
+    ("jobs", "customer_zip_code", "VARCHAR(32)"),
+    ("jobs", "ship_to_name", "VARCHAR(255)"),
+    ("jobs", "ship_to_address", "TEXT"),
+    ("jobs", "ship_to_city", "VARCHAR(128)"),
+    ("jobs", "ship_to_state", "VARCHAR(128)"),
+    ("jobs", "ship_to_zip_code", "VARCHAR(32)"),
+    ("jobs", "service_type", "VARCHAR(255)"),
+    ("jobs", "hours_worked", "NUMERIC(10,2)"),
+    ("jobs", "rate", "NUMERIC(12,2)"),
+    ("jobs", "location", "TEXT"),
+    ("jobs", "vehicle", "VARCHAR(255)"),
+    ("jobs", "tax_code", "VARCHAR(32)"),
+    ("jobs", "tax_rate", "NUMERIC(8,5)"),
+    ("jobs", "completed_at", "DATETIME"),
+    ("jobs", "invoice_id", "CHAR(32)"),
+    ("jobs", "version", "INTEGER DEFAULT 0 NOT NULL"),
+    ("jobs", "latitude", "FLOAT"),
+    ("jobs", "longitude", "FLOAT"),
+    ("dealerships", "latitude", "FLOAT"),
+    ("dealerships", "longitude", "FLOAT"),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    filename: str
+    seed: bool = False
+    # Added to existing SQLite tables during the schema sync, before any pending SQL runs.
+    sqlite_columns: Tuple[Tuple[str, str, str], ...] = ()
+
+
+MIGRATIONS: list[Migration] = [
+    Migration("001_technician_module.sql"),
+    Migration("002_admin_technician_profile.sql"),
+    Migration("003_technician.sql", seed=True),
+    Migration("004_dealerships.sql"),
+    Migration("005_normalize_zone_names.sql"),
+    Migration("006_technician_signup_requests.sql"),
+    Migration("007_invoices.sql"),
+    Migration("008_dispatch_job_invoice_fields.sql"),
+    Migration("009_technician_profile_email_change_requests.sql"),
+    Migration("010_technician_time_off_range_index.sql"),
+    Migration("011_technician_active_jobs_counter.sql"),
+    Migration("012_job_candidates.sql"),
+    Migration("013_technician_job_feed_indexes.sql"),
+    Migration("014_technician_sync_timestamps.sql"),
+    Migration("015_hot_path_indexes.sql"),
+    Migration("016_case_insensitive_lookup_indexes.sql"),
+    Migration("017_legacy_sqlite_columns.sql", sqlite_columns=LEGACY_SQLITE_COLUMNS),
+]
+
+
+def schema_fingerprint(metadata: MetaData) -> str:
+    """Hash of the model tables, columns and indexes plus the migration list.
+
+    Any model or migration change alters it, so a stored match means nothing is pending.
+    """
+    digest = hashlib.sha256()
+    for table in sorted(metadata.tables.values(), key=lambda item: item.name):
+        digest.update(f"table {table.name}\n".encode())
+        for column in table.columns:
+            digest.update(f"column {column.name} {column.type!r} {column.nullable}\n".encode())
+        for index_name in sorted(index.name for index in table.indexes):
+            digest.update(f"index {index_name}\n".encode())
+    for migration in MIGRATIONS:
+        digest.update(f"migration {migration.filename}\n".encode())
+    return digest.hexdigest()
+
+
+def ensure_migration_table(conn: Connection) -> None:
+    conn.execute(
+        text(
+            """
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version TEXT PRIMARY KEY,
+                applied_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+    )
+
+
+def load_applied_versions(conn: Connection) -> set[str]:
+    rows = conn.execute(text("SELECT version FROM schema_migrations")).all()
+    return {row[0] for row in rows}
+
+
+def mark_versions_applied(conn: Connection, versions: Iterable[str]) -> None:
+    now = datetime.now(timezone.utc).isoformat()
+    for version in versions:
+        conn.execute(
+            text(
+                """
+                INSERT OR IGNORE INTO schema_migrations (version, applied_at)
+                VALUES (:version, :applied_at)
+                """
+            ),
+            {"version": version, "applied_at": now},
+        )
+
+
+def stored_fingerprint(conn: Connection) -> Optional[str]:
+    try:
+        version = conn.execute(
+            text("SELECT version FROM schema_migrations WHERE version LIKE :prefix"),
+            {"prefix": f"{FINGERPRINT_PREFIX}%"},
+        ).scalar()
+    except (OperationalError, ProgrammingError):
+        # No schema_migrations table yet.
+        return None
+    return version[len(FINGERPRINT_PREFIX):] if version else None
+
+
+def record_fingerprint(conn: Connection, fingerprint: str) -> None:
+    conn.execute(
+        text("DELETE FROM schema_migrations WHERE version LIKE :prefix"),
+        {"prefix": f"{FINGERPRINT_PREFIX}%"},
+    )
+    mark_versions_applied(conn, [f"{FINGERPRINT_PREFIX}{fingerprint}"])
+
+
+def read_migration_statements(filename: str) -> list[str]:
+    lines = [
+        line
+        for line in (MIGRATIONS_DIR / filename).read_text(encoding="utf-8").splitlines()
+        if not line.strip().startswith("--")
+    ]
+    return [statement.strip() for statement in "\n".join(lines).split(";") if statement.strip()]
+
+
+def apply_migration_sql(conn: Connection, filename: str) -> None:
+    for statement in read_migration_statements(filename):
+        conn.exec_driver_sql(statement)
+
+
+def add_missing_sqlite_columns(conn: Connection, columns: Iterable[Tuple[str, str, str]]) -> None:
+    existing: dict[str, set[str]] = {}
+    for table_name, column_name, ddl in columns:
+        if table_name not in existing:
+            existing[table_name] = {
+                row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info('{table_name}')").fetchall()
+            }
+        if existing[table_name] and column_name not in existing[table_name]:
+            conn.exec_driver_sql(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {ddl}")
+            existing[table_name].add(column_name)
+
+
+def sync_schema(conn: Connection, metadata: MetaData, pending: Sequence[Migration]) -> None:
+    """Create missing tables, then add the columns pending migrations bring to existing tables."""
+    metadata.create_all(bind=conn)
+    if conn.dialect.name == "sqlite":
+        for migration in pending:
+            add_missing_sqlite_columns(conn, migration.sqlite_columns)
+
+
+def ensure_schema_current(engine: Engine, metadata: MetaData) -> bool:
+    """Bring the database up to the models at startup; True when anything had to run.
+
+    A current database costs one fingerprint lookup in ``schema_migrations``. Otherwise
+    tables are created and pending non-seed migrations applied, as ``scripts/migrate.py`` does.
+    """
+    fingerprint = schema_fingerprint(metadata)
+    with engine.connect() as conn:
+        if stored_fingerprint(conn) == fingerprint:
+            return False
+
+    with engine.begin() as conn:
+        ensure_migration_table(conn)
+        applied = load_applied_versions(conn)
+        pending = [m for m in MIGRATIONS if not m.seed and m.filename not in applied]
+        sync_schema(conn, metadata, pending)
+        for migration in pending:
+            apply_migration_sql(conn, migration.filename)
+        mark_versions_applied(conn, [m.filename for m in pending])
+        record_fingerprint(conn, fingerprint)
+    return True
@@ -0,0 +1,178 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+RECENT_CHECKOUT_SAMPLES = 1024
+
+
+class PoolMetrics:
+    """Checkout latency and connection churn for one engine, shared across pool re-creations."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._recent_waits: deque = deque(maxlen=RECENT_CHECKOUT_SAMPLES)
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.connections_opened = 0
+        self.connections_invalidated = 0
+        self.peak_in_use = 0
+
+    def record_checkout(self, waited: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+            self._recent_waits.append(waited)
+
+    def record_timeout(self, waited: float) -> None:
+        with self._lock:
+            self.checkout_timeouts += 1
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def record_connection_opened(self) -> None:
+        with self._lock:
+            self.connections_opened += 1
+
+    def record_invalidation(self) -> None:
+        with self._lock:
+            self.connections_invalidated += 1
+
+    def record_in_use(self, in_use: int) -> None:
+        with self._lock:
+            self.peak_in_use = max(self.peak_in_use, in_use)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            recent = sorted(self._recent_waits)
+            return {
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.checkout_timeouts,
+                "connections_opened": self.connections_opened,
+                "connections_invalidated": self.connections_invalidated,
+                "peak_in_use": self.peak_in_use,
+                "wait_ms_avg": self.total_wait_seconds / self.checkouts * 1000 if self.checkouts else 0.0,
+                "wait_ms_p50": recent[len(recent) // 2] * 1000 if recent else 0.0,
+                "wait_ms_p95": recent[min(len(recent) - 1, int(len(recent) * 0.95))] * 1000 if recent else 0.0,
+                "wait_ms_max": self.max_wait_seconds * 1000,
+            }
+
+
+class _CheckoutTimingMixin:
+    """Times every checkout, including the wait for a free slot and pre-ping."""
+
+    def __init__(self, *args, metrics: Optional[PoolMetrics] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = metrics or PoolMetrics()
+
+    def recreate(self):
+        # dispose() and disconnect handling swap in a fresh pool; the counters carry over.
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.metrics.record_timeout(time.perf_counter() - started)
+            raise
+        self.metrics.record_checkout(time.perf_counter() - started)
+        return connection
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def is_memory_sqlite(database_url: str) -> bool:
+    scheme, _, path = database_url.partition("://")
+    return scheme.split("+", 1)[0] == "sqlite" and (path in ("", "/:memory:") or "mode=memory" in path)
+
+
+def async_database_url(database_url: str) -> str:
+    """The same database through its asyncio driver: aiosqlite for SQLite, asyncpg for PostgreSQL."""
+    scheme, separator, rest = database_url.partition("://")
+    dialect = scheme.split("+", 1)[0]
+    if dialect == "sqlite":
+        return f"sqlite+aiosqlite{separator}{rest}"
+    if dialect in ("postgresql", "postgres"):
+        return f"postgresql+asyncpg{separator}{rest}"
+    return database_url
+
+
+def engine_options(database_url: str, *, asynchronous: bool = False) -> Dict[str, Any]:
+    """create_engine() / create_async_engine() keyword arguments for the configured pool settings."""
+    # Settings are read here, not at import: loading config pins DATABASE_URL, and the pool
+    # helpers are imported by tests and scripts that choose their own database first.
+    from .config import (
+        DB_MAX_OVERFLOW,
+        DB_POOL_PRE_PING,
+        DB_POOL_RECYCLE_SECONDS,
+        DB_POOL_SIZE,
+        DB_POOL_TIMEOUT_SECONDS,
+    )
+
+    is_sqlite = database_url.startswith("sqlite")
+    options: Dict[str, Any] = {
+        "connect_args": {"check_same_thread": False} if is_sqlite else {},
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+    if is_memory_sqlite(database_url):
+        # In-memory databases live in one connection; keep SQLAlchemy's single-connection pool.
+        return options
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool if asynchronous else InstrumentedQueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=DB_POOL_RECYCLE_SECONDS,
+    )
+    return options
+
+
+def instrument_engine(engine: Engine) -> None:
+    metrics = getattr(engine.pool, "metrics", None)
+    if metrics is None:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _connection_opened(_dbapi_connection, _record) -> None:
+        metrics.record_connection_opened()
+
+    @event.listens_for(engine, "checkout")
+    def _checked_out(_dbapi_connection, _record, _proxy) -> None:
+        metrics.record_in_use(engine.pool.checkedout())
+
+    @event.listens_for(engine, "invalidate")
+    def _invalidated(_dbapi_connection, _record, _exception) -> None:
+        metrics.record_invalidation()
+
+
+def pool_status(name: str, engine: Engine) -> Dict[str, Any]:
+    pool = engine.pool
+    status: Dict[str, Any] = {"name": name, "pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            timeout_seconds=pool.timeout(),
+            checked_in=pool.checkedin(),
+            in_use=pool.checkedout(),
+            overflow_in_use=max(pool.overflow(), 0),
+        )
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status.update(metrics.snapshot())
+    return status
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import create_engine, insert, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from ..models.replication_heartbeat import ReplicationHeartbeat
+from .db_pool import async_database_url, engine_options, instrument_engine
+from .query_stats import uncounted
+
+READ_REPLICA_SESSION_KEY = "read_replica"
+
+
+def is_replica_session(session: Session) -> bool:
+    """True for sessions bound to the read replica, which must not be committed to."""
+    return bool(session.info.get(READ_REPLICA_SESSION_KEY))
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    # SQLite hands timezone-aware columns back naive.
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class ReadReplica:
+    """Engines for ``DATABASE_READ_URL`` plus the lag check that decides whether reads may use them.
+
+    Every ``check_interval_seconds`` the primary's heartbeat row is stamped (when older than the
+    interval) and compared with the replica's copy. Lag is therefore over-reported by up to one
+    interval, so ``max_lag_seconds`` should exceed it. Between checks the last decision is reused.
+    """
+
+    def __init__(
+        self,
+        primary: Engine,
+        database_url: str,
+        *,
+        max_lag_seconds: float,
+        check_interval_seconds: float,
+    ):
+        self.primary = primary
+        self.engine = create_engine(database_url, **engine_options(database_url))
+        instrument_engine(self.engine)
+        async_url = async_database_url(database_url)
+        self.async_engine = create_async_engine(async_url, **engine_options(async_url, asynchronous=True))
+        instrument_engine(self.async_engine.sync_engine)
+        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self.AsyncSessionLocal = async_sessionmaker(self.async_engine, autoflush=False)
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.lag_seconds: Optional[float] = None
+        self._lock = threading.Lock()
+        self._current = False
+        self._next_check = 0.0
+
+    def measure_lag(self) -> Optional[float]:
+        """Seconds the replica trails the primary, or None when the replica cannot be read."""
+        table = ReplicationHeartbeat.__table__
+        now = datetime.now(timezone.utc)
+        current_beat = select(table.c.beat_at).where(table.c.id == 1)
+        try:
+            with self.primary.begin() as connection:
+                primary_beat = _as_utc(connection.execute(current_beat).scalar())
+                if primary_beat is None or (now - primary_beat).total_seconds() >= self.check_interval_seconds:
+                    stamped = connection.execute(update(table).where(table.c.id == 1).values(beat_at=now))
+                    if stamped.rowcount == 0:
+                        connection.execute(insert(table).values(id=1, beat_at=now))
+                    primary_beat = now
+            with self.engine.connect() as connection:
+                replica_beat = _as_utc(connection.execute(current_beat).scalar())
+        except SQLAlchemyError:
+            # Includes another worker inserting the first heartbeat; the next check retries.
+            return None
+        if replica_beat is None:
+            return None
+        return max(0.0, (primary_beat - replica_beat).total_seconds())
+
+    def cached(self) -> Optional[bool]:
+        """The last decision while it is still fresh, otherwise None."""
+        with self._lock:
+            return self._current if time.monotonic() < self._next_check else None
+
+    def is_current(self) -> bool:
+        with self._lock:
+            if time.monotonic() < self._next_check:
+                return self._current
+            # Claim the check so concurrent requests keep the previous decision meanwhile.
+            self._next_check = time.monotonic() + self.check_interval_seconds
+        with uncounted():
+            lag = self.measure_lag()
+        with self._lock:
+            self.lag_seconds = lag
+            self._current = lag is not None and lag <= self.max_lag_seconds
+            return self._current
+
+    async def is_current_async(self) -> bool:
+        cached = self.cached()
+        if cached is not None:
+            return cached
+        return await asyncio.to_thread(self.is_current)
+
+    def mark_unavailable(self) -> None:
+        """Send reads to the primary until the next check, e.g. after the replica failed a query."""
+        with self._lock:
+            self._current = False
+            self.lag_seconds = None
+            self._next_check = time.monotonic() + self.check_interval_seconds
@@ -0,0 +1,125 @@
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as WriteGateTimeoutError
+from sqlalchemy.orm import Session, SessionTransaction
+from sqlalchemy.sql.elements import TextClause
+from sqlalchemy.util import await_only
+
+from .config import SQLITE_BUSY_TIMEOUT_MS, SQLITE_CACHE_SIZE_KIB, SQLITE_MMAP_SIZE_BYTES
+
+WRITE_STATEMENTS = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+# How often an async session waiting for the write gate looks again; the event loop keeps running meanwhile.
+WRITE_GATE_POLL_SECONDS = 0.002
+
+
+def sqlite_pragmas(performance_profile: bool) -> List[str]:
+    pragmas = ["PRAGMA foreign_keys=ON"]
+    if performance_profile:
+        pragmas += [
+            # Readers keep reading the last committed snapshot while a write is in progress.
+            "PRAGMA journal_mode=WAL",
+            # Under WAL, NORMAL fsyncs at checkpoints only: a power cut can lose the latest commits, not corrupt.
+            "PRAGMA synchronous=NORMAL",
+            f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}",
+            # A negative cache_size is in KiB rather than pages.
+            f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KIB}",
+            f"PRAGMA mmap_size={SQLITE_MMAP_SIZE_BYTES}",
+        ]
+    return pragmas
+
+
+def configure_sqlite_connections(engine: Engine, performance_profile: bool) -> None:
+    pragmas = sqlite_pragmas(performance_profile)
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, _record) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+def writer_engine_options(options: Dict[str, Any]) -> Dict[str, Any]:
+    """Pool options for the write queue: one connection, other writers wait up to ``pool_timeout`` for it."""
+    return {**options, "pool_size": 1, "max_overflow": 0}
+
+
+def _is_write(clause: Any) -> bool:
+    if isinstance(clause, TextClause):
+        return str(clause).lstrip()[:7].upper().startswith(WRITE_STATEMENTS)
+    return bool(getattr(clause, "is_dml", False))
+
+
+class WriteGate:
+    """One write transaction at a time per process, shared by sync and async sessions.
+
+    The sync and async engines each have their own writer connection, so their pools alone would
+    let one sync and one async write run together. Sync sessions block on the lock in their worker
+    thread. Async sessions poll it and sleep in between, so a waiting request never blocks the
+    event loop that the current holder may need in order to commit.
+    """
+
+    def __init__(self, timeout_seconds: float) -> None:
+        self.timeout_seconds = timeout_seconds
+        self._lock = threading.Lock()
+
+    def acquire(self, *, asynchronous: bool) -> None:
+        if not asynchronous:
+            if not self._lock.acquire(timeout=self.timeout_seconds):
+                raise WriteGateTimeoutError(f"SQLite write gate not acquired within {self.timeout_seconds}s")
+            return
+        deadline = time.monotonic() + self.timeout_seconds
+        while not self._lock.acquire(blocking=False):
+            if time.monotonic() >= deadline:
+                raise WriteGateTimeoutError(f"SQLite write gate not acquired within {self.timeout_seconds}s")
+            await_only(asyncio.sleep(WRITE_GATE_POLL_SECONDS))
+
+    def release(self) -> None:
+        self._lock.release()
+
+
+class SerializedWriteSession(Session):
+    """Session whose transaction moves to the ``writer`` engine at its first write.
+
+    Reads before that use the regular pool and never queue behind writers. From the first flush or
+    INSERT/UPDATE/DELETE until commit or rollback, the transaction holds ``write_gate`` and the
+    writer's connection, so concurrent writers in this process, sync or async, wait their turn
+    instead of failing with "database is locked". Without a writer it behaves like a plain ``Session``.
+    """
+
+    def __init__(self, *args, writer: Optional[Engine] = None, write_gate: Optional[WriteGate] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.writer = writer
+        self.write_gate = write_gate
+        self._writing = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.writer is not None and (self._writing or self._flushing or _is_write(clause)):
+            if not self._writing and self.write_gate is not None:
+                self.write_gate.acquire(asynchronous=self.writer.dialect.is_async)
+            self._writing = True
+            return self.writer
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+    def close(self) -> None:
+        super().close()
+        # Normally released when the transaction ends; this covers a write bind that never began one.
+        _release_write_gate(self)
+
+
+def _release_write_gate(session: SerializedWriteSession) -> None:
+    if session._writing:
+        session._writing = False
+        if session.write_gate is not None:
+            session.write_gate.release()
+
+
+@event.listens_for(SerializedWriteSession, "after_transaction_end")
+def _release_writer(session: SerializedWriteSession, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        _release_write_gate(session)
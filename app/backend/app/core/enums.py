@@ -16,6 +16,15 @@ class DealershipStatus(str, Enum):
     INACTIVE = "inactive"
 
 
+class JobStatus(str, Enum):
+    READY_FOR_TECH_ACCEPTANCE = "READY_FOR_TECH_ACCEPTANCE"
+    ASSIGNED = "ASSIGNED"
+    IN_PROGRESS = "IN_PROGRESS"
+    DELAYED = "DELAYED"
+    COMPLETED = "COMPLETED"
+    CANCELLED = "CANCELLED"
+
+
 class TimeOffEntryType(str, Enum):
     FULL_DAY = "full_day"
     MULTI_DAY = "multi_day"
@@ -0,0 +1,39 @@
+from typing import Any, Optional, Type, TypeVar
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import ORMExecuteState, Session
+
+IDENTITY_CACHE_KEY = "identity_cache"
+
+T = TypeVar("T")
+
+
+def get_cached(db: Session, entity: Type[T], ident: Any, **kwargs: Any) -> Optional[T]:
+    """``Session.get`` that keeps the result alive for the rest of the session.
+
+    The identity map only holds weak references, so without the pin an entity one service
+    dropped would be loaded again by the next service in the same request.
+    """
+    instance = db.get(entity, ident, **kwargs)
+    if instance is not None:
+        db.info.setdefault(IDENTITY_CACHE_KEY, {})[(entity, ident)] = instance
+    return instance
+
+
+def expire_bulk_write_targets(orm_execute_state: ORMExecuteState) -> None:
+    """Keep the session's identity map usable as a request-scoped cache across bulk writes.
+
+    Every request gets its own session, and repositories look entities up by id with
+    ``get_cached``, which answers repeats from the identity map keyed by (entity class, id).
+    UPDATE and DELETE statements bypass that map, so instances of the entity they target are
+    expired here and reload on next access. Instances with unflushed changes are left alone.
+    """
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None:
+        return
+    session = orm_execute_state.session
+    for instance in list(session.identity_map.values()):
+        if isinstance(instance, mapper.class_) and not inspect(instance).modified:
+            session.expire(instance)
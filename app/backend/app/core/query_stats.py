@@ -0,0 +1,143 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+QUERY_START_KEY = "query_stats_started"
+
+
+@dataclass
+class QueryStats:
+    """SQL statements run and time spent in the driver while serving one request."""
+
+    count: int = 0
+    duration_seconds: float = 0.0
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.duration_seconds * 1000:.1f};desc="{self.count} queries"'
+
+
+@dataclass(frozen=True)
+class RequestQueryStats:
+    method: str
+    route: str
+    status_code: int
+    count: int
+    duration_seconds: float
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+_recorders: List[List[RequestQueryStats]] = []
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+@contextmanager
+def record_requests() -> Iterator[List[RequestQueryStats]]:
+    """Collect the query stats of every request served inside the block (used by the test suite)."""
+    recorded: List[RequestQueryStats] = []
+    _recorders.append(recorded)
+    try:
+        yield recorded
+    finally:
+        _recorders.remove(recorded)
+
+
+@contextmanager
+def uncounted() -> Iterator[None]:
+    """Leave the statements run inside the block out of the current request's stats.
+
+    For infrastructure work that only some requests pay for, such as the read replica's lag
+    check, so a request's count does not depend on when the check last ran.
+    """
+    token = _current_stats.set(None)
+    try:
+        yield
+    finally:
+        _current_stats.reset(token)
+
+
+# Listening on the Engine class covers every engine, including the sync side of async engines.
+# Threadpool endpoints and greenlet-adapted async drivers both run inside the request's context,
+# so statements outside a request (startup, scripts, tests seeding data) are simply not counted.
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault(QUERY_START_KEY, []).append(time.perf_counter())
+
+
+def _count_statement(conn) -> None:
+    started = conn.info.get(QUERY_START_KEY)
+    if not started:
+        return
+    duration = time.perf_counter() - started.pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration_seconds += duration
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany):
+    _count_statement(conn)
+
+
+# A statement that raises (an IntegrityError answered with 409, a lock timeout) skips
+# after_cursor_execute. Count it here so its start time does not stay on the pooled connection.
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    if exception_context.connection is not None:
+        _count_statement(exception_context.connection)
+
+
+class QueryStatsMiddleware:
+    """Counts SQL statements per request and reports them in a ``Server-Timing`` header.
+
+    The header is written when the response starts, so it covers everything the endpoint ran
+    but not statements issued later by background tasks or while a stream is being sent.
+    """
+
+    def __init__(self, app: ASGIApp, server_timing: bool = True) -> None:
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        status_code = 500
+
+        async def send_with_server_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    MutableHeaders(scope=message).append("Server-Timing", stats.server_timing())
+            await send(message)
+
+        token = _current_stats.set(stats)
+        try:
+            await self.app(scope, receive, send_with_server_timing)
+        finally:
+            _current_stats.reset(token)
+            if _recorders:
+                route = scope.get("route")
+                entry = RequestQueryStats(
+                    method=scope["method"],
+                    route=getattr(route, "path", scope["path"]),
+                    status_code=status_code,
+                    count=stats.count,
+                    duration_seconds=stats.duration_seconds,
+                )
+                for recorded in _recorders:
+                    recorded.append(entry)
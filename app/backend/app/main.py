@@ -1,11 +1,13 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from sqlalchemy.exc import OperationalError
 
 from .api.endpoints import (
     admin_dealerships,
     admin_email_change_requests,
+    admin_metrics,
     admin_reports,
     admin_settings,
     admin_technicians,
@@ -15,7 +17,8 @@ from .api.endpoints import (
     technician_profile,
     technician_time_off,
 )
-from .core.config import CORS_ALLOW_ORIGINS
+from .core.config import CORS_ALLOW_ORIGINS, SERVER_TIMING_ENABLED
+from .core.query_stats import QueryStatsMiddleware
 
 app = FastAPI(
     title="SM2 Dispatch Technician API",
@@ -30,12 +33,17 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Event streams are excluded by Starlette, so SSE keeps flushing per event.
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Outermost, so the query count covers everything the app runs for the request.
+app.add_middleware(QueryStatsMiddleware, server_timing=SERVER_TIMING_ENABLED)
 
 app.include_router(admin_technicians.router)
 app.include_router(admin_dealerships.router)
 app.include_router(admin_email_change_requests.router)
 app.include_router(admin_reports.router)
 app.include_router(admin_settings.router)
+app.include_router(admin_metrics.router)
 app.include_router(technician_profile.router)
 app.include_router(technician_time_off.router)
 app.include_router(auth.router)
@@ -1,9 +1,12 @@
 from .audit_log import AuditLog
 from .dealership import Dealership
+from .geocode import PostalCodeGeocode
 from .invoice import Invoice, InvoiceLineItem
 from .invoice_branding_settings import InvoiceBrandingSettings
 from .job import Job
+from .job_candidate import job_candidates
 from .job_rejection import JobRejection
+from .replication_heartbeat import ReplicationHeartbeat
 from .skill import Skill, technician_skills
 from .signup_request import SignupRequest
 from .technician import Technician
@@ -1,6 +1,6 @@
 from uuid import uuid4
 
-from sqlalchemy import CheckConstraint, Column, DateTime, JSON, String, Uuid
+from sqlalchemy import CheckConstraint, Column, DateTime, Index, JSON, String, Uuid
 from sqlalchemy.sql import func
 
 from .base import Base
@@ -20,4 +20,5 @@ class AuditLog(Base):
 
     __table_args__ = (
         CheckConstraint("actor_role IN ('admin','technician')", name="audit_logs_actor_role_chk"),
+        Index("ix_audit_logs_entity", "entity_type", "entity_id", "created_at"),
     )
@@ -1,9 +1,10 @@
 from uuid import uuid4
 
-from sqlalchemy import CheckConstraint, Column, DateTime, String, Text, Uuid, text
+from sqlalchemy import CheckConstraint, Column, DateTime, Float, String, Text, Uuid, text
 from sqlalchemy.sql import func
 
 from .base import Base
+from .geocode import geocode_on_flush
 
 
 class Dealership(Base):
@@ -17,6 +18,8 @@ class Dealership(Base):
     address = Column(Text, nullable=True)
     city = Column(String(128), nullable=True)
     postal_code = Column(String(32), nullable=True)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
     status = Column(String(16), nullable=False, server_default=text("'active'"))
     notes = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -25,3 +28,6 @@ class Dealership(Base):
     __table_args__ = (
         CheckConstraint("status IN ('active', 'inactive')", name="dealerships_status_chk"),
     )
+
+
+geocode_on_flush(Dealership, ["postal_code"])
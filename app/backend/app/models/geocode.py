@@ -0,0 +1,84 @@
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+from sqlalchemy import Column, Float, String, event, inspect, select
+
+from .base import Base
+
+Coordinates = Tuple[float, float]
+
+
+class PostalCodeGeocode(Base):
+    """Offline postal code centroids, loaded by scripts/geocode_locations.py; no geocoding service is called."""
+
+    __tablename__ = "postal_code_geocodes"
+
+    postal_code = Column(String(16), primary_key=True)
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
+    city = Column(String(128), nullable=True)
+
+
+def normalize_postal_code(value: Any) -> Optional[str]:
+    normalized = "".join(char for char in str(value or "").upper() if char.isalnum())
+    return normalized or None
+
+
+def _lookup_keys(postal_code: str) -> Tuple[str, ...]:
+    # Exact code first, then the ZIP5 and the FSA / ZIP3 centroids when only those are loaded.
+    return tuple(dict.fromkeys((postal_code, postal_code[:5], postal_code[:3])))
+
+
+def resolve_postal_codes(connection, values: Iterable[Any]) -> Dict[str, Coordinates]:
+    """Map normalized postal codes to coordinates with one query, keeping the most specific match."""
+    postal_codes = {code for code in (normalize_postal_code(value) for value in values) if code is not None}
+    keys = sorted({key for code in postal_codes for key in _lookup_keys(code)})
+    if not keys:
+        return {}
+    table = PostalCodeGeocode.__table__
+    found = {
+        row.postal_code: (row.latitude, row.longitude)
+        for row in connection.execute(
+            select(table.c.postal_code, table.c.latitude, table.c.longitude).where(table.c.postal_code.in_(keys))
+        )
+    }
+    resolved: Dict[str, Coordinates] = {}
+    for code in postal_codes:
+        match = next((found[key] for key in _lookup_keys(code) if key in found), None)
+        if match is not None:
+            resolved[code] = match
+    return resolved
+
+
+def geocode_on_flush(
+    model,
+    postal_code_attributes: Sequence[str],
+    *,
+    fallback: Optional[Callable[[Any, Any], Optional[Coordinates]]] = None,
+    trigger_attributes: Sequence[str] = (),
+) -> None:
+    """Fill ``latitude``/``longitude`` from the geocode table whenever the postal codes change.
+
+    Postal codes are tried in order, then ``fallback``. Coordinates assigned explicitly in the
+    same flush win. Bulk UPDATEs bypass this hook; scripts/geocode_locations.py backfills them.
+    """
+    watched = tuple(postal_code_attributes) + tuple(trigger_attributes)
+
+    def assign(connection, target, inserting: bool) -> None:
+        attrs = inspect(target).attrs
+        if attrs.latitude.history.has_changes() or attrs.longitude.history.has_changes():
+            return
+        if inserting:
+            if all(getattr(target, name) is None for name in watched):
+                return
+        elif not any(attrs[name].history.has_changes() for name in watched):
+            return
+
+        codes = [normalize_postal_code(getattr(target, name)) for name in postal_code_attributes]
+        resolved = resolve_postal_codes(connection, codes)
+        coordinates = next((resolved[code] for code in codes if code in resolved), None)
+        if coordinates is None and fallback is not None:
+            coordinates = fallback(connection, target)
+        target.latitude, target.longitude = coordinates or (None, None)
+
+    event.listen(model, "before_insert", lambda _mapper, connection, target: assign(connection, target, True))
+    event.listen(model, "before_update", lambda _mapper, connection, target: assign(connection, target, False))
@@ -6,6 +6,7 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
@@ -80,6 +81,8 @@ class Invoice(Base):
         CheckConstraint("shipping >= 0", name="invoices_shipping_non_negative_chk"),
         CheckConstraint("total >= 0", name="invoices_total_non_negative_chk"),
         CheckConstraint("custom_term_days IS NULL OR custom_term_days >= 0", name="invoices_custom_term_days_chk"),
+        Index("ix_invoices_created_at", "created_at"),
+        Index("ix_invoices_status_due_date", "status", "due_date"),
     )
 
 
@@ -111,4 +114,5 @@ class InvoiceLineItem(Base):
         CheckConstraint("amount >= 0", name="invoice_line_items_amount_non_negative_chk"),
         CheckConstraint("tax_rate >= 0", name="invoice_line_items_tax_rate_non_negative_chk"),
         CheckConstraint("tax_amount >= 0", name="invoice_line_items_tax_amount_non_negative_chk"),
+        Index("ix_invoice_line_items_invoice_id", "invoice_id"),
     )
@@ -1,10 +1,34 @@
+from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, ForeignKey, Numeric, String, Text, Uuid
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    Uuid,
+    event,
+    inspect,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.orm import column_property, object_session, relationship
 from sqlalchemy.sql import func
 
+from ..core.broadcast import queue_broadcast
 from .base import Base
+from .dealership import Dealership
+from .geocode import Coordinates, geocode_on_flush
+from .job_candidate import refresh_candidates_for_job
+from .technician import Technician
+
+ACTIVE_JOB_STATUSES = ("ASSIGNED", "IN_PROGRESS", "DELAYED")
 
 
 class Job(Base):
@@ -12,8 +36,12 @@ class Job(Base):
 
     id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid4)
     job_code = Column(String(50), unique=True, nullable=False)
-    status = Column(String(50), nullable=False)
-    assigned_tech_id = Column(Uuid(as_uuid=True), ForeignKey("technicians.id"), nullable=True)
+    # active_history loads the previous value on assignment so the counter hooks below can diff it.
+    status = column_property(Column(String(50), nullable=False), active_history=True)
+    assigned_tech_id = column_property(
+        Column(Uuid(as_uuid=True), ForeignKey("technicians.id"), nullable=True),
+        active_history=True,
+    )
     skill_id = Column(Uuid(as_uuid=True), ForeignKey("skills.id"), nullable=True)
     zone_id = Column(Uuid(as_uuid=True), ForeignKey("zones.id"), nullable=True)
     dealership_id = Column(Uuid(as_uuid=True), ForeignKey("dealerships.id"), nullable=True)
@@ -31,6 +59,8 @@ class Job(Base):
     hours_worked = Column(Numeric(10, 2), nullable=True)
     rate = Column(Numeric(12, 2), nullable=True)
     location = Column(Text, nullable=True)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
     vehicle = Column(String(255), nullable=True)
     tax_code = Column(String(32), nullable=True)
     tax_rate = Column(Numeric(8, 5), nullable=True)
@@ -38,5 +68,117 @@ class Job(Base):
     invoice_id = Column(Uuid(as_uuid=True), ForeignKey("invoices.id"), nullable=True)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+    version = Column(Integer, nullable=False, default=0, server_default=text("0"))
 
     invoice = relationship("Invoice", back_populates="jobs")
+
+    __table_args__ = (
+        Index("ix_jobs_status_created_at", "status", "created_at", "id"),
+        Index("ix_jobs_created_at", "created_at"),
+        Index("ix_jobs_assigned_tech_status", "assigned_tech_id", "status"),
+        Index("ix_jobs_invoice_created_at", "invoice_id", "created_at"),
+        Index("ix_jobs_dealership_id", "dealership_id"),
+    )
+    __mapper_args__ = {"version_id_col": version}
+
+
+def is_active_job_status(value) -> bool:
+    return str(value or "").strip().upper() in ACTIVE_JOB_STATUSES
+
+
+# Technician.active_jobs is maintained from ORM flushes in the same transaction as the job write.
+# Bulk query.update()/raw SQL bypass these hooks; scripts/reconcile_active_jobs.py repairs drift.
+def _adjust_active_jobs(connection, technician_id, delta: int) -> None:
+    connection.execute(
+        update(Technician.__table__)
+        .where(Technician.__table__.c.id == technician_id)
+        .values(active_jobs=Technician.__table__.c.active_jobs + delta)
+    )
+
+
+def _previous_value(target: Job, attribute: str):
+    history = inspect(target).attrs[attribute].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(target, attribute)
+
+
+def broadcast_payload(target: Job) -> dict:
+    return {
+        "job_id": str(target.id),
+        "job_code": target.job_code,
+        "status": target.status,
+        "zone_id": str(target.zone_id) if target.zone_id else None,
+        "skill_id": str(target.skill_id) if target.skill_id else None,
+        "assigned_tech_id": str(target.assigned_tech_id) if target.assigned_tech_id else None,
+    }
+
+
+def _refresh_candidates(connection, target: Job) -> None:
+    candidate_ids = refresh_candidates_for_job(
+        connection,
+        job_id=target.id,
+        status=target.status,
+        zone_id=target.zone_id,
+        skill_id=target.skill_id,
+    )
+    queue_broadcast(object_session(target), "job.available", candidate_ids, broadcast_payload(target))
+
+
+@event.listens_for(Job, "after_insert")
+def _count_inserted_job(_mapper, connection, target: Job) -> None:
+    if target.assigned_tech_id is not None and is_active_job_status(target.status):
+        _adjust_active_jobs(connection, target.assigned_tech_id, 1)
+    _refresh_candidates(connection, target)
+
+
+@event.listens_for(Job, "after_update")
+def _count_updated_job(_mapper, connection, target: Job) -> None:
+    state = inspect(target)
+    if any(state.attrs[name].history.has_changes() for name in ("status", "zone_id", "skill_id")):
+        _refresh_candidates(connection, target)
+
+    previous_tech_id = _previous_value(target, "assigned_tech_id")
+    previous_active = previous_tech_id is not None and is_active_job_status(_previous_value(target, "status"))
+    current_active = target.assigned_tech_id is not None and is_active_job_status(target.status)
+    if previous_tech_id is not None and previous_tech_id != target.assigned_tech_id:
+        queue_broadcast(
+            object_session(target),
+            "job.reassigned",
+            [previous_tech_id, target.assigned_tech_id],
+            broadcast_payload(target),
+        )
+    if previous_tech_id == target.assigned_tech_id and previous_active == current_active:
+        return
+    if previous_active:
+        _adjust_active_jobs(connection, previous_tech_id, -1)
+    if current_active:
+        _adjust_active_jobs(connection, target.assigned_tech_id, 1)
+
+
+@event.listens_for(Job, "after_delete")
+def _count_deleted_job(_mapper, connection, target: Job) -> None:
+    previous_tech_id = _previous_value(target, "assigned_tech_id")
+    if previous_tech_id is not None and is_active_job_status(_previous_value(target, "status")):
+        _adjust_active_jobs(connection, previous_tech_id, -1)
+
+
+def _dealership_coordinates(connection, target: Job) -> Optional[Coordinates]:
+    if target.dealership_id is None:
+        return None
+    dealerships = Dealership.__table__
+    row = connection.execute(
+        select(dealerships.c.latitude, dealerships.c.longitude).where(dealerships.c.id == target.dealership_id)
+    ).first()
+    if row is None or row.latitude is None or row.longitude is None:
+        return None
+    return row.latitude, row.longitude
+
+
+# Service address first, then the billing address, then the dealership the job came from.
+geocode_on_flush(
+    Job,
+    ["ship_to_zip_code", "customer_zip_code"],
+    fallback=_dealership_coordinates,
+    trigger_attributes=["dealership_id"],
+)
@@ -0,0 +1,73 @@
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Table, Uuid, and_, delete, event, exists, insert, literal, select
+from sqlalchemy.sql import func
+
+from .base import Base
+from .job_rejection import JobRejection
+from .skill import technician_skills
+from .technician import Technician
+from .zone import technician_zones
+
+READY_JOB_STATUS = "READY_FOR_TECH_ACCEPTANCE"
+
+# Materialized (job, technician) pairs for broadcast jobs. A row exists while the job is ready for
+# acceptance and the technician is active, manually available, matches the job's zone and skill and
+# has not rejected it. Shift hours and leave depend on the clock, so they are checked at acceptance.
+job_candidates = Table(
+    "job_candidates",
+    Base.metadata,
+    Column("job_id", Uuid(as_uuid=True), ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True),
+    Column("technician_id", Uuid(as_uuid=True), ForeignKey("technicians.id", ondelete="CASCADE"), primary_key=True),
+    Column("created_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+    Index("ix_job_candidates_technician_job", "technician_id", "job_id"),
+)
+
+
+def eligible_technicians_select(zone_id, skill_id, job_id):
+    technicians = Technician.__table__
+    return (
+        select(literal(job_id, type_=job_candidates.c.job_id.type), technicians.c.id)
+        .join(technician_zones, technician_zones.c.technician_id == technicians.c.id)
+        .join(technician_skills, technician_skills.c.technician_id == technicians.c.id)
+        .where(
+            technician_zones.c.zone_id == zone_id,
+            technician_skills.c.skill_id == skill_id,
+            technicians.c.status == "active",
+            technicians.c.manual_availability.is_(True),
+            ~exists().where(
+                and_(
+                    JobRejection.__table__.c.job_id == job_id,
+                    JobRejection.__table__.c.tech_id == technicians.c.id,
+                )
+            ),
+        )
+    )
+
+
+def refresh_candidates_for_job(connection, *, job_id, status, zone_id, skill_id) -> List[UUID]:
+    connection.execute(delete(job_candidates).where(job_candidates.c.job_id == job_id))
+    if str(status or "").strip().upper() != READY_JOB_STATUS or zone_id is None or skill_id is None:
+        return []
+    connection.execute(
+        insert(job_candidates).from_select(
+            ["job_id", "technician_id"],
+            eligible_technicians_select(zone_id, skill_id, job_id),
+        )
+    )
+    return list(
+        connection.execute(
+            select(job_candidates.c.technician_id).where(job_candidates.c.job_id == job_id)
+        ).scalars()
+    )
+
+
+@event.listens_for(JobRejection, "after_insert")
+def _drop_rejected_candidate(_mapper, connection, target: JobRejection) -> None:
+    connection.execute(
+        delete(job_candidates).where(
+            job_candidates.c.job_id == target.job_id,
+            job_candidates.c.technician_id == target.tech_id,
+        )
+    )
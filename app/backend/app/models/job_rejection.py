@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Uuid
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index, Text, Uuid
 from sqlalchemy.orm import relationship
 from .base import Base
 from sqlalchemy.sql import func
@@ -13,3 +13,9 @@ class JobRejection(Base):
 
     technician = relationship("Technician", back_populates="rejections")
     # job = relationship("Job", back_populates="rejections")
+
+    # The primary key leads with job_id; feed anti-joins probe by technician first.
+    __table_args__ = (
+        Index("ux_job_rejections_tech_job", "tech_id", "job_id", unique=True),
+        Index("ix_job_rejections_rejected_at", "rejected_at"),
+    )
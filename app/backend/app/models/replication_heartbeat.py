@@ -0,0 +1,12 @@
+from sqlalchemy import Column, DateTime, Integer
+
+from .base import Base
+
+
+class ReplicationHeartbeat(Base):
+    """Single row stamped on the primary; a replica's copy shows how far behind it is."""
+
+    __tablename__ = "replication_heartbeat"
+
+    id = Column(Integer, primary_key=True, default=1)
+    beat_at = Column(DateTime(timezone=True), nullable=False)
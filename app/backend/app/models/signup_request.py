@@ -1,6 +1,6 @@
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, ForeignKey, String, Text, Uuid, text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String, Text, Uuid, text
 from sqlalchemy.sql import func
 
 from .base import Base
@@ -20,3 +20,5 @@ class SignupRequest(Base):
     approved_technician_id = Column(Uuid(as_uuid=True), ForeignKey("technicians.id"), nullable=True)
     rejection_reason = Column(Text, nullable=True)
 
+
+Index("ix_technician_signup_requests_email_lower", func.lower(SignupRequest.email))
@@ -1,6 +1,6 @@
 from uuid import uuid4
 
-from sqlalchemy import Column, ForeignKey, String, Table, Uuid
+from sqlalchemy import Column, ForeignKey, Index, String, Table, Uuid, func
 from sqlalchemy.orm import relationship
 
 from .base import Base
@@ -20,3 +20,6 @@ class Skill(Base):
     name = Column(String(255), unique=True, nullable=False)
 
     technicians = relationship("Technician", secondary=technician_skills, back_populates="skills")
+
+
+Index("ix_skills_name_lower", func.lower(Skill.name))
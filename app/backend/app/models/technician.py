@@ -1,10 +1,11 @@
 from uuid import uuid4
 
-from sqlalchemy import JSON, Boolean, CheckConstraint, Column, DateTime, String, Text, Time, Uuid, text
+from sqlalchemy import JSON, Boolean, CheckConstraint, Column, DateTime, Float, Index, Integer, String, Text, Time, Uuid, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from .base import Base
+from .geocode import geocode_on_flush
 
 
 class Technician(Base):
@@ -23,6 +24,13 @@ class Technician(Base):
     password = Column(String(255), nullable=True)
     status = Column(String(20), nullable=False, server_default=text("'active'"))
     manual_availability = Column(Boolean, nullable=False, server_default=text("true"))
+    # Home base used for proximity ranking; coordinates are resolved from the postal code on flush.
+    postal_code = Column(String(32), nullable=True)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    active_jobs = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    # Bumped by TechnicianRepository on every write to the technician or its profile rows; keys the profile cache.
+    profile_version = Column(Integer, nullable=False, default=0, server_default=text("0"))
     updated_by = Column(Uuid(as_uuid=True), nullable=True)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
@@ -57,3 +65,9 @@ class Technician(Base):
             name="technicians_working_hours_window_chk",
         ),
     )
+
+
+# Login and admin lookups compare lower(email); the unique index on the raw column cannot serve them.
+Index("ix_technicians_email_lower", func.lower(Technician.email))
+
+geocode_on_flush(Technician, ["postal_code"])
@@ -1,6 +1,6 @@
 from uuid import uuid4
 
-from sqlalchemy import CheckConstraint, Column, Date, DateTime, ForeignKey, String, Text, Uuid, text
+from sqlalchemy import CheckConstraint, Column, Date, DateTime, ForeignKey, Index, String, Text, Uuid, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -22,6 +22,7 @@ class TimeOff(Base):
     reason = Column(Text, nullable=False)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     cancelled_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), nullable=True, default=func.now(), onupdate=func.now())
 
     technician = relationship("Technician", back_populates="time_off")
 
@@ -31,4 +32,11 @@ class TimeOff(Base):
             "entry_type IN ('full_day','multi_day','half_day_morning','half_day_afternoon','break')",
             name="time_off_entry_type_chk",
         ),
+        Index(
+            "ix_technician_time_off_active_range",
+            "technician_id",
+            "cancelled_at",
+            "start_date",
+            "end_date",
+        ),
     )
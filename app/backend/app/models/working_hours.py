@@ -1,7 +1,8 @@
 from uuid import uuid4
 
-from sqlalchemy import Boolean, CheckConstraint, Column, ForeignKey, Integer, Time, UniqueConstraint, Uuid, text
+from sqlalchemy import Boolean, CheckConstraint, Column, DateTime, ForeignKey, Integer, Time, UniqueConstraint, Uuid, text
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 
 from .base import Base
 
@@ -19,6 +20,7 @@ class WorkingHours(Base):
     is_enabled = Column(Boolean, nullable=False, server_default=text("false"))
     start_time = Column(Time, nullable=False)
     end_time = Column(Time, nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=True, default=func.now(), onupdate=func.now())
 
     technician = relationship("Technician", back_populates="working_hours")
 
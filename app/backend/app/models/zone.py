@@ -1,6 +1,6 @@
 from uuid import uuid4
 
-from sqlalchemy import Column, ForeignKey, String, Table, Uuid
+from sqlalchemy import Column, ForeignKey, Index, String, Table, Uuid, func
 from sqlalchemy.orm import relationship
 
 from .base import Base
@@ -20,3 +20,6 @@ class Zone(Base):
     name = Column(String(255), unique=True, nullable=False)
 
     technicians = relationship("Technician", secondary=technician_zones, back_populates="zones")
+
+
+Index("ix_zones_name_lower", func.lower(Zone.name))
@@ -2,8 +2,10 @@ import re
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.orm import Session
 
+from ..core.identity_cache import get_cached
 from ..models.dealership import Dealership
 
 
@@ -18,11 +20,13 @@ class DealershipRepository:
         return self.db.query(Dealership).order_by(Dealership.code.asc()).all()
 
     def get_dealership_by_id(self, dealership_id: UUID) -> Optional[Dealership]:
-        return self.db.query(Dealership).filter(Dealership.id == dealership_id).first()
+        return get_cached(self.db, Dealership, dealership_id)
 
     def get_dealership_by_code(self, code: str) -> Optional[Dealership]:
         normalized = code.strip().upper()
-        return self.db.query(Dealership).filter(Dealership.code == normalized).first()
+        return self.db.execute(
+            lambda_stmt(lambda: select(Dealership).where(Dealership.code == normalized).limit(1))
+        ).scalar_one_or_none()
 
     def generate_next_code(self) -> str:
         max_number = 0
@@ -1,10 +1,11 @@
 import re
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 
-from sqlalchemy import func
+from sqlalchemy import func, lambda_stmt, select
 from sqlalchemy.orm import Session, selectinload
 
+from ..core.identity_cache import get_cached
 from ..models.dealership import Dealership
 from ..models.invoice import Invoice
 from ..models.job import Job
@@ -19,16 +20,13 @@ class InvoiceRepository:
         self.db = db
 
     def get_by_id(self, invoice_id: UUID) -> Optional[Invoice]:
-        return (
-            self.db.query(Invoice)
-            .options(selectinload(Invoice.line_items))
-            .filter(Invoice.id == invoice_id)
-            .first()
-        )
+        return get_cached(self.db, Invoice, invoice_id, options=[selectinload(Invoice.line_items)])
 
     def get_by_number(self, invoice_number: str) -> Optional[Invoice]:
         normalized = invoice_number.strip().upper()
-        return self.db.query(Invoice).filter(Invoice.invoice_number == normalized).first()
+        return self.db.execute(
+            lambda_stmt(lambda: select(Invoice).where(Invoice.invoice_number == normalized).limit(1))
+        ).scalar_one_or_none()
 
     def list(self) -> List[Invoice]:
         return (
@@ -73,7 +71,7 @@ class InvoiceRepository:
         )
 
     def get_dealership_by_id(self, dealership_id: UUID) -> Optional[Dealership]:
-        return self.db.query(Dealership).filter(Dealership.id == dealership_id).first()
+        return get_cached(self.db, Dealership, dealership_id)
 
     def set_jobs_invoice(self, job_ids: Iterable[UUID], invoice_id: Optional[UUID]) -> None:
         ids = list(job_ids)
@@ -100,3 +98,23 @@ class InvoiceRepository:
             .order_by(Job.completed_at.desc(), Job.created_at.desc())
             .all()
         )
+
+    def get_primary_jobs_for_invoices(
+        self, invoice_ids: Iterable[UUID]
+    ) -> Dict[UUID, tuple[Job, Optional[Dealership], Optional[Technician]]]:
+        """Earliest job of each invoice with its dealership and technician, in one query."""
+        ids = list(invoice_ids)
+        if not ids:
+            return {}
+        rows = (
+            self.db.query(Job, Dealership, Technician)
+            .outerjoin(Dealership, Job.dealership_id == Dealership.id)
+            .outerjoin(Technician, Job.assigned_tech_id == Technician.id)
+            .filter(Job.invoice_id.in_(ids))
+            .order_by(Job.created_at.asc())
+            .all()
+        )
+        primary: Dict[UUID, tuple[Job, Optional[Dealership], Optional[Technician]]] = {}
+        for job, dealership, technician in rows:
+            primary.setdefault(job.invoice_id, (job, dealership, technician))
+        return primary
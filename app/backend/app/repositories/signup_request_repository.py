@@ -5,6 +5,7 @@ from uuid import UUID
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from ..core.identity_cache import get_cached
 from ..models.signup_request import SignupRequest
 
 
@@ -13,7 +14,7 @@ class SignupRequestRepository:
         self.db = db
 
     def get_by_id(self, request_id: UUID) -> Optional[SignupRequest]:
-        return self.db.query(SignupRequest).filter(SignupRequest.id == request_id).first()
+        return get_cached(self.db, SignupRequest, request_id)
 
     def get_by_email(self, email: str) -> Optional[SignupRequest]:
         return (
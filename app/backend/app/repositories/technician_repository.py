@@ -1,11 +1,16 @@
-from datetime import date, datetime
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, delete, func, insert, inspect, select, text, update
-from sqlalchemy.orm import Session
+from sqlalchemy import Table, and_, delete, exists, func, insert, inspect, lambda_stmt, or_, select, text, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, aliased, selectinload
 
-from ..models.job import Job
+from ..core.enums import JobStatus, TechnicianStatus
+from ..core.identity_cache import get_cached
+from ..models.job import ACTIVE_JOB_STATUSES, Job
+from ..models.job_candidate import job_candidates, refresh_candidates_for_job
+from ..models.job_rejection import JobRejection
 from ..models.skill import Skill, technician_skills
 from ..models.technician import Technician
 from ..models.technician_email_change_request import TechnicianEmailChangeRequest
@@ -13,6 +18,15 @@ from ..models.time_off import TimeOff
 from ..models.working_hours import WorkingHours
 from ..models.zone import Zone, technician_zones
 
+UNCOMMITTED_PROFILE_WRITES_KEY = "uncommitted_profile_writes"
+# Rows per set-based statement; keeps bound parameters well under SQLite's variable limit.
+BULK_STATEMENT_CHUNK_SIZE = 500
+
+
+def _chunks(items: Sequence[Any], size: int = BULK_STATEMENT_CHUNK_SIZE) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
 
 class TechnicianRepository:
     ACTIVE_ASSIGNMENT_STATUSES = ("ASSIGNED", "IN_PROGRESS", "DELAYED", "assigned", "in_progress", "delayed")
@@ -23,20 +37,55 @@ class TechnicianRepository:
     def list_technicians(self) -> List[Technician]:
         return self.db.query(Technician).order_by(Technician.name.asc()).all()
 
+    def list_technicians_with_assignments(self) -> List[Technician]:
+        return (
+            self.db.query(Technician)
+            .options(selectinload(Technician.zones), selectinload(Technician.skills))
+            .order_by(Technician.name.asc())
+            .all()
+        )
+
+    # By-id lookups go through the session's identity map, so repeats within a request skip the database.
     def get_technician_by_id(self, technician_id: UUID) -> Optional[Technician]:
-        return self.db.query(Technician).filter(Technician.id == technician_id).first()
+        return get_cached(self.db, Technician, technician_id)
 
+    # Other hot lookups are lambda statements: SQLAlchemy builds and caches each one once per call site,
+    # then only binds the closure's values, instead of rebuilding a query chain on every call.
     def get_technician_by_email(self, email: str) -> Optional[Technician]:
-        return self.db.query(Technician).filter(func.lower(Technician.email) == email.lower()).first()
+        normalized = email.lower()
+        return self.db.execute(
+            lambda_stmt(lambda: select(Technician).where(func.lower(Technician.email) == normalized).limit(1))
+        ).scalar_one_or_none()
 
     def email_exists(self, email: str) -> bool:
+        normalized = email.lower()
         return (
-            self.db.query(Technician.id)
-            .filter(func.lower(Technician.email) == email.lower())
-            .first()
+            self.db.execute(
+                lambda_stmt(lambda: select(Technician.id).where(func.lower(Technician.email) == normalized).limit(1))
+            ).first()
             is not None
         )
 
+    def find_existing_emails(self, emails: Iterable[str]) -> Set[str]:
+        found: Set[str] = set()
+        normalized_email = func.lower(Technician.email)
+        for chunk in _chunks(list(dict.fromkeys(email.lower() for email in emails))):
+            found.update(self.db.execute(select(normalized_email).where(normalized_email.in_(chunk))).scalars())
+        return found
+
+    def bulk_create_technicians(self, rows: Sequence[Dict[str, Any]]) -> Set[UUID]:
+        """Insert technician rows (each with an explicit id); rows losing an email race are skipped, not raised."""
+        created: Set[UUID] = set()
+        for chunk in _chunks(list(rows)):
+            statement = (
+                self._insert_ignoring_conflicts(Technician.__table__)
+                .values(list(chunk))
+                .returning(Technician.__table__.c.id)
+            )
+            created.update(self.db.execute(statement).scalars())
+        self.db.flush()
+        return created
+
     def create_technician(
         self,
         *,
@@ -70,9 +119,97 @@ class TechnicianRepository:
             setattr(technician, key, value)
 
         self.db.flush()
+        self.bump_profile_version(technician_id)
         self.db.refresh(technician)
         return technician
 
+    def bulk_update_technician_status(
+        self,
+        status: str,
+        *,
+        technician_ids: Optional[Sequence[UUID]] = None,
+        zone_id: Optional[UUID] = None,
+        skill_id: Optional[UUID] = None,
+        current_status: Optional[str] = None,
+        clear_manual_availability: bool = False,
+    ) -> List[UUID]:
+        """Move every matching technician not already in ``status`` with one UPDATE per ID chunk.
+
+        Returns the IDs that changed. The profile version is bumped in the same statement.
+        """
+        conditions = [Technician.status != status]
+        if current_status is not None:
+            conditions.append(Technician.status == current_status)
+        if zone_id is not None:
+            conditions.append(
+                Technician.id.in_(select(technician_zones.c.technician_id).where(technician_zones.c.zone_id == zone_id))
+            )
+        if skill_id is not None:
+            conditions.append(
+                Technician.id.in_(
+                    select(technician_skills.c.technician_id).where(technician_skills.c.skill_id == skill_id)
+                )
+            )
+        values: Dict[str, Any] = {"status": status, "profile_version": Technician.profile_version + 1}
+        if clear_manual_availability:
+            values["manual_availability"] = False
+
+        id_chunks = _chunks(list(dict.fromkeys(technician_ids))) if technician_ids is not None else [None]
+        updated: List[UUID] = []
+        for chunk in id_chunks:
+            statement = (
+                update(Technician)
+                .where(*conditions)
+                .values(**values)
+                .returning(Technician.id)
+                .execution_options(synchronize_session=False)
+            )
+            if chunk is not None:
+                statement = statement.where(Technician.id.in_(chunk))
+            updated.extend(self.db.execute(statement).scalars())
+        self.db.info.setdefault(UNCOMMITTED_PROFILE_WRITES_KEY, set()).update(updated)
+        return updated
+
+    def get_database_now(self) -> datetime:
+        value = self.db.execute(select(func.now())).scalar_one()
+        return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+    def get_profile_version(self, technician_id: UUID) -> Optional[int]:
+        return self.db.execute(
+            select(Technician.profile_version).where(Technician.id == technician_id)
+        ).scalar_one_or_none()
+
+    def bump_profile_version(self, technician_id: UUID) -> None:
+        self.bump_profile_versions([technician_id])
+
+    def bump_profile_versions(self, technician_ids: Iterable[UUID]) -> None:
+        ids = list(dict.fromkeys(technician_ids))
+        if not ids:
+            return
+        self.db.info.setdefault(UNCOMMITTED_PROFILE_WRITES_KEY, set()).update(ids)
+        for chunk in _chunks(ids):
+            self.db.execute(
+                update(Technician)
+                .where(Technician.id.in_(chunk))
+                .values(profile_version=Technician.profile_version + 1)
+                .execution_options(synchronize_session=False)
+            )
+
+    def get_technician_profile_aggregate(self, technician_id: UUID) -> Optional[Technician]:
+        return (
+            self.db.query(Technician)
+            .options(
+                selectinload(Technician.zones),
+                selectinload(Technician.skills),
+                selectinload(Technician.working_hours),
+                selectinload(Technician.time_off),
+                selectinload(Technician.email_change_requests),
+            )
+            .filter(Technician.id == technician_id)
+            .populate_existing()
+            .first()
+        )
+
     def list_technician_zones(self, technician_id: UUID) -> List[Zone]:
         return (
             self.db.query(Zone)
@@ -98,10 +235,16 @@ class TechnicianRepository:
         return self.db.query(Skill).order_by(Skill.name.asc()).all()
 
     def get_zone_by_name(self, name: str) -> Optional[Zone]:
-        return self.db.query(Zone).filter(func.lower(Zone.name) == name.lower()).first()
+        normalized = name.lower()
+        return self.db.execute(
+            lambda_stmt(lambda: select(Zone).where(func.lower(Zone.name) == normalized).limit(1))
+        ).scalar_one_or_none()
 
     def get_skill_by_name(self, name: str) -> Optional[Skill]:
-        return self.db.query(Skill).filter(func.lower(Skill.name) == name.lower()).first()
+        normalized = name.lower()
+        return self.db.execute(
+            lambda_stmt(lambda: select(Skill).where(func.lower(Skill.name) == normalized).limit(1))
+        ).scalar_one_or_none()
 
     def create_zone(self, name: str) -> Zone:
         zone = Zone(name=name)
@@ -118,10 +261,82 @@ class TechnicianRepository:
         return skill
 
     def zone_exists(self, zone_id: UUID) -> bool:
-        return self.db.query(Zone.id).filter(Zone.id == zone_id).first() is not None
+        return self.db.execute(lambda_stmt(lambda: select(Zone.id).where(Zone.id == zone_id))).first() is not None
 
     def skill_exists(self, skill_id: UUID) -> bool:
-        return self.db.query(Skill.id).filter(Skill.id == skill_id).first() is not None
+        return self.db.execute(lambda_stmt(lambda: select(Skill.id).where(Skill.id == skill_id))).first() is not None
+
+    def find_existing_technician_ids(self, technician_ids: Iterable[UUID]) -> Set[UUID]:
+        return self._find_existing_ids(Technician.id, technician_ids)
+
+    def find_existing_zone_ids(self, zone_ids: Iterable[UUID]) -> Set[UUID]:
+        return self._find_existing_ids(Zone.id, zone_ids)
+
+    def find_existing_skill_ids(self, skill_ids: Iterable[UUID]) -> Set[UUID]:
+        return self._find_existing_ids(Skill.id, skill_ids)
+
+    def _find_existing_ids(self, column, ids: Iterable[UUID]) -> Set[UUID]:
+        found: Set[UUID] = set()
+        for chunk in _chunks(list(dict.fromkeys(ids))):
+            found.update(self.db.execute(select(column).where(column.in_(chunk))).scalars())
+        return found
+
+    def bulk_add_zone_assignments(self, pairs: Sequence[Tuple[UUID, UUID]]) -> Set[Tuple[UUID, UUID]]:
+        return self._bulk_add_assignments(technician_zones, "zone_id", pairs)
+
+    def bulk_remove_zone_assignments(self, pairs: Sequence[Tuple[UUID, UUID]]) -> Set[Tuple[UUID, UUID]]:
+        return self._bulk_remove_assignments(technician_zones, "zone_id", pairs)
+
+    def bulk_add_skill_assignments(self, pairs: Sequence[Tuple[UUID, UUID]]) -> Set[Tuple[UUID, UUID]]:
+        return self._bulk_add_assignments(technician_skills, "skill_id", pairs)
+
+    def bulk_remove_skill_assignments(self, pairs: Sequence[Tuple[UUID, UUID]]) -> Set[Tuple[UUID, UUID]]:
+        return self._bulk_remove_assignments(technician_skills, "skill_id", pairs)
+
+    def _insert_ignoring_conflicts(self, table: Table):
+        dialect_name = self.db.get_bind().dialect.name
+        if dialect_name == "postgresql":
+            return postgresql.insert(table).on_conflict_do_nothing()
+        if dialect_name == "sqlite":
+            return sqlite.insert(table).on_conflict_do_nothing()
+        raise RuntimeError(f"Bulk assignment is not supported on {dialect_name}")
+
+    def _bulk_add_assignments(
+        self,
+        table: Table,
+        target_key: str,
+        pairs: Sequence[Tuple[UUID, UUID]],
+    ) -> Set[Tuple[UUID, UUID]]:
+        """Insert the pairs that are not assigned yet and return exactly those, via RETURNING."""
+        added: Set[Tuple[UUID, UUID]] = set()
+        for chunk in _chunks(list(pairs)):
+            statement = (
+                self._insert_ignoring_conflicts(table)
+                .values([{"technician_id": technician_id, target_key: target_id} for technician_id, target_id in chunk])
+                .returning(table.c.technician_id, table.c[target_key])
+            )
+            added.update((row[0], row[1]) for row in self.db.execute(statement))
+        self.bump_profile_versions(technician_id for technician_id, _ in added)
+        self.db.flush()
+        return added
+
+    def _bulk_remove_assignments(
+        self,
+        table: Table,
+        target_key: str,
+        pairs: Sequence[Tuple[UUID, UUID]],
+    ) -> Set[Tuple[UUID, UUID]]:
+        removed: Set[Tuple[UUID, UUID]] = set()
+        for chunk in _chunks(list(pairs)):
+            statement = (
+                delete(table)
+                .where(tuple_(table.c.technician_id, table.c[target_key]).in_(list(chunk)))
+                .returning(table.c.technician_id, table.c[target_key])
+            )
+            removed.update((row[0], row[1]) for row in self.db.execute(statement))
+        self.bump_profile_versions(technician_id for technician_id, _ in removed)
+        self.db.flush()
+        return removed
 
     def add_zone_assignment(self, technician_id: UUID, zone_id: UUID) -> bool:
         exists = self.db.execute(
@@ -138,6 +353,7 @@ class TechnicianRepository:
         self.db.execute(
             insert(technician_zones).values(technician_id=technician_id, zone_id=zone_id)
         )
+        self.bump_profile_version(technician_id)
         self.db.flush()
         return True
 
@@ -150,6 +366,8 @@ class TechnicianRepository:
                 )
             )
         )
+        if deleted.rowcount > 0:
+            self.bump_profile_version(technician_id)
         self.db.flush()
         return deleted.rowcount > 0
 
@@ -168,6 +386,7 @@ class TechnicianRepository:
         self.db.execute(
             insert(technician_skills).values(technician_id=technician_id, skill_id=skill_id)
         )
+        self.bump_profile_version(technician_id)
         self.db.flush()
         return True
 
@@ -180,66 +399,96 @@ class TechnicianRepository:
                 )
             )
         )
+        if deleted.rowcount > 0:
+            self.bump_profile_version(technician_id)
         self.db.flush()
         return deleted.rowcount > 0
 
-    def list_weekly_schedule(self, technician_id: UUID) -> List[WorkingHours]:
+    def list_weekly_schedule(self, technician_id: UUID, changed_since: Optional[datetime] = None) -> List[WorkingHours]:
+        query = self.db.query(WorkingHours).filter(WorkingHours.technician_id == technician_id)
+        if changed_since is not None:
+            query = query.filter(or_(WorkingHours.updated_at.is_(None), WorkingHours.updated_at >= changed_since))
+        return query.order_by(WorkingHours.day_of_week.asc()).all()
+
+    def list_weekly_schedules_for_technicians(self, technician_ids: Sequence[UUID]) -> List[WorkingHours]:
+        ids = list(technician_ids)
+        if not ids:
+            return []
         return (
             self.db.query(WorkingHours)
-            .filter(WorkingHours.technician_id == technician_id)
-            .order_by(WorkingHours.day_of_week.asc())
+            .filter(WorkingHours.technician_id.in_(ids))
+            .order_by(WorkingHours.technician_id.asc(), WorkingHours.day_of_week.asc())
             .all()
         )
 
     def get_working_hours_for_day(self, technician_id: UUID, day_of_week: int) -> Optional[WorkingHours]:
-        return (
-            self.db.query(WorkingHours)
-            .filter(
-                WorkingHours.technician_id == technician_id,
-                WorkingHours.day_of_week == day_of_week,
+        return self.db.execute(
+            lambda_stmt(
+                lambda: select(WorkingHours)
+                .where(
+                    WorkingHours.technician_id == technician_id,
+                    WorkingHours.day_of_week == day_of_week,
+                )
+                .limit(1)
             )
-            .first()
-        )
+        ).scalar_one_or_none()
 
     def replace_weekly_schedule(self, technician_id: UUID, items: Sequence[Dict[str, Any]]) -> List[WorkingHours]:
-        self.db.query(WorkingHours).filter(WorkingHours.technician_id == technician_id).delete()
-
+        existing = {row.day_of_week: row for row in self.list_weekly_schedule(technician_id)}
+        inserts: List[Dict[str, Any]] = []
+        updates: List[Dict[str, Any]] = []
         for item in items:
-            self.db.add(
-                WorkingHours(
-                    technician_id=technician_id,
-                    day_of_week=item["day_of_week"],
-                    is_enabled=item["is_enabled"],
-                    start_time=item["start_time"],
-                    end_time=item["end_time"],
-                )
-            )
+            values = {
+                "is_enabled": item["is_enabled"],
+                "start_time": item["start_time"],
+                "end_time": item["end_time"],
+            }
+            row = existing.pop(item["day_of_week"], None)
+            if row is None:
+                inserts.append({"technician_id": technician_id, "day_of_week": item["day_of_week"], **values})
+            elif any(getattr(row, key) != value for key, value in values.items()):
+                updates.append({"id": row.id, **values})
+        stale_ids = [row.id for row in existing.values()]
+
+        if stale_ids:
+            self.db.execute(delete(WorkingHours).where(WorkingHours.id.in_(stale_ids)))
+        if updates:
+            self.db.execute(update(WorkingHours), updates)
+        if inserts:
+            self.db.execute(insert(WorkingHours), inserts)
+        if stale_ids or updates or inserts:
+            self.bump_profile_version(technician_id)
 
         self.db.flush()
         return self.list_weekly_schedule(technician_id)
 
-    def list_non_cancelled_time_off(self, technician_id: UUID) -> List[TimeOff]:
-        return (
-            self.db.query(TimeOff)
-            .filter(
-                TimeOff.technician_id == technician_id,
-                TimeOff.cancelled_at.is_(None),
-            )
-            .order_by(TimeOff.start_date.asc(), TimeOff.created_at.asc())
-            .all()
+    def list_non_cancelled_time_off(self, technician_id: UUID, changed_since: Optional[datetime] = None) -> List[TimeOff]:
+        query = self.db.query(TimeOff).filter(
+            TimeOff.technician_id == technician_id,
+            TimeOff.cancelled_at.is_(None),
         )
+        if changed_since is not None:
+            query = query.filter(func.coalesce(TimeOff.updated_at, TimeOff.created_at) >= changed_since)
+        return query.order_by(TimeOff.start_date.asc(), TimeOff.created_at.asc()).all()
 
-    def list_upcoming_time_off(self, technician_id: UUID, from_date: date) -> List[TimeOff]:
-        return (
-            self.db.query(TimeOff)
-            .filter(
-                TimeOff.technician_id == technician_id,
-                TimeOff.cancelled_at.is_(None),
-                TimeOff.end_date >= from_date,
-            )
-            .order_by(TimeOff.start_date.asc(), TimeOff.created_at.asc())
-            .all()
+    def list_active_time_off_for_technicians(
+        self,
+        technician_ids: Sequence[UUID],
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+    ) -> List[TimeOff]:
+        ids = list(technician_ids)
+        if not ids:
+            return []
+        query = self.db.query(TimeOff).filter(
+            TimeOff.technician_id.in_(ids),
+            TimeOff.cancelled_at.is_(None),
         )
+        if from_date is not None:
+            query = query.filter(TimeOff.end_date >= from_date)
+        if to_date is not None:
+            query = query.filter(TimeOff.start_date <= to_date)
+        return query.order_by(TimeOff.technician_id.asc(), TimeOff.start_date.asc()).all()
 
     def get_next_time_off_start(self, technician_id: UUID, from_date: date) -> Optional[date]:
         row = (
@@ -257,27 +506,35 @@ class TechnicianRepository:
 
     def has_active_time_off(self, technician_id: UUID, current_date: date) -> bool:
         return (
-            self.db.query(TimeOff.id)
-            .filter(
-                TimeOff.technician_id == technician_id,
-                TimeOff.cancelled_at.is_(None),
-                TimeOff.start_date <= current_date,
-                TimeOff.end_date >= current_date,
-            )
-            .first()
+            self.db.execute(
+                lambda_stmt(
+                    lambda: select(TimeOff.id)
+                    .where(
+                        TimeOff.technician_id == technician_id,
+                        TimeOff.cancelled_at.is_(None),
+                        TimeOff.start_date <= current_date,
+                        TimeOff.end_date >= current_date,
+                    )
+                    .limit(1)
+                )
+            ).first()
             is not None
         )
 
     def has_overlapping_time_off(self, technician_id: UUID, start_date: date, end_date: date) -> bool:
         return (
-            self.db.query(TimeOff.id)
-            .filter(
-                TimeOff.technician_id == technician_id,
-                TimeOff.cancelled_at.is_(None),
-                TimeOff.start_date <= end_date,
-                TimeOff.end_date >= start_date,
-            )
-            .first()
+            self.db.execute(
+                lambda_stmt(
+                    lambda: select(TimeOff.id)
+                    .where(
+                        TimeOff.technician_id == technician_id,
+                        TimeOff.cancelled_at.is_(None),
+                        TimeOff.start_date <= end_date,
+                        TimeOff.end_date >= start_date,
+                    )
+                    .limit(1)
+                )
+            ).first()
             is not None
         )
 
@@ -298,6 +555,7 @@ class TechnicianRepository:
             reason=reason,
         )
         self.db.add(row)
+        self.bump_profile_version(technician_id)
         self.db.flush()
         self.db.refresh(row)
         return row
@@ -313,41 +571,277 @@ class TechnicianRepository:
         )
 
     def cancel_time_off(self, time_off_id: UUID, cancelled_at: datetime) -> None:
+        technician_id = self.db.execute(
+            select(TimeOff.technician_id).where(TimeOff.id == time_off_id)
+        ).scalar_one_or_none()
         self.db.execute(
             update(TimeOff)
             .where(TimeOff.id == time_off_id)
             .values(cancelled_at=cancelled_at)
         )
+        if technician_id is not None:
+            self.bump_profile_version(technician_id)
         self.db.flush()
 
     def replace_out_of_office_ranges(self, technician_id: UUID, items: Sequence[Dict[str, Any]]) -> List[TimeOff]:
-        self.db.query(TimeOff).filter(TimeOff.technician_id == technician_id).delete()
+        # Live entries are matched by (entry_type, start_date, end_date); leftovers are cancelled, not deleted,
+        # so cancelled history and the ids clients already hold survive a save.
+        existing: Dict[tuple, List[TimeOff]] = {}
+        for row in self.list_non_cancelled_time_off(technician_id):
+            existing.setdefault((row.entry_type, row.start_date, row.end_date), []).append(row)
+
+        inserts: List[Dict[str, Any]] = []
+        updates: List[Dict[str, Any]] = []
         for item in items:
-            self.db.add(
-                TimeOff(
-                    technician_id=technician_id,
-                    entry_type=item["entry_type"],
-                    start_date=item["start_date"],
-                    end_date=item["end_date"],
-                    reason=item["reason"],
+            matches = existing.get((item["entry_type"], item["start_date"], item["end_date"]))
+            if not matches:
+                inserts.append(
+                    {
+                        "technician_id": technician_id,
+                        "entry_type": item["entry_type"],
+                        "start_date": item["start_date"],
+                        "end_date": item["end_date"],
+                        "reason": item["reason"],
+                    }
                 )
+                continue
+            row = matches.pop(0)
+            if row.reason != item["reason"]:
+                updates.append({"id": row.id, "reason": item["reason"]})
+        removed_ids = [row.id for rows in existing.values() for row in rows]
+
+        if removed_ids:
+            self.db.execute(
+                update(TimeOff)
+                .where(TimeOff.id.in_(removed_ids))
+                .values(cancelled_at=datetime.now(timezone.utc))
             )
+        if updates:
+            self.db.execute(update(TimeOff), updates)
+        if inserts:
+            self.db.execute(insert(TimeOff), inserts)
+        if removed_ids or updates or inserts:
+            self.bump_profile_version(technician_id)
+
         self.db.flush()
         return self.list_non_cancelled_time_off(technician_id)
 
     def get_job_by_id(self, job_id: UUID) -> Optional[Job]:
-        return self.db.query(Job).filter(Job.id == job_id).first()
+        return get_cached(self.db, Job, job_id)
+
+    def has_rejected_job(self, technician_id: UUID, job_id: UUID) -> bool:
+        return (
+            self.db.execute(
+                lambda_stmt(
+                    lambda: select(JobRejection.job_id)
+                    .where(JobRejection.tech_id == technician_id, JobRejection.job_id == job_id)
+                    .limit(1)
+                )
+            ).first()
+            is not None
+        )
+
+    def try_claim_job(self, job_id: UUID, technician_id: UUID, expected_version: int) -> bool:
+        result = self.db.execute(
+            update(Job)
+            .where(
+                Job.id == job_id,
+                Job.status == JobStatus.READY_FOR_TECH_ACCEPTANCE.value,
+                Job.version == expected_version,
+            )
+            .values(
+                status=JobStatus.ASSIGNED.value,
+                assigned_tech_id=technician_id,
+                version=Job.version + 1,
+                updated_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            return False
+        # The conditional UPDATE skips the Job mapper hooks, so drop the broadcast candidates here.
+        self.db.execute(delete(job_candidates).where(job_candidates.c.job_id == job_id))
+        return True
+
+    def try_reserve_job_capacity(self, technician_id: UUID, max_active_jobs: int) -> bool:
+        result = self.db.execute(
+            update(Technician)
+            .where(Technician.id == technician_id, Technician.active_jobs < max_active_jobs)
+            .values(active_jobs=Technician.active_jobs + 1)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
 
     def get_current_jobs_count(self, technician_id: UUID) -> int:
-        row = (
-            self.db.query(func.count(Job.id))
+        value = self.db.execute(
+            lambda_stmt(lambda: select(Technician.active_jobs).where(Technician.id == technician_id))
+        ).scalar()
+        return int(value or 0)
+
+    def count_active_jobs_by_technician(self) -> Dict[UUID, int]:
+        rows = (
+            self.db.query(Job.assigned_tech_id, func.count(Job.id))
+            .filter(
+                Job.assigned_tech_id.is_not(None),
+                func.upper(Job.status).in_(ACTIVE_JOB_STATUSES),
+            )
+            .group_by(Job.assigned_tech_id)
+            .all()
+        )
+        return {technician_id: int(count) for technician_id, count in rows}
+
+    def reconcile_active_job_counters(self, *, apply: bool = True) -> List[Dict[str, Any]]:
+        actual_by_technician = self.count_active_jobs_by_technician()
+        drifted: List[Dict[str, Any]] = []
+        for technician_id, stored in self.db.query(Technician.id, Technician.active_jobs).all():
+            actual = actual_by_technician.get(technician_id, 0)
+            if int(stored or 0) == actual:
+                continue
+            drifted.append({"technician_id": technician_id, "stored": int(stored or 0), "actual": actual})
+            if apply:
+                self.db.execute(
+                    update(Technician).where(Technician.id == technician_id).values(active_jobs=actual)
+                )
+        if apply and drifted:
+            self.db.flush()
+        return drifted
+
+    def list_active_jobs_for_technicians(self, technician_ids: Sequence[UUID]) -> List[Job]:
+        ids = list(technician_ids)
+        if not ids:
+            return []
+        return (
+            self.db.query(Job)
             .filter(
-                Job.assigned_tech_id == technician_id,
+                Job.assigned_tech_id.in_(ids),
                 Job.status.in_(self.ACTIVE_ASSIGNMENT_STATUSES),
             )
-            .first()
+            .order_by(Job.assigned_tech_id.asc(), Job.created_at.asc())
+            .all()
+        )
+
+    def list_qualified_technicians(self, zone_id: UUID, skill_id: UUID) -> List[Technician]:
+        return (
+            self.db.query(Technician)
+            .join(technician_zones, technician_zones.c.technician_id == Technician.id)
+            .join(technician_skills, technician_skills.c.technician_id == Technician.id)
+            .filter(
+                technician_zones.c.zone_id == zone_id,
+                technician_skills.c.skill_id == skill_id,
+                Technician.status == TechnicianStatus.ACTIVE.value,
+                Technician.manual_availability.is_(True),
+            )
+            .order_by(Technician.name.asc())
+            .all()
+        )
+
+    def refresh_job_candidates(self, job: Job) -> None:
+        refresh_candidates_for_job(
+            self.db.connection(),
+            job_id=job.id,
+            status=job.status,
+            zone_id=job.zone_id,
+            skill_id=job.skill_id,
+        )
+
+    def refresh_technician_job_candidates(self, technician_id: UUID) -> None:
+        self.refresh_job_candidates_for_technicians([technician_id])
+
+    def refresh_job_candidates_for_technicians(self, technician_ids: Iterable[UUID]) -> None:
+        ids = list(dict.fromkeys(technician_ids))
+        for chunk in _chunks(ids):
+            self.db.execute(delete(job_candidates).where(job_candidates.c.technician_id.in_(chunk)))
+            ready_jobs = (
+                select(Job.id, Technician.id)
+                .join(technician_zones, technician_zones.c.zone_id == Job.zone_id)
+                .join(
+                    technician_skills,
+                    and_(
+                        technician_skills.c.skill_id == Job.skill_id,
+                        technician_skills.c.technician_id == technician_zones.c.technician_id,
+                    ),
+                )
+                .join(Technician, Technician.id == technician_zones.c.technician_id)
+                .where(
+                    Technician.id.in_(chunk),
+                    Technician.status == TechnicianStatus.ACTIVE.value,
+                    Technician.manual_availability.is_(True),
+                    Job.status == JobStatus.READY_FOR_TECH_ACCEPTANCE.value,
+                    ~exists().where(and_(JobRejection.job_id == Job.id, JobRejection.tech_id == Technician.id)),
+                )
+            )
+            self.db.execute(insert(job_candidates).from_select(["job_id", "technician_id"], ready_jobs))
+
+    def rebuild_job_candidates(self) -> int:
+        self.db.execute(delete(job_candidates))
+        ready_jobs = (
+            self.db.query(Job)
+            .filter(
+                Job.status == JobStatus.READY_FOR_TECH_ACCEPTANCE.value,
+                Job.zone_id.is_not(None),
+                Job.skill_id.is_not(None),
+            )
+            .all()
+        )
+        for job in ready_jobs:
+            self.refresh_job_candidates(job)
+        return len(ready_jobs)
+
+    def list_job_feed(self, technician_id: UUID, *, after_job_id: Optional[UUID] = None, limit: int = 20) -> List[Job]:
+        # job_candidates already excludes other zones and skills, rejected jobs and inactive or
+        # unavailable technicians, so the page is a candidate probe plus the (status, created_at, id) scan.
+        query = (
+            self.db.query(Job)
+            .join(
+                job_candidates,
+                and_(job_candidates.c.job_id == Job.id, job_candidates.c.technician_id == technician_id),
+            )
+            .filter(Job.status == JobStatus.READY_FOR_TECH_ACCEPTANCE.value)
+        )
+        if after_job_id is not None:
+            # Compare against the cursor row in SQL so timestamps never round-trip through bind parameters.
+            cursor = aliased(Job)
+            cursor_created_at = select(cursor.created_at).where(cursor.id == after_job_id).scalar_subquery()
+            query = query.filter(
+                or_(
+                    Job.created_at > cursor_created_at,
+                    and_(Job.created_at == cursor_created_at, Job.id > after_job_id),
+                )
+            )
+        return query.order_by(Job.created_at.asc(), Job.id.asc()).limit(limit).all()
+
+    def list_candidate_technician_ids(self, job_id: UUID) -> List[UUID]:
+        return list(
+            self.db.execute(
+                select(job_candidates.c.technician_id).where(job_candidates.c.job_id == job_id)
+            ).scalars()
+        )
+
+    def list_technician_coordinates(self) -> List[Any]:
+        return self.db.execute(
+            select(Technician.id, Technician.latitude, Technician.longitude).where(
+                Technician.latitude.is_not(None),
+                Technician.longitude.is_not(None),
+            )
+        ).all()
+
+    def get_technician_names(self, technician_ids: Iterable[UUID]) -> Dict[UUID, str]:
+        names: Dict[UUID, str] = {}
+        for chunk in _chunks(list(dict.fromkeys(technician_ids))):
+            rows = self.db.execute(
+                select(Technician.id, func.coalesce(Technician.full_name, Technician.name)).where(Technician.id.in_(chunk))
+            )
+            names.update((row[0], row[1]) for row in rows)
+        return names
+
+    def list_candidate_technicians(self, job_id: UUID) -> List[Technician]:
+        return (
+            self.db.query(Technician)
+            .join(job_candidates, job_candidates.c.technician_id == Technician.id)
+            .filter(job_candidates.c.job_id == job_id)
+            .order_by(Technician.name.asc())
+            .all()
         )
-        return int(row[0] if row and row[0] is not None else 0)
 
     def has_zone_match(self, technician_id: UUID, zone_id: Optional[UUID]) -> bool:
         if zone_id is None:
@@ -355,8 +849,8 @@ class TechnicianRepository:
 
         return (
             self.db.execute(
-                select(technician_zones.c.technician_id).where(
-                    and_(
+                lambda_stmt(
+                    lambda: select(technician_zones.c.technician_id).where(
                         technician_zones.c.technician_id == technician_id,
                         technician_zones.c.zone_id == zone_id,
                     )
@@ -371,8 +865,8 @@ class TechnicianRepository:
 
         return (
             self.db.execute(
-                select(technician_skills.c.technician_id).where(
-                    and_(
+                lambda_stmt(
+                    lambda: select(technician_skills.c.technician_id).where(
                         technician_skills.c.technician_id == technician_id,
                         technician_skills.c.skill_id == skill_id,
                     )
@@ -410,12 +904,18 @@ class TechnicianRepository:
         *,
         technician_id: Optional[UUID] = None,
         status: Optional[str] = None,
+        changed_since: Optional[datetime] = None,
+        with_technician: bool = False,
     ) -> List[TechnicianEmailChangeRequest]:
         query = self.db.query(TechnicianEmailChangeRequest)
+        if with_technician:
+            query = query.options(selectinload(TechnicianEmailChangeRequest.technician))
         if technician_id is not None:
             query = query.filter(TechnicianEmailChangeRequest.technician_id == technician_id)
         if status is not None:
             query = query.filter(TechnicianEmailChangeRequest.status == status)
+        if changed_since is not None:
+            query = query.filter(TechnicianEmailChangeRequest.updated_at >= changed_since)
         return query.order_by(TechnicianEmailChangeRequest.requested_at.desc()).all()
 
     def get_email_change_request_by_id(self, request_id: UUID) -> Optional[TechnicianEmailChangeRequest]:
@@ -436,6 +936,27 @@ class TechnicianRepository:
             .first()
         )
 
+    def get_pending_email_change_requests_for_technicians(
+        self, technician_ids: Sequence[UUID]
+    ) -> Dict[UUID, TechnicianEmailChangeRequest]:
+        """Latest pending request per technician, in one query."""
+        ids = list(technician_ids)
+        if not ids:
+            return {}
+        rows = (
+            self.db.query(TechnicianEmailChangeRequest)
+            .filter(
+                TechnicianEmailChangeRequest.technician_id.in_(ids),
+                TechnicianEmailChangeRequest.status == "PENDING",
+            )
+            .order_by(TechnicianEmailChangeRequest.requested_at.desc())
+            .all()
+        )
+        latest: Dict[UUID, TechnicianEmailChangeRequest] = {}
+        for row in rows:
+            latest.setdefault(row.technician_id, row)
+        return latest
+
     def create_email_change_request(
         self,
         *,
@@ -450,6 +971,7 @@ class TechnicianRepository:
             status="PENDING",
         )
         self.db.add(row)
+        self.bump_profile_version(technician_id)
         self.db.flush()
         self.db.refresh(row)
         return row
@@ -0,0 +1,29 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class DatabasePoolStatus(BaseModel):
+    name: str
+    pool_class: str
+    size: Optional[int] = None
+    timeout_seconds: Optional[float] = None
+    checked_in: Optional[int] = None
+    in_use: Optional[int] = None
+    overflow_in_use: Optional[int] = None
+    checkouts: Optional[int] = None
+    checkout_timeouts: Optional[int] = None
+    connections_opened: Optional[int] = None
+    connections_invalidated: Optional[int] = None
+    peak_in_use: Optional[int] = None
+    wait_ms_avg: Optional[float] = None
+    wait_ms_p50: Optional[float] = None
+    wait_ms_p95: Optional[float] = None
+    wait_ms_max: Optional[float] = None
+
+
+class DatabasePoolMetricsResponse(BaseModel):
+    pools: List[DatabasePoolStatus]
+    # Set only when DATABASE_READ_URL is configured.
+    replica_in_use: Optional[bool] = None
+    replica_lag_seconds: Optional[float] = None
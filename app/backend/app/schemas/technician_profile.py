@@ -76,13 +76,14 @@ class TimeOffResponseItem(BaseModel):
         from_attributes = True
 
 
-class TechnicianProfileResponse(BaseModel):
+class TechnicianProfileSummary(BaseModel):
     id: UUID
     name: str
     full_name: str
     email: str
     phone: Optional[str] = None
     profile_picture_url: Optional[str] = None
+    postal_code: Optional[str] = None
     status: TechnicianStatus
     manual_availability: bool
     effective_availability: bool
@@ -98,6 +99,9 @@ class TechnicianProfileResponse(BaseModel):
     pending_email_change_requested_email: Optional[str] = None
     zones: List[ZoneResponse]
     skills: List[SkillResponse]
+
+
+class TechnicianProfileResponse(TechnicianProfileSummary):
     weekly_schedule: List[WeeklyScheduleResponseItem]
     upcoming_time_off: List[TimeOffResponseItem]
 
@@ -134,6 +138,7 @@ class TechnicianUpdateRequest(BaseModel):
     password: Optional[str] = None
     status: Optional[TechnicianStatus] = None
     manual_availability: Optional[bool] = None
+    postal_code: Optional[str] = Field(default=None, max_length=32)
 
     @validator("name")
     def validate_name(cls, name: Optional[str]):
@@ -169,6 +174,13 @@ class TechnicianUpdateRequest(BaseModel):
             raise ValueError("password must not be empty")
         return normalized
 
+    @validator("postal_code")
+    def validate_postal_code(cls, postal_code: Optional[str]):
+        if postal_code is None:
+            return None
+        normalized = postal_code.strip().upper()
+        return normalized or None
+
 
 class TechnicianCreateRequest(BaseModel):
     name: str = Field(..., min_length=1, max_length=255)
@@ -209,6 +221,25 @@ class TechnicianCreateRequest(BaseModel):
         return normalized
 
 
+class TechnicianImportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class TechnicianImportRowError(BaseModel):
+    line: int
+    email: Optional[str] = None
+    errors: List[str]
+
+
+class TechnicianImportResponse(BaseModel):
+    processed: int
+    created: int
+    failed: int
+    errors: List[TechnicianImportRowError]
+    errors_truncated: bool = False
+
+
 class TechnicianZoneAssignRequest(BaseModel):
     zone_id: UUID
 
@@ -217,6 +248,68 @@ class TechnicianSkillAssignRequest(BaseModel):
     skill_id: UUID
 
 
+class BulkAssignmentOperation(str, Enum):
+    ADD = "add"
+    REMOVE = "remove"
+
+
+class BulkAssignmentStatus(str, Enum):
+    ADDED = "added"
+    REMOVED = "removed"
+    ALREADY_ASSIGNED = "already_assigned"
+    NOT_ASSIGNED = "not_assigned"
+    TECHNICIAN_NOT_FOUND = "technician_not_found"
+    ZONE_NOT_FOUND = "zone_not_found"
+    SKILL_NOT_FOUND = "skill_not_found"
+
+
+class TechnicianZonePair(BaseModel):
+    technician_id: UUID
+    zone_id: UUID
+
+
+class TechnicianSkillPair(BaseModel):
+    technician_id: UUID
+    skill_id: UUID
+
+
+class BulkZoneAssignmentRequest(BaseModel):
+    operation: BulkAssignmentOperation
+    assignments: List[TechnicianZonePair] = Field(..., min_length=1, max_length=5000)
+
+
+class BulkSkillAssignmentRequest(BaseModel):
+    operation: BulkAssignmentOperation
+    assignments: List[TechnicianSkillPair] = Field(..., min_length=1, max_length=5000)
+
+
+class BulkAssignmentResultItem(BaseModel):
+    technician_id: UUID
+    zone_id: Optional[UUID] = None
+    skill_id: Optional[UUID] = None
+    status: BulkAssignmentStatus
+
+
+class BulkAssignmentResponse(BaseModel):
+    applied: int
+    results: List[BulkAssignmentResultItem]
+
+
+class BulkTechnicianStatusRequest(BaseModel):
+    """Target status plus the technicians to move: explicit IDs, filters, or both (intersected)."""
+
+    status: TechnicianStatus
+    technician_ids: Optional[List[UUID]] = Field(None, min_length=1, max_length=5000)
+    zone_id: Optional[UUID] = None
+    skill_id: Optional[UUID] = None
+    current_status: Optional[TechnicianStatus] = None
+
+
+class BulkTechnicianStatusResponse(BaseModel):
+    updated: int
+    technician_ids: List[UUID]
+
+
 class WeeklyScheduleUpdateItem(BaseModel):
     day_of_week: int = Field(..., ge=0, le=6)
     is_enabled: bool
@@ -375,6 +468,16 @@ class EmailChangeRequestResponse(BaseModel):
     remarks: Optional[str] = None
 
 
+class TechnicianSyncResponse(BaseModel):
+    sync_token: str
+    full_sync: bool
+    profile: TechnicianProfileSummary
+    weekly_schedule: List[WeeklyScheduleResponseItem]
+    time_off: List[TimeOffResponseItem]
+    time_off_ids: List[UUID]
+    email_change_requests: List[EmailChangeRequestResponse]
+
+
 class AssignmentReadinessResponse(BaseModel):
     technician_id: UUID
     job_id: UUID
@@ -382,3 +485,82 @@ class AssignmentReadinessResponse(BaseModel):
     zone_match: bool
     skill_match: bool
     can_assign: bool
+
+
+class DateRangeItem(BaseModel):
+    start_date: date
+    end_date: date
+
+
+class TeamCalendarTechnicianRow(BaseModel):
+    technician_id: UUID
+    name: str
+    status: TechnicianStatus
+    days: str = Field(
+        ...,
+        description=(
+            "One character per day from from_date: W=working, P=partial leave on a working day, "
+            "O=on leave, -=not scheduled"
+        ),
+    )
+    working_days_count: int
+    time_off_ranges: List[DateRangeItem] = Field(default_factory=list)
+
+
+class TeamCalendarResponse(BaseModel):
+    from_date: date
+    to_date: date
+    technicians: List[TeamCalendarTechnicianRow]
+
+
+class AvailableSlotItem(BaseModel):
+    technician_id: UUID
+    technician_name: str
+    start_at: datetime
+    end_at: datetime
+
+
+class EarliestSlotsResponse(BaseModel):
+    job_id: UUID
+    zone_id: Optional[UUID] = None
+    skill_id: Optional[UUID] = None
+    searched_from: datetime
+    searched_until: datetime
+    slots: List[AvailableSlotItem]
+
+
+class RankedTechnicianItem(BaseModel):
+    technician_id: UUID
+    technician_name: str
+    distance_km: Optional[float] = None
+
+
+class JobProximityResponse(BaseModel):
+    job_id: UUID
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    candidate_count: int
+    technicians: List[RankedTechnicianItem]
+
+
+class JobAcceptanceResponse(BaseModel):
+    job_id: UUID
+    status: str
+    assigned_tech_id: UUID
+    version: int
+
+
+class AvailableJobItem(BaseModel):
+    job_id: UUID
+    job_code: str
+    service_type: Optional[str]
+    zone_id: Optional[UUID]
+    skill_id: Optional[UUID]
+    customer_city: Optional[str]
+    created_at: datetime
+    version: int
+
+
+class AvailableJobsPage(BaseModel):
+    items: List[AvailableJobItem]
+    next_cursor: Optional[UUID]
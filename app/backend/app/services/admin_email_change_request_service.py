@@ -23,7 +23,7 @@ class AdminEmailChangeRequestService:
         self.repo = TechnicianRepository(db)
 
     def _to_response(self, request_row) -> EmailChangeRequestResponse:
-        technician = self.repo.get_technician_by_id(request_row.technician_id)
+        technician = request_row.technician
         technician_name = None
         if technician is not None:
             technician_name = technician.full_name or technician.name
@@ -42,7 +42,7 @@ class AdminEmailChangeRequestService:
 
     def list_requests(self, status_filter: Optional[EmailChangeRequestStatus] = None) -> List[EmailChangeRequestResponse]:
         status_value = status_filter.value if status_filter else None
-        rows = self.repo.list_email_change_requests(status=status_value)
+        rows = self.repo.list_email_change_requests(status=status_value, with_technician=True)
         return [self._to_response(row) for row in rows]
 
     def approve_request(self, request_id: UUID, payload: EmailChangeRequestReviewRequest) -> EmailChangeRequestResponse:
@@ -103,6 +103,7 @@ class AdminEmailChangeRequestService:
         row.reviewed_by = self.current_user.user_id
         row.reviewed_at = now_utc
         row.remarks = payload.remarks
+        self.repo.bump_profile_version(row.technician_id)
 
         AuditService.log_event(
             self.db,
@@ -1,6 +1,7 @@
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, Optional
 from uuid import UUID
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from ..core.enums import UserRole
@@ -29,3 +30,26 @@ class AuditService:
                 metadata_json=metadata,
             )
         )
+
+    @staticmethod
+    def log_events(
+        db: Session,
+        *,
+        actor_role: UserRole,
+        actor_id: UUID,
+        events: Iterable[Dict[str, Any]],
+    ) -> None:
+        """Write many audit rows in one INSERT; each event carries action, entity_type, entity_id and metadata."""
+        rows = [
+            {
+                "actor_role": actor_role.value,
+                "actor_id": actor_id,
+                "action": item["action"],
+                "entity_type": item["entity_type"],
+                "entity_id": item["entity_id"],
+                "metadata_json": item.get("metadata"),
+            }
+            for item in events
+        ]
+        if rows:
+            db.execute(insert(AuditLog), rows)
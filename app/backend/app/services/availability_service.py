@@ -1,13 +1,15 @@
 from dataclasses import dataclass
 from datetime import date, datetime, time, timezone
-from typing import Optional
+from typing import Dict, List, Optional, Sequence
 from uuid import UUID
 
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
 from ..core.enums import TechnicianStatus
+from ..models.working_hours import WorkingHours
 from ..repositories.technician_repository import TechnicianRepository
+from .time_off_index import TimeOffIndex
 
 
 @dataclass(frozen=True)
@@ -38,9 +40,48 @@ def compute_effective_availability_from_inputs(inputs: AvailabilityInputs) -> bo
 
 
 class AvailabilityService:
-    def __init__(self, db: Session, repository: Optional[TechnicianRepository] = None):
+    def __init__(
+        self,
+        db: Session,
+        repository: Optional[TechnicianRepository] = None,
+        time_off_index: Optional[TimeOffIndex] = None,
+    ):
         self.db = db
         self.repo = repository or TechnicianRepository(db)
+        self.time_off_index = time_off_index
+        self.schedule_index: Optional[Dict[UUID, Dict[int, WorkingHours]]] = None
+
+    def load_time_off_index(self, technician_ids: Sequence[UUID], from_date: Optional[date] = None) -> TimeOffIndex:
+        anchor = from_date or datetime.now(timezone.utc).date()
+        rows = self.repo.list_active_time_off_for_technicians(technician_ids, anchor)
+        self.time_off_index = TimeOffIndex(technician_ids, rows)
+        return self.time_off_index
+
+    def load_schedule_index(self, technician_ids: Sequence[UUID]) -> Dict[UUID, Dict[int, WorkingHours]]:
+        """Weekly schedules for a whole listing in one query, keyed by technician then weekday."""
+        index: Dict[UUID, Dict[int, WorkingHours]] = {technician_id: {} for technician_id in technician_ids}
+        for row in self.repo.list_weekly_schedules_for_technicians(technician_ids):
+            index[row.technician_id][row.day_of_week] = row
+        self.schedule_index = index
+        return index
+
+    def weekly_schedule(self, technician_id: UUID) -> List[WorkingHours]:
+        days = self.schedule_index.get(technician_id) if self.schedule_index is not None else None
+        if days is not None:
+            return [days[day] for day in sorted(days)]
+        return self.repo.list_weekly_schedule(technician_id)
+
+    def _working_hours_for_day(self, technician_id: UUID, day_of_week: int) -> Optional[WorkingHours]:
+        days = self.schedule_index.get(technician_id) if self.schedule_index is not None else None
+        if days is not None:
+            return days.get(day_of_week)
+        return self.repo.get_working_hours_for_day(technician_id, day_of_week)
+
+    def _has_active_time_off(self, technician_id: UUID, current_date: date) -> bool:
+        tree = self.time_off_index.get(technician_id) if self.time_off_index is not None else None
+        if tree is not None:
+            return tree.covers(current_date)
+        return self.repo.has_active_time_off(technician_id, current_date)
 
     def compute_effective_availability(self, technician_id: UUID, now: Optional[datetime] = None) -> bool:
         utc_now = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)
@@ -51,8 +92,8 @@ class AvailabilityService:
                 detail="Technician not found",
             )
 
-        schedule = self.repo.get_working_hours_for_day(technician_id, utc_now.weekday())
-        has_active_time_off = self.repo.has_active_time_off(technician_id, utc_now.date())
+        schedule = self._working_hours_for_day(technician_id, utc_now.weekday())
+        has_active_time_off = self._has_active_time_off(technician_id, utc_now.date())
 
         inputs = AvailabilityInputs(
             status=technician.status,
@@ -67,15 +108,18 @@ class AvailabilityService:
 
     def is_on_leave_now(self, technician_id: UUID, now: Optional[datetime] = None) -> bool:
         utc_now = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)
-        return self.repo.has_active_time_off(technician_id, utc_now.date())
+        return self._has_active_time_off(technician_id, utc_now.date())
 
     def current_shift_window(self, technician_id: UUID, now: Optional[datetime] = None) -> Optional[str]:
         utc_now = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)
-        schedule = self.repo.get_working_hours_for_day(technician_id, utc_now.weekday())
+        schedule = self._working_hours_for_day(technician_id, utc_now.weekday())
         if schedule is None or not schedule.is_enabled:
             return None
         return f"{schedule.start_time.strftime('%H:%M')}-{schedule.end_time.strftime('%H:%M')}"
 
     def next_time_off_start(self, technician_id: UUID, from_date: Optional[date] = None) -> Optional[date]:
         anchor = from_date or datetime.now(timezone.utc).date()
+        tree = self.time_off_index.get(technician_id) if self.time_off_index is not None else None
+        if tree is not None:
+            return tree.next_start_on_or_after(anchor)
         return self.repo.get_next_time_off_start(technician_id, anchor)
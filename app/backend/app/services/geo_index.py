@@ -0,0 +1,163 @@
+import heapq
+import math
+from dataclasses import dataclass
+from typing import Collection, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from uuid import UUID
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LATITUDE = math.pi * EARTH_RADIUS_KM / 180.0
+DEFAULT_CELL_DEGREES = 0.25
+
+Cell = Tuple[int, int]
+
+
+def haversine_km(latitude_a: float, longitude_a: float, latitude_b: float, longitude_b: float) -> float:
+    phi_a = math.radians(latitude_a)
+    phi_b = math.radians(latitude_b)
+    half_dphi = (phi_b - phi_a) / 2
+    half_dlambda = math.radians(longitude_b - longitude_a) / 2
+    h = math.sin(half_dphi) ** 2 + math.cos(phi_a) * math.cos(phi_b) * math.sin(half_dlambda) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(h)))
+
+
+@dataclass(frozen=True)
+class GeoPoint:
+    key: UUID
+    latitude: float
+    longitude: float
+
+
+class GeoGridIndex:
+    """Fixed latitude/longitude grid for nearest-neighbour and radius queries.
+
+    Points are bucketed into ``cell_degrees`` cells. A query walks square rings of
+    cells outward from the origin and stops once no unvisited cell can hold a point
+    closer than the current k-th result (or the radius), so the cost follows the
+    density around the origin rather than the total number of points.
+    """
+
+    def __init__(self, points: Iterable[GeoPoint] = (), cell_degrees: float = DEFAULT_CELL_DEGREES):
+        self.cell_degrees = cell_degrees
+        self._columns = math.ceil(360 / cell_degrees)
+        self._points: Dict[UUID, GeoPoint] = {}
+        self._cells: Dict[Cell, List[GeoPoint]] = {}
+        for point in points:
+            self._points[point.key] = point
+            self._cells.setdefault(self._cell(point.latitude, point.longitude), []).append(point)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, key: UUID) -> bool:
+        return key in self._points
+
+    def get(self, key: UUID) -> Optional[GeoPoint]:
+        return self._points.get(key)
+
+    def _cell(self, latitude: float, longitude: float) -> Cell:
+        row = math.floor(latitude / self.cell_degrees)
+        column = math.floor((longitude + 180.0) / self.cell_degrees) % self._columns
+        return row, column
+
+    def _ring(self, origin: Cell, radius: int) -> Iterator[Cell]:
+        row, column = origin
+        if radius == 0:
+            yield origin
+            return
+        for offset in range(-radius, radius + 1):
+            yield row - radius, (column + offset) % self._columns
+            yield row + radius, (column + offset) % self._columns
+        for offset in range(-radius + 1, radius):
+            yield row + offset, (column - radius) % self._columns
+            yield row + offset, (column + radius) % self._columns
+
+    def _outside_ring_bound_km(self, latitude: float, radius: int) -> float:
+        """Lower bound on the distance from the origin to any point outside rings 0..radius."""
+        span = radius * self.cell_degrees
+        across_rows = span * KM_PER_DEGREE_LATITUDE
+        if span >= 180:
+            return across_rows
+        # Same-row-band cells are at least ``span`` degrees of longitude away; the separation is
+        # smallest at the highest latitude the band reaches.
+        highest_latitude = min(90.0, abs(latitude) + (radius + 1) * self.cell_degrees)
+        across_columns = haversine_km(highest_latitude, 0.0, highest_latitude, span)
+        return min(across_rows, across_columns)
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        *,
+        limit: Optional[int] = None,
+        max_distance_km: Optional[float] = None,
+        keys: Optional[Collection[UUID]] = None,
+    ) -> List[Tuple[GeoPoint, float]]:
+        """Points closest to the origin as ``(point, distance_km)``, nearest first.
+
+        ``keys`` restricts the search to a subset; a subset much smaller than the
+        index is ranked directly instead of walking the grid.
+        """
+        if limit is not None and limit <= 0:
+            return []
+        if keys is not None and len(keys) * 4 < len(self._points):
+            scored = (
+                (haversine_km(latitude, longitude, point.latitude, point.longitude), point)
+                for point in (self._points.get(key) for key in keys)
+                if point is not None
+            )
+            return self._select(scored, limit, max_distance_km)
+
+        allowed: Optional[Set[UUID]] = set(keys) if keys is not None else None
+        remaining = len(self._points) if allowed is None else sum(1 for key in allowed if key in self._points)
+        best: List[Tuple[float, str, GeoPoint]] = []
+
+        def consider(points: Iterable[GeoPoint]) -> None:
+            nonlocal remaining
+            for point in points:
+                if allowed is not None and point.key not in allowed:
+                    continue
+                remaining -= 1
+                distance = haversine_km(latitude, longitude, point.latitude, point.longitude)
+                if max_distance_km is not None and distance > max_distance_km:
+                    continue
+                item = (-distance, str(point.key), point)
+                if limit is None or len(best) < limit:
+                    heapq.heappush(best, item)
+                elif -distance > best[0][0]:
+                    heapq.heapreplace(best, item)
+
+        origin = self._cell(latitude, longitude)
+        seen: Set[Cell] = set()
+        radius = 0
+        while remaining > 0:
+            if (2 * radius + 1) ** 2 > len(self._cells):
+                # Sparse surroundings: the next ring would touch more cells than are occupied.
+                for cell, points in self._cells.items():
+                    if cell not in seen:
+                        consider(points)
+                break
+            for cell in self._ring(origin, radius):
+                if cell not in seen:
+                    seen.add(cell)
+                    consider(self._cells.get(cell, ()))
+            bound = self._outside_ring_bound_km(latitude, radius)
+            if max_distance_km is not None and bound > max_distance_km:
+                break
+            if limit is not None and len(best) >= limit and bound >= -best[0][0]:
+                break
+            radius += 1
+        return [(point, -negative) for negative, _, point in sorted(best, key=lambda item: (-item[0], item[1]))]
+
+    @staticmethod
+    def _select(
+        scored: Iterable[Tuple[float, GeoPoint]],
+        limit: Optional[int],
+        max_distance_km: Optional[float],
+    ) -> List[Tuple[GeoPoint, float]]:
+        within = (
+            (distance, str(point.key), point)
+            for distance, point in scored
+            if max_distance_km is None or distance <= max_distance_km
+        )
+        ranked = heapq.nsmallest(limit, within) if limit is not None else sorted(within)
+        return [(point, distance) for distance, _, point in ranked]
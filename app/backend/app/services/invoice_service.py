@@ -9,6 +9,7 @@ from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from ..core.db_replica import is_replica_session
 from ..core.enums import AuditEntityType
 from ..core.security import AuthenticatedUser
 from ..models.dealership import Dealership
@@ -111,27 +112,26 @@ class InvoiceService:
 
         return get_default_invoice_branding_payload()
 
-    def _to_response(self, invoice: Invoice) -> InvoiceResponse:
+    def _to_response(
+        self,
+        invoice: Invoice,
+        primary_jobs: Optional[dict[UUID, tuple[Job, Optional[Dealership], Optional[Technician]]]] = None,
+    ) -> InvoiceResponse:
+        """Listings pass ``primary_jobs`` preloaded for every row; single invoices look theirs up here."""
         first_job_code: Optional[str] = None
         dealership_name: Optional[str] = None
         technician_name: Optional[str] = None
 
-        primary_job = (
-            self.db.query(Job)
-            .filter(Job.invoice_id == invoice.id)
-            .order_by(Job.created_at.asc())
-            .first()
-        )
-        if primary_job is not None:
+        if primary_jobs is None:
+            primary_jobs = self.repo.get_primary_jobs_for_invoices([invoice.id])
+        primary = primary_jobs.get(invoice.id)
+        if primary is not None:
+            primary_job, dealership, technician = primary
             first_job_code = primary_job.job_code
-            if primary_job.dealership_id is not None:
-                dealership = self.db.query(Dealership).filter(Dealership.id == primary_job.dealership_id).first()
-                if dealership is not None:
-                    dealership_name = dealership.name
-            if primary_job.assigned_tech_id is not None:
-                technician = self.db.query(Technician).filter(Technician.id == primary_job.assigned_tech_id).first()
-                if technician is not None:
-                    technician_name = technician.name
+            if dealership is not None:
+                dealership_name = dealership.name
+            if technician is not None:
+                technician_name = technician.name
 
         if dealership_name is None:
             dealership_name = invoice.bill_to_name
@@ -557,9 +557,11 @@ class InvoiceService:
             self._update_overdue_status_if_needed(row)
             if row.status != original:
                 dirty = True
-        if dirty:
+        # A replica session reports the overdue status without persisting it.
+        if dirty and not is_replica_session(self.db):
             self.db.commit()
-        return [self._to_response(row) for row in rows]
+        primary_jobs = self.repo.get_primary_jobs_for_invoices([row.id for row in rows])
+        return [self._to_response(row, primary_jobs) for row in rows]
 
     def list_pending_approvals(self) -> list[InvoicePendingApprovalResponse]:
         rows = self.repo.list_pending_approval_jobs()
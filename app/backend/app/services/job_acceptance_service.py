@@ -0,0 +1,72 @@
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from ..core.broadcast import queue_broadcast
+from ..core.config import MAX_ACTIVE_JOBS_PER_TECHNICIAN
+from ..core.enums import AuditEntityType, JobStatus, UserRole
+from ..repositories.technician_repository import TechnicianRepository
+from ..schemas.technician_profile import JobAcceptanceResponse
+from .assignment_service import AssignmentService
+from .audit_service import AuditService
+
+
+class JobAcceptanceService:
+    def __init__(self, db: Session, max_active_jobs: int = MAX_ACTIVE_JOBS_PER_TECHNICIAN):
+        self.db = db
+        self.repo = TechnicianRepository(db)
+        self.assignment = AssignmentService(db)
+        self.max_active_jobs = max_active_jobs
+
+    def _conflict(self, detail: str) -> HTTPException:
+        self.db.rollback()
+        return HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
+
+    def accept_job(self, technician_id: UUID, job_id: UUID) -> JobAcceptanceResponse:
+        job = self.repo.get_job_by_id(job_id)
+        if job is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+        if job.status != JobStatus.READY_FOR_TECH_ACCEPTANCE.value:
+            raise self._conflict("Job is no longer available for acceptance")
+        if self.repo.has_rejected_job(technician_id, job_id):
+            raise self._conflict("Job was rejected by this technician")
+
+        self.assignment.assert_can_assign(technician_id, job_id)
+
+        # Capacity first: it only touches the technician's own row, so a technician at capacity
+        # never holds the contended job row while their transaction rolls back.
+        # Then compare-and-set on (id, status, version): exactly one concurrent caller matches a row.
+        # Nothing is locked ahead of time, so losers get their 409 as soon as the winner commits.
+        expected_version = job.version
+        candidate_ids = self.repo.list_candidate_technician_ids(job_id)
+        if not self.repo.try_reserve_job_capacity(technician_id, self.max_active_jobs):
+            raise self._conflict(f"Technician exceeded max concurrent jobs ({self.max_active_jobs})")
+        if not self.repo.try_claim_job(job_id, technician_id, expected_version):
+            raise self._conflict("Job was already accepted by another technician")
+
+        AuditService.log_event(
+            self.db,
+            actor_role=UserRole.TECHNICIAN,
+            actor_id=technician_id,
+            action="technician.job.accepted",
+            entity_type=AuditEntityType.JOB.value,
+            entity_id=job_id,
+            metadata={"technician_id": str(technician_id), "version": expected_version + 1},
+        )
+        payload = {
+            "job_id": str(job_id),
+            "job_code": job.job_code,
+            "status": JobStatus.ASSIGNED.value,
+            "assigned_tech_id": str(technician_id),
+        }
+        queue_broadcast(self.db, "job.accepted", [technician_id], payload)
+        queue_broadcast(self.db, "job.taken", [item for item in candidate_ids if item != technician_id], payload)
+        self.db.commit()
+
+        return JobAcceptanceResponse(
+            job_id=job_id,
+            status=JobStatus.ASSIGNED.value,
+            assigned_tech_id=technician_id,
+            version=expected_version + 1,
+        )
@@ -0,0 +1,138 @@
+import threading
+import time
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from ..core.config import GEO_INDEX_TTL_SECONDS
+from ..models.technician import Technician
+from ..repositories.technician_repository import TechnicianRepository
+from ..schemas.technician_profile import JobProximityResponse, RankedTechnicianItem
+from .geo_index import GeoGridIndex, GeoPoint
+
+TECHNICIAN_LOCATION_WRITES_KEY = "technician_location_writes"
+
+
+class TechnicianLocationCache:
+    """Process-wide grid of technician home locations.
+
+    Dropped when this process commits a coordinate change and rebuilt at least every
+    ``ttl_seconds``, which bounds staleness for writes made by other workers or scripts.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._index: Optional[GeoGridIndex] = None
+        self._built_at = 0.0
+        self._generation = 0
+
+    def get(self, repository: TechnicianRepository) -> GeoGridIndex:
+        with self._lock:
+            if self._index is not None and time.monotonic() - self._built_at < self.ttl_seconds:
+                return self._index
+            generation = self._generation
+        index = GeoGridIndex(
+            GeoPoint(key=row.id, latitude=row.latitude, longitude=row.longitude)
+            for row in repository.list_technician_coordinates()
+        )
+        with self._lock:
+            # An invalidation during the rebuild means the rows read may already be stale.
+            if generation == self._generation:
+                self._index = index
+                self._built_at = time.monotonic()
+        return index
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._index = None
+            self._generation += 1
+
+
+technician_locations = TechnicianLocationCache(GEO_INDEX_TTL_SECONDS)
+
+
+class ProximityService:
+    def __init__(self, db: Session, locations: Optional[TechnicianLocationCache] = None):
+        self.db = db
+        self.repo = TechnicianRepository(db)
+        self.locations = locations if locations is not None else technician_locations
+
+    def rank_candidates_for_job(
+        self,
+        job_id: UUID,
+        *,
+        limit: int = 20,
+        max_distance_km: Optional[float] = None,
+    ) -> JobProximityResponse:
+        """Eligible technicians (the job's broadcast candidates), nearest to the job first.
+
+        Candidates without coordinates, or all candidates when the job itself has none,
+        follow in name order with no distance unless ``max_distance_km`` is set.
+        """
+        job = self.repo.get_job_by_id(job_id)
+        if job is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+
+        candidate_ids = self.repo.list_candidate_technician_ids(job.id)
+        ranked: List[Tuple[UUID, Optional[float]]] = []
+        if candidate_ids and job.latitude is not None and job.longitude is not None:
+            ranked = [
+                (point.key, round(distance, 3))
+                for point, distance in self.locations.get(self.repo).nearest(
+                    job.latitude,
+                    job.longitude,
+                    limit=limit,
+                    max_distance_km=max_distance_km,
+                    keys=candidate_ids,
+                )
+            ]
+
+        # Below the limit without a radius, every located candidate is already ranked.
+        unplaced: List[UUID] = []
+        if max_distance_km is None and len(ranked) < limit:
+            placed = {technician_id for technician_id, _ in ranked}
+            unplaced = [technician_id for technician_id in candidate_ids if technician_id not in placed]
+
+        names = self.repo.get_technician_names([technician_id for technician_id, _ in ranked] + unplaced)
+        unplaced.sort(key=lambda technician_id: (names.get(technician_id, "").lower(), str(technician_id)))
+        ranked.extend((technician_id, None) for technician_id in unplaced[: limit - len(ranked)])
+
+        return JobProximityResponse(
+            job_id=job.id,
+            latitude=job.latitude,
+            longitude=job.longitude,
+            candidate_count=len(candidate_ids),
+            technicians=[
+                RankedTechnicianItem(
+                    technician_id=technician_id,
+                    technician_name=names.get(technician_id, ""),
+                    distance_km=distance,
+                )
+                for technician_id, distance in ranked
+            ],
+        )
+
+
+@event.listens_for(Technician, "after_insert")
+@event.listens_for(Technician, "after_update")
+def _note_location_write(_mapper, _connection, target: Technician) -> None:
+    attrs = inspect(target).attrs
+    if attrs.latitude.history.has_changes() or attrs.longitude.history.has_changes():
+        session = object_session(target)
+        if session is not None:
+            session.info[TECHNICIAN_LOCATION_WRITES_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _drop_stale_locations(session: Session) -> None:
+    if session.info.pop(TECHNICIAN_LOCATION_WRITES_KEY, False):
+        technician_locations.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_location_writes(session: Session) -> None:
+    session.info.pop(TECHNICIAN_LOCATION_WRITES_KEY, None)
@@ -0,0 +1,201 @@
+import heapq
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from ..core.enums import TimeOffEntryType
+from ..models.job import Job
+from ..models.working_hours import WorkingHours
+from ..repositories.technician_repository import TechnicianRepository
+from ..schemas.technician_profile import AvailableSlotItem, EarliestSlotsResponse
+from .time_off_index import TimeOffIndex, TimeOffInterval, TimeOffIntervalTree
+
+
+MAX_SEARCH_HORIZON_DAYS = 30
+DEFAULT_JOB_DURATION = timedelta(hours=2)
+HALF_DAY_BOUNDARY = time(12, 0)
+
+Window = Tuple[datetime, datetime]
+
+
+def _subtract_window(windows: List[Window], blocked: Window) -> List[Window]:
+    output: List[Window] = []
+    for start, end in windows:
+        if blocked[1] <= start or blocked[0] >= end:
+            output.append((start, end))
+            continue
+        if start < blocked[0]:
+            output.append((start, blocked[0]))
+        if blocked[1] < end:
+            output.append((blocked[1], end))
+    return output
+
+
+def shift_windows_for_day(
+    day: date,
+    schedule: Optional[WorkingHours],
+    time_off: Sequence[TimeOffInterval],
+) -> List[Window]:
+    if schedule is None or not schedule.is_enabled:
+        return []
+
+    windows: List[Window] = [
+        (
+            datetime.combine(day, schedule.start_time, tzinfo=timezone.utc),
+            datetime.combine(day, schedule.end_time, tzinfo=timezone.utc),
+        )
+    ]
+    midday = datetime.combine(day, HALF_DAY_BOUNDARY, tzinfo=timezone.utc)
+    day_start = datetime.combine(day, time.min, tzinfo=timezone.utc)
+    for item in time_off:
+        if item.entry_type == TimeOffEntryType.HALF_DAY_MORNING.value:
+            windows = _subtract_window(windows, (day_start, midday))
+        elif item.entry_type == TimeOffEntryType.HALF_DAY_AFTERNOON.value:
+            windows = _subtract_window(windows, (midday, day_start + timedelta(days=1)))
+        else:
+            # Full days, multi-day ranges and breaks carry no time of day, so the whole shift is blocked.
+            return []
+    return windows
+
+
+def iter_free_windows(
+    *,
+    schedule_by_day: Dict[int, WorkingHours],
+    time_off: Optional[TimeOffIntervalTree],
+    not_before: datetime,
+    search_end: datetime,
+    min_duration: timedelta,
+) -> Iterator[Window]:
+    day = not_before.date()
+    while day <= search_end.date():
+        day_time_off = time_off.overlapping(day, day) if time_off is not None else []
+        for start, end in shift_windows_for_day(day, schedule_by_day.get(day.weekday()), day_time_off):
+            start = max(start, not_before)
+            end = min(end, search_end)
+            if end - start >= min_duration:
+                yield start, end
+        day += timedelta(days=1)
+
+
+def _active_jobs_duration(jobs: Sequence[Job]) -> timedelta:
+    total = timedelta()
+    for job in jobs:
+        if job.hours_worked is not None and float(job.hours_worked) > 0:
+            total += timedelta(hours=float(job.hours_worked))
+        else:
+            total += DEFAULT_JOB_DURATION
+    return total
+
+
+class SlotSearchService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.repo = TechnicianRepository(db)
+
+    def find_earliest_slots(
+        self,
+        *,
+        zone_id: UUID,
+        skill_id: UUID,
+        limit: int = 5,
+        horizon_days: int = 7,
+        min_duration: timedelta = DEFAULT_JOB_DURATION,
+        max_slots_per_technician: int = 1,
+        now: Optional[datetime] = None,
+    ) -> List[AvailableSlotItem]:
+        search_start = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)
+        search_end = search_start + timedelta(days=min(horizon_days, MAX_SEARCH_HORIZON_DAYS))
+
+        technicians = self.repo.list_qualified_technicians(zone_id, skill_id)
+        if not technicians or limit <= 0:
+            return []
+        technician_ids = [row.id for row in technicians]
+
+        schedules: Dict[UUID, Dict[int, WorkingHours]] = {technician_id: {} for technician_id in technician_ids}
+        for row in self.repo.list_weekly_schedules_for_technicians(technician_ids):
+            schedules[row.technician_id][row.day_of_week] = row
+
+        time_off_index = TimeOffIndex(
+            technician_ids,
+            self.repo.list_active_time_off_for_technicians(technician_ids, search_start.date(), search_end.date()),
+        )
+
+        jobs_by_technician: Dict[UUID, List[Job]] = {technician_id: [] for technician_id in technician_ids}
+        for job in self.repo.list_active_jobs_for_technicians(technician_ids):
+            jobs_by_technician[job.assigned_tech_id].append(job)
+
+        generators: List[Iterator[Window]] = []
+        heap: List[Tuple[datetime, datetime, int]] = []
+        for index, technician in enumerate(technicians):
+            generator = iter_free_windows(
+                schedule_by_day=schedules[technician.id],
+                time_off=time_off_index.get(technician.id),
+                not_before=search_start + _active_jobs_duration(jobs_by_technician[technician.id]),
+                search_end=search_end,
+                min_duration=min_duration,
+            )
+            generators.append(generator)
+            first = next(generator, None)
+            if first is not None:
+                heap.append((first[0], first[1], index))
+        heapq.heapify(heap)
+
+        slots: List[AvailableSlotItem] = []
+        emitted: Dict[int, int] = {}
+        while heap and len(slots) < limit:
+            start, end, index = heapq.heappop(heap)
+            technician = technicians[index]
+            slots.append(
+                AvailableSlotItem(
+                    technician_id=technician.id,
+                    technician_name=technician.full_name or technician.name,
+                    start_at=start,
+                    end_at=end,
+                )
+            )
+            emitted[index] = emitted.get(index, 0) + 1
+            if emitted[index] < max_slots_per_technician:
+                following = next(generators[index], None)
+                if following is not None:
+                    heapq.heappush(heap, (following[0], following[1], index))
+        return slots
+
+    def find_earliest_slots_for_job(
+        self,
+        job_id: UUID,
+        *,
+        limit: int = 5,
+        horizon_days: int = 7,
+        min_duration: timedelta = DEFAULT_JOB_DURATION,
+        max_slots_per_technician: int = 1,
+        now: Optional[datetime] = None,
+    ) -> EarliestSlotsResponse:
+        job = self.repo.get_job_by_id(job_id)
+        if job is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+
+        search_start = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)
+        search_end = search_start + timedelta(days=min(horizon_days, MAX_SEARCH_HORIZON_DAYS))
+        slots: List[AvailableSlotItem] = []
+        if job.zone_id is not None and job.skill_id is not None:
+            slots = self.find_earliest_slots(
+                zone_id=job.zone_id,
+                skill_id=job.skill_id,
+                limit=limit,
+                horizon_days=horizon_days,
+                min_duration=min_duration,
+                max_slots_per_technician=max_slots_per_technician,
+                now=search_start,
+            )
+
+        return EarliestSlotsResponse(
+            job_id=job.id,
+            zone_id=job.zone_id,
+            skill_id=job.skill_id,
+            searched_from=search_start,
+            searched_until=search_end,
+            slots=slots,
+        )
@@ -0,0 +1,107 @@
+import hashlib
+import re
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from ..core.enums import TechnicianStatus, TimeOffEntryType
+from ..models.working_hours import WorkingHours
+from ..repositories.technician_repository import TechnicianRepository
+from ..schemas.technician_profile import DateRangeItem, TeamCalendarResponse, TeamCalendarTechnicianRow
+from .time_off_index import TimeOffIndex, TimeOffIntervalTree, merge_date_ranges
+
+
+MAX_CALENDAR_DAYS = 62
+FULL_DAY_ENTRY_TYPES = {TimeOffEntryType.FULL_DAY.value, TimeOffEntryType.MULTI_DAY.value}
+
+DAY_WORKING = "W"
+DAY_PARTIAL = "P"
+DAY_OFF = "O"
+DAY_UNSCHEDULED = "-"
+
+# One entity tag in an If-None-Match list; opaque tags may themselves contain commas.
+ENTITY_TAG = re.compile(r'(?:W/)?("[^"]*")')
+
+
+def calendar_etag(calendar: TeamCalendarResponse) -> str:
+    digest = hashlib.sha256(calendar.model_dump_json().encode("utf-8")).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """``If-None-Match`` check: ``*`` or any listed entity tag, compared weakly (``W/`` ignored)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tags = {tag.strip('"') for tag in ENTITY_TAG.findall(if_none_match)}
+    return etag.removeprefix("W/").strip('"') in opaque_tags
+
+
+class TeamCalendarService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.repo = TechnicianRepository(db)
+
+    def _day_code(
+        self,
+        day: date,
+        schedule_by_day: Dict[int, WorkingHours],
+        tree: Optional[TimeOffIntervalTree],
+    ) -> str:
+        schedule = schedule_by_day.get(day.weekday())
+        if schedule is None or not schedule.is_enabled:
+            return DAY_UNSCHEDULED
+        if tree is None or not tree.covers(day):
+            return DAY_WORKING
+        if any(item.entry_type in FULL_DAY_ENTRY_TYPES for item in tree.overlapping(day, day)):
+            return DAY_OFF
+        return DAY_PARTIAL
+
+    def build_calendar(self, *, from_date: date, to_date: date) -> TeamCalendarResponse:
+        if from_date > to_date:
+            raise ValueError("from_date cannot be later than to_date")
+        if (to_date - from_date).days + 1 > MAX_CALENDAR_DAYS:
+            raise ValueError(f"date range cannot exceed {MAX_CALENDAR_DAYS} days")
+
+        technicians = self.repo.list_technicians()
+        technician_ids = [row.id for row in technicians]
+
+        schedules: Dict[UUID, Dict[int, WorkingHours]] = {technician_id: {} for technician_id in technician_ids}
+        for row in self.repo.list_weekly_schedules_for_technicians(technician_ids):
+            schedules[row.technician_id][row.day_of_week] = row
+
+        time_off_index = TimeOffIndex(
+            technician_ids,
+            self.repo.list_active_time_off_for_technicians(technician_ids, from_date, to_date),
+        )
+        days = [from_date + timedelta(days=offset) for offset in range((to_date - from_date).days + 1)]
+
+        rows: List[TeamCalendarTechnicianRow] = []
+        for technician in technicians:
+            tree = time_off_index.get(technician.id)
+            if str(technician.status).lower() != TechnicianStatus.ACTIVE.value:
+                day_codes = DAY_UNSCHEDULED * len(days)
+            else:
+                day_codes = "".join(self._day_code(day, schedules[technician.id], tree) for day in days)
+
+            ranges = merge_date_ranges(
+                item for item in (tree.intervals() if tree is not None else []) if item.entry_type in FULL_DAY_ENTRY_TYPES
+            )
+            rows.append(
+                TeamCalendarTechnicianRow(
+                    technician_id=technician.id,
+                    name=technician.full_name or technician.name,
+                    status=technician.status,
+                    days=day_codes,
+                    working_days_count=day_codes.count(DAY_WORKING) + day_codes.count(DAY_PARTIAL),
+                    time_off_ranges=[
+                        DateRangeItem(start_date=max(start, from_date), end_date=min(end, to_date))
+                        for start, end in ranges
+                    ],
+                )
+            )
+
+        return TeamCalendarResponse(from_date=from_date, to_date=to_date, technicians=rows)
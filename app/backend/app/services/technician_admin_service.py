@@ -1,16 +1,24 @@
 from datetime import datetime, timezone
-from typing import Dict, List, Sequence
+from typing import Callable, Dict, Iterable, List, Sequence, Set, Tuple
 from uuid import UUID
 
 from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from ..core.enums import AuditEntityType, TimeOffEntryType, UserRole
+from ..core.enums import AuditEntityType, TechnicianStatus, TimeOffEntryType, UserRole
 from ..core.security import AuthenticatedUser
 from ..repositories.technician_repository import TechnicianRepository
 from ..schemas.technician_profile import (
     AdminTimeOffCreateRequest,
+    BulkAssignmentOperation,
+    BulkAssignmentResponse,
+    BulkAssignmentResultItem,
+    BulkAssignmentStatus,
+    BulkSkillAssignmentRequest,
+    BulkTechnicianStatusRequest,
+    BulkTechnicianStatusResponse,
+    BulkZoneAssignmentRequest,
     SkillResponse,
     SkillCreateRequest,
     TechnicianCreateRequest,
@@ -25,6 +33,7 @@ from ..schemas.technician_profile import (
 )
 from .audit_service import AuditService
 from .availability_service import AvailabilityService
+from .technician_profile_loader import TechnicianProfileLoader, build_profile_response
 
 
 class TechnicianAdminService:
@@ -67,32 +76,22 @@ class TechnicianAdminService:
             )
         return output
 
-    def _build_time_off_items(self, technician_id: UUID) -> List[TimeOffResponseItem]:
-        today = datetime.now(timezone.utc).date()
-        rows = self.repo.list_upcoming_time_off(technician_id, today)
-        return [
-            TimeOffResponseItem(
-                id=row.id,
-                technician_id=row.technician_id,
-                entry_type=row.entry_type,
-                start_date=row.start_date,
-                end_date=row.end_date,
-                reason=row.reason,
-                created_at=row.created_at,
-                cancelled_at=row.cancelled_at,
-            )
-            for row in rows
-        ]
-
     def list_technicians(self) -> List[TechnicianListItemResponse]:
-        technicians = self.repo.list_technicians()
+        # Everything per technician comes from these batched loads; the loop below must not query.
+        technicians = self.repo.list_technicians_with_assignments()
+        technician_ids = [technician.id for technician in technicians]
+        self.availability_service.load_time_off_index(technician_ids)
+        self.availability_service.load_schedule_index(technician_ids)
+        pending_email_changes = self.repo.get_pending_email_change_requests_for_technicians(technician_ids)
         results: List[TechnicianListItemResponse] = []
 
         for technician in technicians:
-            zones = [ZoneResponse(id=zone.id, name=zone.name) for zone in self.repo.list_technician_zones(technician.id)]
-            skills = [SkillResponse(id=skill.id, name=skill.name) for skill in self.repo.list_technician_skills(technician.id)]
-            pending_email_change = self.repo.get_pending_email_change_request(technician.id)
-            schedule_rows = self.repo.list_weekly_schedule(technician.id)
+            zones = [ZoneResponse(id=zone.id, name=zone.name) for zone in sorted(technician.zones, key=lambda zone: zone.name)]
+            skills = [
+                SkillResponse(id=skill.id, name=skill.name) for skill in sorted(technician.skills, key=lambda skill: skill.name)
+            ]
+            pending_email_change = pending_email_changes.get(technician.id)
+            schedule_rows = self.availability_service.weekly_schedule(technician.id)
             working_days = (
                 [int(day) for day in technician.working_days]
                 if isinstance(technician.working_days, list)
@@ -126,54 +125,17 @@ class TechnicianAdminService:
                     ),
                     zones=zones,
                     skills=skills,
-                    current_jobs_count=self.repo.get_current_jobs_count(technician.id),
+                    current_jobs_count=int(technician.active_jobs or 0),
                 )
             )
 
         return results
 
     def get_profile(self, technician_id: UUID) -> TechnicianProfileResponse:
-        technician = self._require_technician(technician_id)
-
-        zones = [ZoneResponse(id=zone.id, name=zone.name) for zone in self.repo.list_technician_zones(technician_id)]
-        skills = [SkillResponse(id=skill.id, name=skill.name) for skill in self.repo.list_technician_skills(technician_id)]
-        pending_email_change = self.repo.get_pending_email_change_request(technician_id)
-        schedule_rows = self.repo.list_weekly_schedule(technician_id)
-        working_days = (
-            [int(day) for day in technician.working_days]
-            if isinstance(technician.working_days, list)
-            else [row.day_of_week for row in schedule_rows if row.is_enabled]
-        )
-        start_time = technician.working_hours_start or next((row.start_time for row in schedule_rows if row.is_enabled), None)
-        end_time = technician.working_hours_end or next((row.end_time for row in schedule_rows if row.is_enabled), None)
-
-        return TechnicianProfileResponse(
-            id=technician.id,
-            name=technician.full_name or technician.name,
-            full_name=technician.full_name or technician.name,
-            email=technician.email,
-            phone=technician.phone,
-            profile_picture_url=technician.profile_picture_url,
-            status=technician.status,
-            manual_availability=technician.manual_availability,
-            effective_availability=self.availability_service.compute_effective_availability(technician_id),
-            on_leave_now=self.availability_service.is_on_leave_now(technician_id),
-            current_shift_window=self.availability_service.current_shift_window(technician_id),
-            next_time_off_start=self.availability_service.next_time_off_start(technician_id),
-            working_days=working_days,
-            working_hours_start=start_time,
-            working_hours_end=end_time,
-            after_hours_enabled=bool(technician.after_hours_enabled),
-            has_pending_email_change_request=pending_email_change is not None,
-            pending_email_change_request_id=pending_email_change.id if pending_email_change else None,
-            pending_email_change_requested_email=(
-                pending_email_change.requested_email if pending_email_change else None
-            ),
-            zones=zones,
-            skills=skills,
-            weekly_schedule=self._build_weekly_schedule(technician_id),
-            upcoming_time_off=self._build_time_off_items(technician_id),
-        )
+        aggregate = TechnicianProfileLoader(self.db, repository=self.repo).load(technician_id)
+        if aggregate is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Technician not found")
+        return build_profile_response(aggregate, upcoming_time_off_only=True)
 
     def create_technician(self, payload: TechnicianCreateRequest) -> TechnicianProfileResponse:
         normalized_email = payload.email.strip().lower()
@@ -227,6 +189,8 @@ class TechnicianAdminService:
         except IntegrityError as exc:
             self.db.rollback()
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Technician email already exists") from exc
+        if "status" in update_fields or "manual_availability" in update_fields:
+            self.repo.refresh_technician_job_candidates(technician_id)
 
         audit_changes = dict(update_fields)
         if "password" in audit_changes:
@@ -243,12 +207,56 @@ class TechnicianAdminService:
         self.db.commit()
         return self.get_profile(technician_id)
 
+    def bulk_update_status(self, payload: BulkTechnicianStatusRequest) -> BulkTechnicianStatusResponse:
+        if (
+            payload.technician_ids is None
+            and payload.zone_id is None
+            and payload.skill_id is None
+            and payload.current_status is None
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Provide technician_ids or at least one of zone_id, skill_id, current_status",
+            )
+
+        changes = {"status": payload.status.value}
+        # Deactivated technicians must not come back as available when they are reactivated later.
+        if payload.status == TechnicianStatus.DEACTIVATED:
+            changes["manual_availability"] = False
+        updated_ids = self.repo.bulk_update_technician_status(
+            payload.status.value,
+            technician_ids=payload.technician_ids,
+            zone_id=payload.zone_id,
+            skill_id=payload.skill_id,
+            current_status=payload.current_status.value if payload.current_status is not None else None,
+            clear_manual_availability="manual_availability" in changes,
+        )
+        self.repo.refresh_job_candidates_for_technicians(updated_ids)
+
+        AuditService.log_events(
+            self.db,
+            actor_role=UserRole.ADMIN,
+            actor_id=self.current_user.user_id,
+            events=(
+                {
+                    "action": "admin.technician.updated",
+                    "entity_type": AuditEntityType.TECHNICIAN.value,
+                    "entity_id": technician_id,
+                    "metadata": {"changes": changes, "bulk": True},
+                }
+                for technician_id in updated_ids
+            ),
+        )
+        self.db.commit()
+        return BulkTechnicianStatusResponse(updated=len(updated_ids), technician_ids=updated_ids)
+
     def add_zone(self, technician_id: UUID, zone_id: UUID) -> None:
         self._require_technician(technician_id)
         if not self.repo.zone_exists(zone_id):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Zone not found")
         if not self.repo.add_zone_assignment(technician_id, zone_id):
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Zone already assigned")
+        self.repo.refresh_technician_job_candidates(technician_id)
 
         AuditService.log_event(
             self.db,
@@ -265,6 +273,7 @@ class TechnicianAdminService:
         self._require_technician(technician_id)
         if not self.repo.remove_zone_assignment(technician_id, zone_id):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Zone assignment not found")
+        self.repo.refresh_technician_job_candidates(technician_id)
 
         AuditService.log_event(
             self.db,
@@ -283,6 +292,7 @@ class TechnicianAdminService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Skill not found")
         if not self.repo.add_skill_assignment(technician_id, skill_id):
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Skill already assigned")
+        self.repo.refresh_technician_job_candidates(technician_id)
 
         AuditService.log_event(
             self.db,
@@ -299,6 +309,7 @@ class TechnicianAdminService:
         self._require_technician(technician_id)
         if not self.repo.remove_skill_assignment(technician_id, skill_id):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Skill assignment not found")
+        self.repo.refresh_technician_job_candidates(technician_id)
 
         AuditService.log_event(
             self.db,
@@ -311,6 +322,91 @@ class TechnicianAdminService:
         )
         self.db.commit()
 
+    def bulk_update_zone_assignments(self, payload: BulkZoneAssignmentRequest) -> BulkAssignmentResponse:
+        return self._bulk_update_assignments(
+            payload.operation,
+            [(item.technician_id, item.zone_id) for item in payload.assignments],
+            target_key="zone_id",
+            find_targets=self.repo.find_existing_zone_ids,
+            add=self.repo.bulk_add_zone_assignments,
+            remove=self.repo.bulk_remove_zone_assignments,
+            target_not_found=BulkAssignmentStatus.ZONE_NOT_FOUND,
+            entity_type=AuditEntityType.TECHNICIAN_ZONE,
+            audit_action_prefix="admin.technician.zone",
+        )
+
+    def bulk_update_skill_assignments(self, payload: BulkSkillAssignmentRequest) -> BulkAssignmentResponse:
+        return self._bulk_update_assignments(
+            payload.operation,
+            [(item.technician_id, item.skill_id) for item in payload.assignments],
+            target_key="skill_id",
+            find_targets=self.repo.find_existing_skill_ids,
+            add=self.repo.bulk_add_skill_assignments,
+            remove=self.repo.bulk_remove_skill_assignments,
+            target_not_found=BulkAssignmentStatus.SKILL_NOT_FOUND,
+            entity_type=AuditEntityType.TECHNICIAN_SKILL,
+            audit_action_prefix="admin.technician.skill",
+        )
+
+    def _bulk_update_assignments(
+        self,
+        operation: BulkAssignmentOperation,
+        pairs: Sequence[Tuple[UUID, UUID]],
+        *,
+        target_key: str,
+        find_targets: Callable[[Iterable[UUID]], Set[UUID]],
+        add: Callable[[Sequence[Tuple[UUID, UUID]]], Set[Tuple[UUID, UUID]]],
+        remove: Callable[[Sequence[Tuple[UUID, UUID]]], Set[Tuple[UUID, UUID]]],
+        target_not_found: BulkAssignmentStatus,
+        entity_type: AuditEntityType,
+        audit_action_prefix: str,
+    ) -> BulkAssignmentResponse:
+        pairs = list(dict.fromkeys(pairs))
+        known_technicians = self.repo.find_existing_technician_ids(technician_id for technician_id, _ in pairs)
+        known_targets = find_targets(target_id for _, target_id in pairs)
+        valid_pairs = [pair for pair in pairs if pair[0] in known_technicians and pair[1] in known_targets]
+
+        if operation == BulkAssignmentOperation.ADD:
+            applied = add(valid_pairs)
+            applied_status, unchanged_status = BulkAssignmentStatus.ADDED, BulkAssignmentStatus.ALREADY_ASSIGNED
+        else:
+            applied = remove(valid_pairs)
+            applied_status, unchanged_status = BulkAssignmentStatus.REMOVED, BulkAssignmentStatus.NOT_ASSIGNED
+        applied_pairs = [pair for pair in valid_pairs if pair in applied]
+        self.repo.refresh_job_candidates_for_technicians(technician_id for technician_id, _ in applied_pairs)
+
+        action = f"{audit_action_prefix}_{applied_status.value}"
+        AuditService.log_events(
+            self.db,
+            actor_role=UserRole.ADMIN,
+            actor_id=self.current_user.user_id,
+            events=(
+                {
+                    "action": action,
+                    "entity_type": entity_type.value,
+                    "entity_id": technician_id,
+                    "metadata": {target_key: str(target_id), "bulk": True},
+                }
+                for technician_id, target_id in applied_pairs
+            ),
+        )
+        self.db.commit()
+
+        results = []
+        for technician_id, target_id in pairs:
+            if technician_id not in known_technicians:
+                result_status = BulkAssignmentStatus.TECHNICIAN_NOT_FOUND
+            elif target_id not in known_targets:
+                result_status = target_not_found
+            elif (technician_id, target_id) in applied:
+                result_status = applied_status
+            else:
+                result_status = unchanged_status
+            results.append(
+                BulkAssignmentResultItem(technician_id=technician_id, status=result_status, **{target_key: target_id})
+            )
+        return BulkAssignmentResponse(applied=len(applied_pairs), results=results)
+
     def update_weekly_schedule(
         self,
         technician_id: UUID,
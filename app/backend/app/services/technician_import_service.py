@@ -0,0 +1,202 @@
+import csv
+import io
+import json
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+from uuid import uuid4
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from ..core.enums import AuditEntityType, UserRole
+from ..core.security import AuthenticatedUser
+from ..repositories.technician_repository import TechnicianRepository
+from ..schemas.technician_profile import (
+    TechnicianCreateRequest,
+    TechnicianImportFormat,
+    TechnicianImportResponse,
+    TechnicianImportRowError,
+)
+from .audit_service import AuditService
+
+IMPORT_BATCH_SIZE = 500
+IMPORT_SPOOL_MEMORY_BYTES = 1024 * 1024
+MAX_IMPORT_BYTES = 50 * 1024 * 1024
+MAX_REPORTED_IMPORT_ERRORS = 1000
+IMPORT_COLUMNS = ("name", "email", "phone", "password", "status", "manual_availability")
+REQUIRED_IMPORT_COLUMNS = ("name", "email")
+
+ImportRecord = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+def resolve_import_format(content_type: Optional[str]) -> Optional[TechnicianImportFormat]:
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    if media_type in ("text/csv", "application/csv"):
+        return TechnicianImportFormat.CSV
+    if media_type in ("application/x-ndjson", "application/ndjson", "application/jsonl"):
+        return TechnicianImportFormat.NDJSON
+    return None
+
+
+def _iter_csv_records(text: io.TextIOBase) -> Iterator[ImportRecord]:
+    reader = csv.DictReader(text)
+    header = [column.strip().lower() for column in reader.fieldnames or []]
+    missing = [column for column in REQUIRED_IMPORT_COLUMNS if column not in header]
+    unknown = [column for column in header if column not in IMPORT_COLUMNS]
+    if missing or unknown:
+        detail = []
+        if missing:
+            detail.append(f"missing columns: {', '.join(missing)}")
+        if unknown:
+            detail.append(f"unknown columns: {', '.join(unknown)}")
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="; ".join(detail))
+    reader.fieldnames = header
+
+    for row in reader:
+        if None in row:
+            yield reader.line_num, None, "row has more cells than the header"
+            continue
+        # Blank cells fall back to the same defaults as an omitted JSON key.
+        yield reader.line_num, {key: value for key, value in row.items() if value not in (None, "")}, None
+
+
+def _iter_ndjson_records(text: io.TextIOBase) -> Iterator[ImportRecord]:
+    for line_number, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield line_number, None, "line is not valid JSON"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "line must be a JSON object"
+            continue
+        yield line_number, record, None
+
+
+def _format_validation_error(exc: ValidationError) -> List[str]:
+    return [
+        f"{'.'.join(str(part) for part in error['loc']) or 'row'}: {error['msg']}"
+        for error in exc.errors()
+    ]
+
+
+class TechnicianImportService:
+    """Creates technicians from a CSV or NDJSON stream in fixed-size batches.
+
+    Each batch is validated, checked for existing emails with one query, inserted
+    with one statement per chunk and committed, so memory stays bounded by the batch
+    size no matter how long the file is. Rows are validated like POST /admin/technicians.
+    """
+
+    def __init__(self, db: Session, current_user: AuthenticatedUser, batch_size: int = IMPORT_BATCH_SIZE):
+        self.db = db
+        self.current_user = current_user
+        self.repo = TechnicianRepository(db)
+        self.batch_size = batch_size
+
+    def import_stream(self, stream: BinaryIO, import_format: TechnicianImportFormat) -> TechnicianImportResponse:
+        text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+        try:
+            records = (
+                _iter_csv_records(text)
+                if import_format == TechnicianImportFormat.CSV
+                else _iter_ndjson_records(text)
+            )
+            result = TechnicianImportResponse(processed=0, created=0, failed=0, errors=[])
+            batch: List[ImportRecord] = []
+            for record in records:
+                batch.append(record)
+                if len(batch) >= self.batch_size:
+                    self._import_batch(batch, result)
+                    batch = []
+            if batch:
+                self._import_batch(batch, result)
+            return result
+        except UnicodeDecodeError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="import must be UTF-8 encoded",
+            ) from exc
+        finally:
+            text.detach()
+
+    def _import_batch(self, batch: List[ImportRecord], result: TechnicianImportResponse) -> None:
+        failures: List[TechnicianImportRowError] = []
+        candidates: List[Tuple[int, TechnicianCreateRequest]] = []
+        for line, record, parse_error in batch:
+            if parse_error is not None:
+                failures.append(TechnicianImportRowError(line=line, errors=[parse_error]))
+                continue
+            try:
+                candidates.append((line, TechnicianCreateRequest(**record)))
+            except ValidationError as exc:
+                email = record.get("email")
+                failures.append(
+                    TechnicianImportRowError(
+                        line=line,
+                        email=email if isinstance(email, str) else None,
+                        errors=_format_validation_error(exc),
+                    )
+                )
+
+        taken = self.repo.find_existing_emails(item.email for _, item in candidates)
+        rows: List[Dict[str, Any]] = []
+        lines_by_id = {}
+        for line, item in candidates:
+            if item.email in taken:
+                failures.append(TechnicianImportRowError(line=line, email=item.email, errors=["email already exists"]))
+                continue
+            taken.add(item.email)
+            technician_id = uuid4()
+            lines_by_id[technician_id] = (line, item)
+            rows.append(
+                {
+                    "id": technician_id,
+                    "name": item.name,
+                    "full_name": item.name,
+                    "email": item.email,
+                    "phone": item.phone,
+                    "password": item.password,
+                    "status": item.status.value,
+                    "manual_availability": item.manual_availability,
+                }
+            )
+
+        created_ids = self.repo.bulk_create_technicians(rows)
+        for technician_id, (line, item) in lines_by_id.items():
+            if technician_id not in created_ids:
+                failures.append(TechnicianImportRowError(line=line, email=item.email, errors=["email already exists"]))
+
+        AuditService.log_events(
+            self.db,
+            actor_role=UserRole.ADMIN,
+            actor_id=self.current_user.user_id,
+            events=(
+                {
+                    "action": "admin.technician.created",
+                    "entity_type": AuditEntityType.TECHNICIAN.value,
+                    "entity_id": row["id"],
+                    "metadata": {
+                        "name": row["name"],
+                        "email": row["email"],
+                        "status": row["status"],
+                        "manual_availability": row["manual_availability"],
+                        "import": True,
+                    },
+                }
+                for row in rows
+                if row["id"] in created_ids
+            ),
+        )
+        self.db.commit()
+
+        result.processed += len(batch)
+        result.created += len(created_ids)
+        result.failed += len(failures)
+        room = MAX_REPORTED_IMPORT_ERRORS - len(result.errors)
+        failures.sort(key=lambda item: item.line)
+        result.errors.extend(failures[: max(room, 0)])
+        if len(failures) > room:
+            result.errors_truncated = True
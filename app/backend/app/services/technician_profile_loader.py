@@ -0,0 +1,250 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, time, timezone
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ..models.technician import Technician
+from ..repositories.technician_repository import UNCOMMITTED_PROFILE_WRITES_KEY, TechnicianRepository
+from ..schemas.technician_profile import (
+    SkillResponse,
+    TechnicianProfileResponse,
+    TimeOffResponseItem,
+    WeeklyScheduleResponseItem,
+    ZoneResponse,
+)
+from .availability_service import AvailabilityInputs, compute_effective_availability_from_inputs
+
+PROFILE_CACHE_MAX_ENTRIES = 1024
+
+
+@dataclass(frozen=True)
+class TechnicianProfileAggregate:
+    """Everything a profile screen needs, detached from the session.
+
+    Clock-dependent fields (availability, leave, shift window, next time off) are
+    derived from this snapshot on every read, so a cached aggregate stays valid
+    until the technician's profile_version changes.
+    """
+
+    profile_version: int
+    id: UUID
+    name: str
+    email: str
+    phone: Optional[str]
+    profile_picture_url: Optional[str]
+    postal_code: Optional[str]
+    status: str
+    manual_availability: bool
+    working_days: Tuple[int, ...]
+    working_hours_start: Optional[time]
+    working_hours_end: Optional[time]
+    after_hours_enabled: bool
+    zones: Tuple[ZoneResponse, ...]
+    skills: Tuple[SkillResponse, ...]
+    weekly_schedule: Tuple[WeeklyScheduleResponseItem, ...]
+    time_off: Tuple[TimeOffResponseItem, ...]
+    pending_email_change_request_id: Optional[UUID]
+    pending_email_change_requested_email: Optional[str]
+
+
+class ProfileCache:
+    def __init__(self, max_entries: int = PROFILE_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[UUID, TechnicianProfileAggregate]" = OrderedDict()
+
+    def get(self, technician_id: UUID, profile_version: int) -> Optional[TechnicianProfileAggregate]:
+        with self._lock:
+            cached = self._entries.get(technician_id)
+            if cached is None or cached.profile_version != profile_version:
+                return None
+            self._entries.move_to_end(technician_id)
+            return cached
+
+    def put(self, aggregate: TechnicianProfileAggregate) -> None:
+        with self._lock:
+            current = self._entries.get(aggregate.id)
+            if current is not None and current.profile_version > aggregate.profile_version:
+                return
+            self._entries[aggregate.id] = aggregate
+            self._entries.move_to_end(aggregate.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+profile_cache = ProfileCache()
+
+
+def _build_aggregate(technician: Technician, profile_version: int) -> TechnicianProfileAggregate:
+    schedule_rows = sorted(technician.working_hours, key=lambda row: row.day_of_week)
+    by_day = {row.day_of_week: row for row in schedule_rows}
+    weekly_schedule = tuple(
+        WeeklyScheduleResponseItem(
+            day_of_week=day,
+            is_enabled=by_day[day].is_enabled,
+            start_time=by_day[day].start_time,
+            end_time=by_day[day].end_time,
+        )
+        if day in by_day
+        else WeeklyScheduleResponseItem(day_of_week=day, is_enabled=False, start_time=None, end_time=None)
+        for day in range(7)
+    )
+    working_days = (
+        [int(day) for day in technician.working_days]
+        if isinstance(technician.working_days, list)
+        else [row.day_of_week for row in schedule_rows if row.is_enabled]
+    )
+    time_off_rows = sorted(
+        (row for row in technician.time_off if row.cancelled_at is None),
+        key=lambda row: (row.start_date, row.created_at),
+    )
+    pending = max(
+        (row for row in technician.email_change_requests if row.status == "PENDING"),
+        key=lambda row: row.requested_at,
+        default=None,
+    )
+
+    return TechnicianProfileAggregate(
+        profile_version=profile_version,
+        id=technician.id,
+        name=technician.full_name or technician.name,
+        email=technician.email,
+        phone=technician.phone,
+        profile_picture_url=technician.profile_picture_url,
+        postal_code=technician.postal_code,
+        status=technician.status,
+        manual_availability=technician.manual_availability,
+        working_days=tuple(working_days),
+        working_hours_start=technician.working_hours_start
+        or next((row.start_time for row in schedule_rows if row.is_enabled), None),
+        working_hours_end=technician.working_hours_end
+        or next((row.end_time for row in schedule_rows if row.is_enabled), None),
+        after_hours_enabled=bool(technician.after_hours_enabled),
+        zones=tuple(
+            ZoneResponse(id=zone.id, name=zone.name) for zone in sorted(technician.zones, key=lambda item: item.name)
+        ),
+        skills=tuple(
+            SkillResponse(id=skill.id, name=skill.name) for skill in sorted(technician.skills, key=lambda item: item.name)
+        ),
+        weekly_schedule=weekly_schedule,
+        time_off=tuple(
+            TimeOffResponseItem(
+                id=row.id,
+                technician_id=row.technician_id,
+                entry_type=row.entry_type,
+                start_date=row.start_date,
+                end_date=row.end_date,
+                reason=row.reason,
+                created_at=row.created_at,
+                cancelled_at=row.cancelled_at,
+            )
+            for row in time_off_rows
+        ),
+        pending_email_change_request_id=pending.id if pending else None,
+        pending_email_change_requested_email=pending.requested_email if pending else None,
+    )
+
+
+def build_profile_response(
+    aggregate: TechnicianProfileAggregate,
+    *,
+    now: Optional[datetime] = None,
+    upcoming_time_off_only: bool = False,
+) -> TechnicianProfileResponse:
+    utc_now = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)
+    today: date = utc_now.date()
+    schedule = aggregate.weekly_schedule[utc_now.weekday()]
+    on_leave_now = any(item.start_date <= today <= item.end_date for item in aggregate.time_off)
+    effective_availability = compute_effective_availability_from_inputs(
+        AvailabilityInputs(
+            status=aggregate.status,
+            manual_availability=aggregate.manual_availability,
+            schedule_enabled=schedule.is_enabled,
+            start_time=schedule.start_time,
+            end_time=schedule.end_time,
+            has_active_time_off=on_leave_now,
+            current_time=utc_now.time().replace(tzinfo=None),
+        )
+    )
+    current_shift_window = (
+        f"{schedule.start_time.strftime('%H:%M')}-{schedule.end_time.strftime('%H:%M')}"
+        if schedule.is_enabled and schedule.start_time is not None and schedule.end_time is not None
+        else None
+    )
+    time_off: List[TimeOffResponseItem] = [
+        item for item in aggregate.time_off if not upcoming_time_off_only or item.end_date >= today
+    ]
+
+    return TechnicianProfileResponse(
+        id=aggregate.id,
+        name=aggregate.name,
+        full_name=aggregate.name,
+        email=aggregate.email,
+        phone=aggregate.phone,
+        profile_picture_url=aggregate.profile_picture_url,
+        postal_code=aggregate.postal_code,
+        status=aggregate.status,
+        manual_availability=aggregate.manual_availability,
+        effective_availability=effective_availability,
+        on_leave_now=on_leave_now,
+        current_shift_window=current_shift_window,
+        next_time_off_start=min((item.start_date for item in aggregate.time_off if item.start_date >= today), default=None),
+        working_days=list(aggregate.working_days),
+        working_hours_start=aggregate.working_hours_start,
+        working_hours_end=aggregate.working_hours_end,
+        after_hours_enabled=aggregate.after_hours_enabled,
+        has_pending_email_change_request=aggregate.pending_email_change_request_id is not None,
+        pending_email_change_request_id=aggregate.pending_email_change_request_id,
+        pending_email_change_requested_email=aggregate.pending_email_change_requested_email,
+        zones=list(aggregate.zones),
+        skills=list(aggregate.skills),
+        weekly_schedule=list(aggregate.weekly_schedule),
+        upcoming_time_off=time_off,
+    )
+
+
+class TechnicianProfileLoader:
+    def __init__(
+        self,
+        db: Session,
+        repository: Optional[TechnicianRepository] = None,
+        cache: Optional[ProfileCache] = None,
+    ):
+        self.db = db
+        self.repo = repository or TechnicianRepository(db)
+        self.cache = cache if cache is not None else profile_cache
+
+    def load(self, technician_id: UUID) -> Optional[TechnicianProfileAggregate]:
+        # Read the version before the rows: a concurrent write can only make the cached copy newer than its key.
+        profile_version = self.repo.get_profile_version(technician_id)
+        if profile_version is None:
+            return None
+        # This session's own uncommitted writes may still roll back, so they never touch the shared cache.
+        cacheable = technician_id not in self.db.info.get(UNCOMMITTED_PROFILE_WRITES_KEY, ())
+        if cacheable:
+            cached = self.cache.get(technician_id, profile_version)
+            if cached is not None:
+                return cached
+
+        technician = self.repo.get_technician_profile_aggregate(technician_id)
+        if technician is None:
+            return None
+        aggregate = _build_aggregate(technician, profile_version)
+        if cacheable:
+            self.cache.put(aggregate)
+        return aggregate
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _forget_uncommitted_profile_writes(session: Session) -> None:
+    session.info.pop(UNCOMMITTED_PROFILE_WRITES_KEY, None)
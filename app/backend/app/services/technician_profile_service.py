@@ -1,27 +1,46 @@
-from datetime import datetime, timezone
-from typing import List
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
-from ..core.enums import AuditEntityType, TimeOffEntryType, UserRole
+from ..core.enums import AuditEntityType, TechnicianStatus, TimeOffEntryType, UserRole
 from ..core.security import AuthenticatedUser
 from ..models.technician_email_change_request import TechnicianEmailChangeRequest
 from ..repositories.technician_repository import TechnicianRepository
 from ..schemas.technician_profile import (
+    AvailableJobItem,
+    AvailableJobsPage,
     EmailChangeRequestCreateRequest,
     EmailChangeRequestResponse,
-    SkillResponse,
     TechnicianAvailabilityUpdateRequest,
     TechnicianProfileResponse,
+    TechnicianProfileSummary,
     TechnicianProfileUpdateRequest,
-    TimeOffResponseItem,
-    WeeklyScheduleResponseItem,
-    ZoneResponse,
+    TechnicianSyncResponse,
 )
 from .audit_service import AuditService
 from .availability_service import AvailabilityService
+from .technician_profile_loader import TechnicianProfileLoader, build_profile_response
+
+# Delta syncs look back this far past the previous token, so rows written by transactions that were
+# still open when that token was issued are not missed. Re-sent rows are harmless upserts.
+SYNC_TOKEN_OVERLAP = timedelta(seconds=60)
+
+
+def encode_sync_token(profile_version: int, issued_at: datetime) -> str:
+    return f"{profile_version}.{int(issued_at.timestamp())}"
+
+
+def decode_sync_token(token: Optional[str]) -> Optional[Tuple[int, datetime]]:
+    if not token:
+        return None
+    version, _, issued_at = token.strip().removeprefix("W/").strip('"').partition(".")
+    try:
+        return int(version), datetime.fromtimestamp(int(issued_at), tz=timezone.utc)
+    except (ValueError, OverflowError, OSError):
+        return None
 
 
 class TechnicianProfileService:
@@ -37,46 +56,15 @@ class TechnicianProfileService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Technician not found")
         return technician
 
-    def _build_weekly_schedule(self, technician_id: UUID) -> List[WeeklyScheduleResponseItem]:
-        rows = self.repo.list_weekly_schedule(technician_id)
-        by_day = {
-            row.day_of_week: WeeklyScheduleResponseItem(
-                day_of_week=row.day_of_week,
-                is_enabled=row.is_enabled,
-                start_time=row.start_time,
-                end_time=row.end_time,
-            )
-            for row in rows
-        }
-        return [
-            by_day.get(
-                day,
-                WeeklyScheduleResponseItem(day_of_week=day, is_enabled=False, start_time=None, end_time=None),
-            )
-            for day in range(7)
-        ]
-
-    def _build_time_off_items(self, technician_id: UUID) -> List[TimeOffResponseItem]:
-        rows = self.repo.list_non_cancelled_time_off(technician_id)
-        return [
-            TimeOffResponseItem(
-                id=row.id,
-                technician_id=row.technician_id,
-                entry_type=row.entry_type,
-                start_date=row.start_date,
-                end_date=row.end_date,
-                reason=row.reason,
-                created_at=row.created_at,
-                cancelled_at=row.cancelled_at,
-            )
-            for row in rows
-        ]
-
-    def _to_email_change_response(self, row: TechnicianEmailChangeRequest) -> EmailChangeRequestResponse:
-        technician = self.repo.get_technician_by_id(row.technician_id)
-        technician_name = None
-        if technician is not None:
-            technician_name = technician.full_name or technician.name
+    def _to_email_change_response(
+        self,
+        row: TechnicianEmailChangeRequest,
+        technician_name: Optional[str] = None,
+    ) -> EmailChangeRequestResponse:
+        if technician_name is None:
+            technician = self.repo.get_technician_by_id(row.technician_id)
+            if technician is not None:
+                technician_name = technician.full_name or technician.name
         return EmailChangeRequestResponse(
             id=row.id,
             technician_id=row.technician_id,
@@ -91,44 +79,52 @@ class TechnicianProfileService:
         )
 
     def get_profile(self) -> TechnicianProfileResponse:
-        technician = self._require_technician()
-        technician_id = technician.id
-        zones = [ZoneResponse(id=zone.id, name=zone.name) for zone in self.repo.list_technician_zones(technician_id)]
-        skills = [SkillResponse(id=skill.id, name=skill.name) for skill in self.repo.list_technician_skills(technician_id)]
-        pending = self.repo.get_pending_email_change_request(technician_id)
-        schedule_rows = self.repo.list_weekly_schedule(technician_id)
-        working_days = (
-            [int(day) for day in technician.working_days]
-            if isinstance(technician.working_days, list)
-            else [row.day_of_week for row in schedule_rows if row.is_enabled]
-        )
-        start_time = technician.working_hours_start or next((row.start_time for row in schedule_rows if row.is_enabled), None)
-        end_time = technician.working_hours_end or next((row.end_time for row in schedule_rows if row.is_enabled), None)
+        aggregate = TechnicianProfileLoader(self.db, repository=self.repo).load(self.current_user.user_id)
+        if aggregate is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Technician not found")
+        return build_profile_response(aggregate)
+
+    def is_sync_current(self, token: Optional[str]) -> bool:
+        decoded = decode_sync_token(token)
+        return decoded is not None and decoded[0] == self.repo.get_profile_version(self.current_user.user_id)
 
-        return TechnicianProfileResponse(
-            id=technician_id,
-            name=technician.full_name or technician.name,
-            full_name=technician.full_name or technician.name,
-            email=technician.email,
-            phone=technician.phone,
-            profile_picture_url=technician.profile_picture_url,
-            status=technician.status,
-            manual_availability=technician.manual_availability,
-            effective_availability=self.availability_service.compute_effective_availability(technician_id),
-            on_leave_now=self.availability_service.is_on_leave_now(technician_id),
-            current_shift_window=self.availability_service.current_shift_window(technician_id),
-            next_time_off_start=self.availability_service.next_time_off_start(technician_id),
-            working_days=working_days,
-            working_hours_start=start_time,
-            working_hours_end=end_time,
-            after_hours_enabled=bool(technician.after_hours_enabled),
-            has_pending_email_change_request=pending is not None,
-            pending_email_change_request_id=pending.id if pending else None,
-            pending_email_change_requested_email=pending.requested_email if pending else None,
-            zones=zones,
-            skills=skills,
-            weekly_schedule=self._build_weekly_schedule(technician_id),
-            upcoming_time_off=self._build_time_off_items(technician_id),
+    def get_sync_bundle(self, since: Optional[str] = None) -> TechnicianSyncResponse:
+        technician_id = self.current_user.user_id
+        # Stamped before reading, so anything written while this bundle is built lands in the next delta.
+        issued_at = self.repo.get_database_now()
+        aggregate = TechnicianProfileLoader(self.db, repository=self.repo).load(technician_id)
+        if aggregate is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Technician not found")
+        profile = build_profile_response(aggregate)
+
+        decoded = decode_sync_token(since)
+        full_sync = decoded is None or decoded[0] > aggregate.profile_version
+        if full_sync:
+            weekly_schedule = profile.weekly_schedule
+            time_off = profile.upcoming_time_off
+            email_rows = self.repo.list_email_change_requests(technician_id=technician_id)
+        elif decoded[0] == aggregate.profile_version:
+            weekly_schedule, time_off, email_rows = [], [], []
+        else:
+            changed_since = decoded[1] - SYNC_TOKEN_OVERLAP
+            changed_days = {
+                row.day_of_week for row in self.repo.list_weekly_schedule(technician_id, changed_since=changed_since)
+            }
+            changed_time_off = {
+                row.id for row in self.repo.list_non_cancelled_time_off(technician_id, changed_since=changed_since)
+            }
+            weekly_schedule = [item for item in profile.weekly_schedule if item.day_of_week in changed_days]
+            time_off = [item for item in profile.upcoming_time_off if item.id in changed_time_off]
+            email_rows = self.repo.list_email_change_requests(technician_id=technician_id, changed_since=changed_since)
+
+        return TechnicianSyncResponse(
+            sync_token=encode_sync_token(aggregate.profile_version, issued_at),
+            full_sync=full_sync,
+            profile=TechnicianProfileSummary(**profile.model_dump(exclude={"weekly_schedule", "upcoming_time_off"})),
+            weekly_schedule=weekly_schedule,
+            time_off=time_off,
+            time_off_ids=[item.id for item in profile.upcoming_time_off],
+            email_change_requests=[self._to_email_change_response(row, profile.name) for row in email_rows],
         )
 
     def update_profile(self, payload: TechnicianProfileUpdateRequest) -> TechnicianProfileResponse:
@@ -276,3 +272,32 @@ class TechnicianProfileService:
         self._require_technician()
         rows = self.repo.list_email_change_requests(technician_id=self.current_user.user_id)
         return [self._to_email_change_response(row) for row in rows]
+
+    def list_available_jobs(self, *, after: Optional[UUID] = None, limit: int = 20) -> AvailableJobsPage:
+        technician = self._require_technician()
+        if (
+            str(technician.status).lower() != TechnicianStatus.ACTIVE.value
+            or not technician.manual_availability
+        ):
+            return AvailableJobsPage(items=[], next_cursor=None)
+        if after is not None and self.repo.get_job_by_id(after) is None:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Feed cursor is no longer valid")
+
+        rows = self.repo.list_job_feed(technician.id, after_job_id=after, limit=limit + 1)
+        page = rows[:limit]
+        return AvailableJobsPage(
+            items=[
+                AvailableJobItem(
+                    job_id=job.id,
+                    job_code=job.job_code,
+                    service_type=job.service_type,
+                    zone_id=job.zone_id,
+                    skill_id=job.skill_id,
+                    customer_city=job.customer_city,
+                    created_at=job.created_at,
+                    version=job.version,
+                )
+                for job in page
+            ],
+            next_cursor=page[-1].id if len(rows) > limit else None,
+        )
@@ -8,6 +8,7 @@ from ..repositories.technician_repository import TechnicianRepository
 from ..models.job import Job
 from ..models.technician import Technician
 from .audit_service import AuditService
+from .job_acceptance_service import JobAcceptanceService
 from fastapi import HTTPException, status
 
 class TechnicianService:
@@ -185,67 +186,14 @@ class TechnicianService:
         job = self.db.query(Job).filter(Job.id == job_id).first()
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
-        return self.repo.get_eligible_technicians(job)
+        return self.repo.list_candidate_technicians(job.id)
 
     def accept_job(self, tech_id: UUID, job_id: UUID):
         """
-        Transaction-safe job acceptance logic.
+        Job acceptance via compare-and-set on the job version (no row locks).
         """
-        job = self.db.query(Job).filter(Job.id == job_id).with_for_update().first()
-
-        if not job:
-            raise HTTPException(status_code=404, detail="Job not found")
-
-        if job.status != "READY_FOR_TECH_ACCEPTANCE":
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Job is in state {job.status}, not READY_FOR_TECH_ACCEPTANCE"
-            )
-
-        # Lock technician row so concurrent accepts for the same tech serialize.
-        tech = self.repo.get_by_id_for_update(tech_id)
-        if not tech or tech.status != "ACTIVE":
-            raise HTTPException(status_code=400, detail="Technician is not active")
-
-        now_utc = datetime.now(timezone.utc)
-        if not self.repo.is_technician_eligible_for_job(tech_id, job, now_utc=now_utc):
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Technician is no longer eligible for this job",
-            )
-
-        # Check concurrent jobs again while the technician row is locked.
-        active_count = (
-            self.db.query(Job)
-            .filter(
-                Job.assigned_tech_id == tech_id,
-                Job.status.in_(["ASSIGNED", "IN_PROGRESS", "DELAYED"])
-            )
-            .count()
-        )
-
-        if active_count >= tech.max_active_jobs:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Technician exceeded max concurrent jobs ({tech.max_active_jobs})"
-            )
-
-        # Update job
-        job.assigned_tech_id = tech_id
-        job.status = "ASSIGNED"
-        
-        AuditService.log_event(
-            self.db, 
-            actor=self.current_user, 
-            action="JOB_ACCEPTED", 
-            target_id=job_id, 
-            target_type="JOB",
-            payload={"tech_id": str(tech_id)}
-        )
-
-        self.db.commit()
-        self.db.refresh(job)
-        return job
+        JobAcceptanceService(self.db).accept_job(tech_id, job_id)
+        return self.db.query(Job).filter(Job.id == job_id).first()
 
     def reject_job(self, tech_id: UUID, job_id: UUID, reason: Optional[str] = None):
         """
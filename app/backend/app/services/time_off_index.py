@@ -0,0 +1,119 @@
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class TimeOffInterval:
+    start_date: date
+    end_date: date
+    time_off_id: Optional[UUID] = None
+    entry_type: Optional[str] = None
+
+
+def merge_date_ranges(intervals: Iterable[TimeOffInterval]) -> List[Tuple[date, date]]:
+    merged: List[Tuple[date, date]] = []
+    for item in sorted(intervals, key=lambda value: (value.start_date, value.end_date)):
+        if merged and item.start_date <= merged[-1][1] + timedelta(days=1):
+            if item.end_date > merged[-1][1]:
+                merged[-1] = (merged[-1][0], item.end_date)
+        else:
+            merged.append((item.start_date, item.end_date))
+    return merged
+
+
+class TimeOffIntervalTree:
+    """Static interval tree over inclusive date ranges.
+
+    Intervals are kept sorted by start date and treated as an implicit balanced
+    binary tree (each node is the midpoint of its slice). Every node stores the
+    latest end date in its subtree, so overlap queries prune whole subtrees and
+    run in O(log n + k).
+    """
+
+    def __init__(self, intervals: Iterable[TimeOffInterval] = ()):
+        self._intervals: List[TimeOffInterval] = sorted(
+            intervals,
+            key=lambda item: (item.start_date, item.end_date),
+        )
+        self._starts: List[date] = [item.start_date for item in self._intervals]
+        self._max_end: List[Optional[date]] = [None] * len(self._intervals)
+        self._build(0, len(self._intervals))
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def intervals(self) -> List[TimeOffInterval]:
+        return list(self._intervals)
+
+    def _build(self, lo: int, hi: int) -> Optional[date]:
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        max_end = self._intervals[mid].end_date
+        for child_end in (self._build(lo, mid), self._build(mid + 1, hi)):
+            if child_end is not None and child_end > max_end:
+                max_end = child_end
+        self._max_end[mid] = max_end
+        return max_end
+
+    def _collect(self, lo: int, hi: int, start: date, end: date, output: List[TimeOffInterval], limit: Optional[int]) -> None:
+        if lo >= hi or (limit is not None and len(output) >= limit):
+            return
+        mid = (lo + hi) // 2
+        if self._max_end[mid] < start:
+            return
+        self._collect(lo, mid, start, end, output, limit)
+        if self._starts[mid] > end:
+            return
+        if self._intervals[mid].end_date >= start and (limit is None or len(output) < limit):
+            output.append(self._intervals[mid])
+        self._collect(mid + 1, hi, start, end, output, limit)
+
+    def overlapping(self, start: date, end: date) -> List[TimeOffInterval]:
+        output: List[TimeOffInterval] = []
+        self._collect(0, len(self._intervals), start, end, output, None)
+        return output
+
+    def overlaps(self, start: date, end: date) -> bool:
+        output: List[TimeOffInterval] = []
+        self._collect(0, len(self._intervals), start, end, output, 1)
+        return bool(output)
+
+    def covers(self, day: date) -> bool:
+        return self.overlaps(day, day)
+
+    def next_start_on_or_after(self, day: date) -> Optional[date]:
+        index = bisect_left(self._starts, day)
+        if index >= len(self._starts):
+            return None
+        return self._starts[index]
+
+
+class TimeOffIndex:
+    """Per-technician interval trees for a known set of technicians.
+
+    Technicians passed in ``technician_ids`` without rows get an empty tree, so a
+    lookup hit is authoritative and callers only fall back to the database for
+    technicians outside the loaded set.
+    """
+
+    def __init__(self, technician_ids: Iterable[UUID], rows: Iterable) -> None:
+        grouped: Dict[UUID, List[TimeOffInterval]] = {technician_id: [] for technician_id in technician_ids}
+        for row in rows:
+            grouped.setdefault(row.technician_id, []).append(
+                TimeOffInterval(
+                    start_date=row.start_date,
+                    end_date=row.end_date,
+                    time_off_id=row.id,
+                    entry_type=row.entry_type,
+                )
+            )
+        self._trees: Dict[UUID, TimeOffIntervalTree] = {
+            technician_id: TimeOffIntervalTree(items) for technician_id, items in grouped.items()
+        }
+
+    def get(self, technician_id: UUID) -> Optional[TimeOffIntervalTree]:
+        return self._trees.get(technician_id)
@@ -0,0 +1,3 @@
+-- Supports active-leave, overlap and next-time-off range lookups per technician.
+CREATE INDEX IF NOT EXISTS ix_technician_time_off_active_range
+    ON technician_time_off (technician_id, cancelled_at, start_date, end_date);
@@ -0,0 +1,8 @@
+-- Backfill the maintained technicians.active_jobs counter (column added by scripts/migrate.py schema sync).
+UPDATE technicians
+SET active_jobs = (
+    SELECT COUNT(*)
+    FROM jobs
+    WHERE jobs.assigned_tech_id = technicians.id
+      AND UPPER(jobs.status) IN ('ASSIGNED', 'IN_PROGRESS', 'DELAYED')
+);
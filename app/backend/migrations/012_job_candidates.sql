@@ -0,0 +1,19 @@
+-- Backfill materialized broadcast candidates (table created by scripts/migrate.py schema sync).
+DELETE FROM job_candidates;
+
+INSERT INTO job_candidates (job_id, technician_id)
+SELECT jobs.id, technicians.id
+FROM jobs
+JOIN technician_zones ON technician_zones.zone_id = jobs.zone_id
+JOIN technician_skills ON technician_skills.skill_id = jobs.skill_id
+    AND technician_skills.technician_id = technician_zones.technician_id
+JOIN technicians ON technicians.id = technician_zones.technician_id
+WHERE UPPER(TRIM(jobs.status)) = 'READY_FOR_TECH_ACCEPTANCE'
+  AND technicians.status = 'active'
+  AND technicians.manual_availability = TRUE
+  AND NOT EXISTS (
+      SELECT 1
+      FROM job_rejections
+      WHERE job_rejections.job_id = jobs.id
+        AND job_rejections.tech_id = technicians.id
+  );
@@ -0,0 +1,6 @@
+-- Technician job feed: rejection anti-join probes by technician, feed pages walk ready jobs by (created_at, id).
+CREATE UNIQUE INDEX IF NOT EXISTS ux_job_rejections_tech_job
+    ON job_rejections (tech_id, job_id);
+
+CREATE INDEX IF NOT EXISTS ix_jobs_status_created_at
+    ON jobs (status, created_at, id);
@@ -0,0 +1,8 @@
+-- Backfill updated_at (columns added by scripts/migrate.py schema sync) so offline sync deltas have a baseline.
+UPDATE technician_working_hours
+SET updated_at = CURRENT_TIMESTAMP
+WHERE updated_at IS NULL;
+
+UPDATE technician_time_off
+SET updated_at = COALESCE(cancelled_at, created_at)
+WHERE updated_at IS NULL;
@@ -0,0 +1,28 @@
+-- Secondary indexes for report ranges, invoice/job joins, technician workloads and audit history.
+-- technician_working_hours (technician_id, day_of_week) is already covered by working_hours_technician_day_uq.
+CREATE INDEX IF NOT EXISTS ix_jobs_created_at
+    ON jobs (created_at);
+
+CREATE INDEX IF NOT EXISTS ix_jobs_assigned_tech_status
+    ON jobs (assigned_tech_id, status);
+
+CREATE INDEX IF NOT EXISTS ix_jobs_invoice_created_at
+    ON jobs (invoice_id, created_at);
+
+CREATE INDEX IF NOT EXISTS ix_jobs_dealership_id
+    ON jobs (dealership_id);
+
+CREATE INDEX IF NOT EXISTS ix_job_rejections_rejected_at
+    ON job_rejections (rejected_at);
+
+CREATE INDEX IF NOT EXISTS ix_invoices_created_at
+    ON invoices (created_at);
+
+CREATE INDEX IF NOT EXISTS ix_invoices_status_due_date
+    ON invoices (status, due_date);
+
+CREATE INDEX IF NOT EXISTS ix_invoice_line_items_invoice_id
+    ON invoice_line_items (invoice_id);
+
+CREATE INDEX IF NOT EXISTS ix_audit_logs_entity
+    ON audit_logs (entity_type, entity_id, created_at);
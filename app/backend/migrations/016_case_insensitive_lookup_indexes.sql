@@ -0,0 +1,12 @@
+-- Expression indexes for lookups that compare lower(column): login, signup, and zone/skill name checks.
+CREATE INDEX IF NOT EXISTS ix_technicians_email_lower
+    ON technicians (lower(email));
+
+CREATE INDEX IF NOT EXISTS ix_technician_signup_requests_email_lower
+    ON technician_signup_requests (lower(email));
+
+CREATE INDEX IF NOT EXISTS ix_zones_name_lower
+    ON zones (lower(name));
+
+CREATE INDEX IF NOT EXISTS ix_skills_name_lower
+    ON skills (lower(name));
@@ -0,0 +1,4 @@
+-- Columns added to the models after their tables first shipped (technician profile, dispatch job,
+-- invoice mapping and geocoding fields). The runner adds any that an older SQLite database lacks,
+-- using the list on this migration in app/core/db_migrations.py; fresh databases get them from the models.
+SELECT 1;
@@ -0,0 +1,173 @@
+import argparse
+import asyncio
+import pathlib
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time as clock
+from uuid import uuid4
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
+BACKEND_ROOT = SCRIPT_DIR.parent
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.core.enums import UserRole
+from app.core.security import AuthenticatedUser
+from app.models.base import Base
+from app.models.technician import Technician
+from app.services.technician_profile_service import TechnicianProfileService
+
+# Starlette runs sync endpoints on anyio's default limiter of 40 worker threads.
+THREADPOOL_LIMIT = 40
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare sync and async endpoints serving GET /technicians/me under rising concurrency",
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=500.0,
+        help="wait added to every statement to stand in for slow queries or a remote database under load",
+    )
+    parser.add_argument("--requests", type=int, default=480, help="requests per concurrency level")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[40, 80, 160],
+        help="concurrent clients to measure",
+    )
+    return parser.parse_args()
+
+
+def latency_connection_factory(latency_seconds: float):
+    """sqlite3 connection class whose cursors wait before every statement, in the driver's own thread."""
+
+    class LatencyCursor(sqlite3.Cursor):
+        def execute(self, *args, **kwargs):
+            clock.sleep(latency_seconds)
+            return super().execute(*args, **kwargs)
+
+        def executemany(self, *args, **kwargs):
+            clock.sleep(latency_seconds)
+            return super().executemany(*args, **kwargs)
+
+    class LatencyConnection(sqlite3.Connection):
+        def cursor(self, factory=LatencyCursor):
+            return super().cursor(factory)
+
+    return LatencyConnection
+
+
+def build_app(sync_factory, async_factory, current_user: AuthenticatedUser) -> FastAPI:
+    app = FastAPI()
+
+    def get_sync_db():
+        with sync_factory() as db:
+            yield db
+
+    async def get_async_db():
+        async with async_factory() as db:
+            yield db
+
+    @app.get("/sync")
+    def sync_profile(db: Session = Depends(get_sync_db)):
+        return TechnicianProfileService(db, current_user).get_profile()
+
+    @app.get("/async")
+    async def async_profile(db: AsyncSession = Depends(get_async_db)):
+        return await db.run_sync(lambda session: TechnicianProfileService(session, current_user).get_profile())
+
+    return app
+
+
+async def measure(app: FastAPI, path: str, concurrency: int, total: int):
+    latencies = []
+    queue = iter(range(total))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        # Open the pool's connections and warm the profile cache outside the timed run.
+        await asyncio.gather(*(client.get(path) for _ in range(concurrency)))
+
+        async def worker():
+            for _ in queue:
+                started = clock.perf_counter()
+                response = await client.get(path)
+                response.raise_for_status()
+                latencies.append(clock.perf_counter() - started)
+
+        started = clock.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = clock.perf_counter() - started
+    return elapsed, sorted(latencies)
+
+
+def run() -> None:
+    args = parse_args()
+    largest = max(args.concurrency)
+    with tempfile.TemporaryDirectory() as scratch:
+        path = pathlib.Path(scratch, "bench.sqlite3").as_posix()
+        connect_args = {
+            "check_same_thread": False,
+            "timeout": 30,
+            "factory": latency_connection_factory(args.latency_ms / 1000),
+        }
+        # Pools are sized past the largest level so only the request model limits concurrency.
+        pool = {"pool_size": largest, "max_overflow": 0}
+        engine = create_engine(f"sqlite:///{path}", connect_args=connect_args, **pool)
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}", connect_args=connect_args, **pool)
+        Base.metadata.create_all(bind=engine)
+        sync_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+        technician_id = uuid4()
+        with sync_factory() as session:
+            session.add(
+                Technician(
+                    id=technician_id,
+                    name="Bench Tech",
+                    full_name="Bench Tech",
+                    email=f"bench-{technician_id.hex[:12]}@example.com",
+                    phone="+14185550100",
+                    status="active",
+                    manual_availability=True,
+                )
+            )
+            session.commit()
+
+        app = build_app(
+            sync_factory,
+            async_sessionmaker(async_engine, autoflush=False),
+            AuthenticatedUser(user_id=technician_id, role=UserRole.TECHNICIAN),
+        )
+
+        async def scenario():
+            for concurrency in args.concurrency:
+                for label, route in (("sync def", "/sync"), ("async def", "/async")):
+                    elapsed, samples = await measure(app, route, concurrency, args.requests)
+                    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+                    print(
+                        f"{label:>9} x{concurrency:<4} {len(samples) / elapsed:7.0f} req/s  "
+                        f"median {statistics.median(samples) * 1000:6.1f}ms  p95 {p95 * 1000:6.1f}ms"
+                    )
+            await async_engine.dispose()
+
+        print(f"simulated database latency: {args.latency_ms:g}ms per statement")
+        print(f"sync endpoints share {THREADPOOL_LIMIT} worker threads; async endpoints are bounded by the pool")
+        print("the client runs in the same process, so both are also capped by its CPU")
+        asyncio.run(scenario())
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    run()
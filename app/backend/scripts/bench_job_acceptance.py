@@ -0,0 +1,196 @@
+import argparse
+import pathlib
+import statistics
+import sys
+import tempfile
+import threading
+import time as clock
+from concurrent.futures import ThreadPoolExecutor
+from datetime import time
+from uuid import uuid4
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm.exc import StaleDataError
+
+SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
+BACKEND_ROOT = SCRIPT_DIR.parent
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.models.base import Base
+from app.models.job import Job
+from app.models.skill import Skill, technician_skills
+from app.models.technician import Technician
+from app.models.working_hours import WorkingHours
+from app.models.zone import Zone, technician_zones
+from app.services.job_acceptance_service import JobAcceptanceService
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Race many technicians to accept the same jobs and report contention behaviour",
+    )
+    parser.add_argument("--database-url", help="database to benchmark against (default: temporary SQLite file)")
+    parser.add_argument("--technicians", type=int, default=16, help="concurrent technicians per job")
+    parser.add_argument("--jobs", type=int, default=50, help="number of jobs to race for, per strategy")
+    return parser.parse_args()
+
+
+def get_engine(database_url: str):
+    is_sqlite = database_url.startswith("sqlite")
+    return create_engine(
+        database_url,
+        connect_args={"check_same_thread": False, "timeout": 30} if is_sqlite else {},
+    )
+
+
+def seed(session: Session, technician_count: int, job_count: int):
+    zone = Zone(id=uuid4(), name=f"Bench Zone {uuid4().hex[:8]}")
+    skill = Skill(id=uuid4(), name=f"Bench Skill {uuid4().hex[:8]}")
+    session.add_all([zone, skill])
+    session.flush()
+
+    technician_ids = []
+    for index in range(technician_count):
+        technician = Technician(
+            id=uuid4(),
+            name=f"Bench Tech {index}",
+            full_name=f"Bench Tech {index}",
+            email=f"bench-{uuid4().hex[:12]}@example.com",
+            phone="+14185550100",
+            status="active",
+            manual_availability=True,
+        )
+        session.add(technician)
+        session.flush()
+        session.execute(technician_zones.insert().values(technician_id=technician.id, zone_id=zone.id))
+        session.execute(technician_skills.insert().values(technician_id=technician.id, skill_id=skill.id))
+        for day in range(7):
+            session.add(
+                WorkingHours(
+                    technician_id=technician.id,
+                    day_of_week=day,
+                    is_enabled=True,
+                    start_time=time.min,
+                    end_time=time.max,
+                )
+            )
+        technician_ids.append(technician.id)
+
+    job_ids = []
+    for index in range(job_count):
+        job = Job(
+            id=uuid4(),
+            job_code=f"BENCH-{uuid4().hex[:8]}",
+            status="READY_FOR_TECH_ACCEPTANCE",
+            zone_id=zone.id,
+            skill_id=skill.id,
+        )
+        session.add(job)
+        job_ids.append(job.id)
+    session.commit()
+    return technician_ids, job_ids
+
+
+def accept_with_row_locks(session: Session, technician_id, job_id) -> bool:
+    """The acceptance flow before optimistic versioning: lock the job, then the technician, then write."""
+    job = session.execute(select(Job).where(Job.id == job_id).with_for_update()).scalar_one()
+    if job.status != "READY_FOR_TECH_ACCEPTANCE":
+        session.rollback()
+        return False
+    technician = session.execute(select(Technician).where(Technician.id == technician_id).with_for_update()).scalar_one()
+    job.assigned_tech_id = technician_id
+    job.status = "ASSIGNED"
+    technician.active_jobs = (technician.active_jobs or 0) + 1
+    try:
+        session.commit()
+    except (OperationalError, StaleDataError):
+        # Only reachable without real row locks (SQLite): the job's version column rejects the lost update.
+        session.rollback()
+        return False
+    return True
+
+
+def accept_with_compare_and_set(session: Session, technician_id, job_id) -> bool:
+    # Capacity is not what is being measured here, so each technician may hold every job.
+    try:
+        JobAcceptanceService(session, max_active_jobs=sys.maxsize).accept_job(technician_id, job_id)
+    except HTTPException:
+        return False
+    return True
+
+
+STRATEGIES = (
+    ("row locks (SELECT ... FOR UPDATE)", accept_with_row_locks),
+    ("compare-and-set (current)", accept_with_compare_and_set),
+)
+
+
+def race(session_factory, accept, technician_ids, job_id):
+    barrier = threading.Barrier(len(technician_ids))
+
+    def attempt(technician_id):
+        with session_factory() as session:
+            barrier.wait()
+            started = clock.perf_counter()
+            won = accept(session, technician_id, job_id)
+            return won, clock.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=len(technician_ids)) as pool:
+        return list(pool.map(attempt, technician_ids))
+
+
+def run_strategy(label, accept, session_factory, technician_ids, job_ids) -> None:
+    winner_latencies = []
+    loser_latencies = []
+    double_assigned = 0
+    unassigned = 0
+    started = clock.perf_counter()
+    for job_id in job_ids:
+        results = race(session_factory, accept, technician_ids, job_id)
+        winners = sum(1 for won, _ in results if won)
+        double_assigned += winners > 1
+        unassigned += winners == 0
+        winner_latencies.extend(elapsed for won, elapsed in results if won)
+        loser_latencies.extend(elapsed for won, elapsed in results if not won)
+    elapsed = clock.perf_counter() - started
+
+    attempts = len(job_ids) * len(technician_ids)
+    print(f"{label}:")
+    print(f"  {attempts} accept attempts over {len(job_ids)} jobs in {elapsed:.2f}s ({attempts / elapsed:.0f} attempts/s)")
+    print(f"  jobs with more than one winner: {double_assigned}")
+    print(f"  jobs with no winner: {unassigned}")
+    for kind, samples in (("winner", winner_latencies), ("loser", loser_latencies)):
+        if samples:
+            samples.sort()
+            p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+            print(
+                f"  {kind} latency: median {statistics.median(samples) * 1000:.1f}ms "
+                f"p95 {p95 * 1000:.1f}ms max {samples[-1] * 1000:.1f}ms"
+            )
+
+
+def run() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as scratch:
+        database_url = args.database_url or f"sqlite:///{pathlib.Path(scratch, 'bench.sqlite3').as_posix()}"
+        engine = get_engine(database_url)
+        Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+        print(f"database: {database_url}")
+        if engine.dialect.name == "sqlite":
+            # SQLite has no row locks, so the old flow is not even safe there; use --database-url for PostgreSQL.
+            print("note: SQLite ignores FOR UPDATE; the row-lock numbers are only meaningful on PostgreSQL")
+        for label, accept in STRATEGIES:
+            with session_factory() as session:
+                technician_ids, job_ids = seed(session, args.technicians, args.jobs)
+            run_strategy(label, accept, session_factory, technician_ids, job_ids)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    run()
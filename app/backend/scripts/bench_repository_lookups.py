@@ -0,0 +1,174 @@
+import argparse
+import pathlib
+import sys
+import time as clock
+from datetime import date, time, timedelta
+from uuid import uuid4
+
+from sqlalchemy import and_, create_engine, func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
+BACKEND_ROOT = SCRIPT_DIR.parent
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.models import *  # noqa: F401,F403
+from app.models.base import Base
+from app.models.dealership import Dealership
+from app.models.skill import Skill, technician_skills
+from app.models.technician import Technician
+from app.models.time_off import TimeOff
+from app.models.working_hours import WorkingHours
+from app.models.zone import Zone, technician_zones
+from app.repositories.dealership_repository import DealershipRepository
+from app.repositories.technician_repository import TechnicianRepository
+
+FRESH_SESSION_LOOKUPS = {"technician by id"}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Per-call overhead of hot repository lookups: legacy db.query() chains vs cached lambda statements",
+    )
+    parser.add_argument("--calls", type=int, default=5000, help="calls per lookup and variant")
+    return parser.parse_args()
+
+
+def seed(db: Session):
+    zone = Zone(name="Quebec")
+    skill = Skill(name="PPF")
+    technician = Technician(
+        id=uuid4(),
+        name="Bench Tech",
+        email="bench@example.com",
+        status="active",
+        manual_availability=True,
+        zones=[zone],
+        skills=[skill],
+    )
+    db.add_all([technician, Dealership(code="D-001", name="Bench Dealership", status="active")])
+    db.add(WorkingHours(technician=technician, day_of_week=2, is_enabled=True, start_time=time(8), end_time=time(16)))
+    today = date.today()
+    db.add(
+        TimeOff(
+            technician=technician,
+            entry_type="multi_day",
+            start_date=today + timedelta(days=7),
+            end_date=today + timedelta(days=9),
+            reason="Bench",
+        )
+    )
+    db.commit()
+    return technician.id, zone.id, skill.id, today
+
+
+def lookups(technician_id, zone_id, skill_id, today):
+    """(name, legacy query chain as the repositories used to build it, current repository call).
+
+    By-id lookups go through the identity cache, and that cache returns instances already in the
+    session. ``FRESH_SESSION_LOOKUPS`` therefore run every call in a new session, so both variants
+    run their SQL.
+    """
+    return [
+        (
+            "technician by id",
+            lambda db: db.query(Technician).filter(Technician.id == technician_id).first(),
+            lambda db: TechnicianRepository(db).get_technician_by_id(technician_id),
+        ),
+        (
+            "technician by email",
+            lambda db: db.query(Technician).filter(func.lower(Technician.email) == "bench@example.com").first(),
+            lambda db: TechnicianRepository(db).get_technician_by_email("Bench@Example.com"),
+        ),
+        (
+            "email exists",
+            lambda db: db.query(Technician.id).filter(func.lower(Technician.email) == "bench@example.com").first(),
+            lambda db: TechnicianRepository(db).email_exists("bench@example.com"),
+        ),
+        (
+            "working hours for day",
+            lambda db: db.query(WorkingHours)
+            .filter(WorkingHours.technician_id == technician_id, WorkingHours.day_of_week == 2)
+            .first(),
+            lambda db: TechnicianRepository(db).get_working_hours_for_day(technician_id, 2),
+        ),
+        (
+            "active time off",
+            lambda db: db.query(TimeOff.id)
+            .filter(
+                TimeOff.technician_id == technician_id,
+                TimeOff.cancelled_at.is_(None),
+                TimeOff.start_date <= today,
+                TimeOff.end_date >= today,
+            )
+            .first(),
+            lambda db: TechnicianRepository(db).has_active_time_off(technician_id, today),
+        ),
+        (
+            "zone match",
+            lambda db: db.execute(
+                select(technician_zones.c.technician_id).where(
+                    and_(technician_zones.c.technician_id == technician_id, technician_zones.c.zone_id == zone_id)
+                )
+            ).first(),
+            lambda db: TechnicianRepository(db).has_zone_match(technician_id, zone_id),
+        ),
+        (
+            "skill match",
+            lambda db: db.execute(
+                select(technician_skills.c.technician_id).where(
+                    and_(technician_skills.c.technician_id == technician_id, technician_skills.c.skill_id == skill_id)
+                )
+            ).first(),
+            lambda db: TechnicianRepository(db).has_skill_match(technician_id, skill_id),
+        ),
+        (
+            "dealership by code",
+            lambda db: db.query(Dealership).filter(Dealership.code == "D-001").first(),
+            lambda db: DealershipRepository(db).get_dealership_by_code("d-001"),
+        ),
+    ]
+
+
+def per_call_us(db: Session, lookup, calls: int) -> float:
+    lookup(db)
+    started = clock.perf_counter()
+    for _ in range(calls):
+        lookup(db)
+    return (clock.perf_counter() - started) / calls * 1_000_000
+
+
+def per_call_us_fresh_session(engine, lookup, calls: int) -> float:
+    """Like per_call_us, but with a new session per call, so by-id lookups miss the identity map."""
+    started = clock.perf_counter()
+    for _ in range(calls):
+        with Session(engine) as db:
+            lookup(db)
+    return (clock.perf_counter() - started) / calls * 1_000_000
+
+
+def run() -> None:
+    args = parse_args()
+    # In-memory SQLite keeps the database itself out of the measurement as far as possible.
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        checks = lookups(*seed(db))
+        print(f"{args.calls} calls per lookup, per-call time in microseconds")
+        print(f"{'lookup':>30}  {'query chain':>11}  {'cached':>8}  {'saved':>6}")
+        for name, legacy, cached in checks:
+            if name in FRESH_SESSION_LOOKUPS:
+                before = per_call_us_fresh_session(engine, legacy, args.calls)
+                after = per_call_us_fresh_session(engine, cached, args.calls)
+                name = f"{name} (new session)"
+            else:
+                before = per_call_us(db, legacy, args.calls)
+                after = per_call_us(db, cached, args.calls)
+            print(f"{name:>30}  {before:11.1f}  {after:8.1f}  {(1 - after / before) * 100:5.0f}%")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,175 @@
+import argparse
+import pathlib
+import statistics
+import sys
+import tempfile
+import time as clock
+from datetime import date, datetime, time, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
+BACKEND_ROOT = SCRIPT_DIR.parent
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.models.base import Base
+from app.models.technician import Technician
+from app.models.time_off import TimeOff
+from app.models.working_hours import WorkingHours
+from app.repositories.technician_repository import TechnicianRepository
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare delete-and-reinsert against diff-based availability saves on large time-off histories",
+    )
+    parser.add_argument("--database-url", help="database to benchmark against (default: temporary SQLite file)")
+    parser.add_argument("--history", type=int, default=2000, help="cancelled time-off rows per technician")
+    parser.add_argument("--ranges", type=int, default=20, help="live out-of-office ranges per save")
+    parser.add_argument("--saves", type=int, default=200, help="availability saves per strategy")
+    return parser.parse_args()
+
+
+def get_engine(database_url: str):
+    is_sqlite = database_url.startswith("sqlite")
+    return create_engine(
+        database_url,
+        connect_args={"check_same_thread": False} if is_sqlite else {},
+    )
+
+
+class WriteCounter:
+    """Counts write statements and the rows they touched."""
+
+    def __init__(self, engine):
+        self.statements = 0
+        self.rows = 0
+        event.listen(engine, "after_cursor_execute", self._record)
+
+    def _record(self, _conn, cursor, statement, _parameters, _context, _executemany) -> None:
+        if statement.lstrip().split(None, 1)[0].upper() in ("INSERT", "UPDATE", "DELETE"):
+            self.statements += 1
+            self.rows += max(cursor.rowcount, 0)
+
+    def reset(self) -> None:
+        self.statements = 0
+        self.rows = 0
+
+
+def seed_technician(session: Session, history: int):
+    technician = Technician(
+        id=uuid4(),
+        name="Bench Tech",
+        full_name="Bench Tech",
+        email=f"bench-{uuid4().hex[:12]}@example.com",
+        status="active",
+        manual_availability=True,
+    )
+    session.add(technician)
+    session.flush()
+    cancelled_at = datetime.now(timezone.utc)
+    start = date.today() - timedelta(days=history)
+    session.add_all(
+        TimeOff(
+            technician_id=technician.id,
+            entry_type="full_day",
+            start_date=start + timedelta(days=index),
+            end_date=start + timedelta(days=index),
+            reason="History",
+            cancelled_at=cancelled_at,
+        )
+        for index in range(history)
+    )
+    session.commit()
+    return technician.id
+
+
+def build_payload(save_index: int, range_count: int):
+    # Each save moves one working day and one out-of-office range, the typical edit from the app.
+    schedule = [
+        {
+            "day_of_week": day,
+            "is_enabled": day < 5 or day == 5 + save_index % 2,
+            "start_time": time(8, 0),
+            "end_time": time(17, 0),
+        }
+        for day in range(7)
+    ]
+    first = date.today() + timedelta(days=7)
+    ranges = [
+        {
+            "entry_type": "full_day",
+            "start_date": first + timedelta(days=index * 7),
+            "end_date": first + timedelta(days=index * 7),
+            "reason": "Out of office",
+        }
+        for index in range(range_count - 1)
+    ]
+    moving = first + timedelta(days=range_count * 7 + save_index % 2)
+    ranges.append({"entry_type": "full_day", "start_date": moving, "end_date": moving, "reason": "Out of office"})
+    return schedule, ranges
+
+
+def save_delete_and_reinsert(session: Session, technician_id, schedule, ranges) -> None:
+    """The previous repository behaviour, kept here as the baseline."""
+    session.query(WorkingHours).filter(WorkingHours.technician_id == technician_id).delete()
+    session.add_all(WorkingHours(technician_id=technician_id, **item) for item in schedule)
+    session.query(TimeOff).filter(TimeOff.technician_id == technician_id).delete()
+    session.add_all(TimeOff(technician_id=technician_id, **item) for item in ranges)
+    session.commit()
+
+
+def save_diff(session: Session, technician_id, schedule, ranges) -> None:
+    repo = TechnicianRepository(session)
+    repo.replace_weekly_schedule(technician_id, schedule)
+    repo.replace_out_of_office_ranges(technician_id, ranges)
+    session.commit()
+
+
+def run_strategy(session_factory, counter: WriteCounter, history: int, range_count: int, saves: int, save):
+    with session_factory() as session:
+        technician_id = seed_technician(session, history)
+    counter.reset()
+    latencies = []
+    for save_index in range(saves):
+        schedule, ranges = build_payload(save_index, range_count)
+        with session_factory() as session:
+            started = clock.perf_counter()
+            save(session, technician_id, schedule, ranges)
+            latencies.append(clock.perf_counter() - started)
+    with session_factory() as session:
+        remaining_rows = session.query(TimeOff).filter(TimeOff.technician_id == technician_id).count()
+    return counter.statements, counter.rows, latencies, remaining_rows
+
+
+def run() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as scratch:
+        database_url = args.database_url or f"sqlite:///{pathlib.Path(scratch, 'bench.sqlite3').as_posix()}"
+        engine = get_engine(database_url)
+        Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+        counter = WriteCounter(engine)
+
+        results = {}
+        for label, save in (("delete+reinsert", save_delete_and_reinsert), ("diff", save_diff)):
+            results[label] = run_strategy(session_factory, counter, args.history, args.ranges, args.saves, save)
+        engine.dispose()
+
+    print(f"database: {database_url}")
+    print(f"{args.saves} saves, {args.ranges} live ranges, {args.history} cancelled time-off rows of history")
+    for label, (statements, rows, latencies, remaining_rows) in results.items():
+        latencies.sort()
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        print(
+            f"{label}: {statements / args.saves:.1f} write statements/save, {rows / args.saves:.1f} rows written/save, "
+            f"median {statistics.median(latencies) * 1000:.2f}ms p95 {p95 * 1000:.2f}ms, "
+            f"time-off rows kept {remaining_rows}"
+        )
+
+
+if __name__ == "__main__":
+    run()
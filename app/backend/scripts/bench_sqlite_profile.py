@@ -0,0 +1,170 @@
+import argparse
+import asyncio
+import pathlib
+import statistics
+import sys
+import tempfile
+import threading
+import time as clock
+
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
+BACKEND_ROOT = SCRIPT_DIR.parent
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.core.db_pool import async_database_url, engine_options
+from app.core.db_sqlite import SerializedWriteSession, WriteGate, configure_sqlite_connections, writer_engine_options
+from app.models import *  # noqa: F401,F403
+from app.models.audit_log import AuditLog
+from app.models.base import Base
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare reader latency and lock errors with the SQLite performance profile off and on",
+    )
+    parser.add_argument("--seconds", type=float, default=5.0, help="run time per mode")
+    parser.add_argument("--readers", type=int, default=8, help="threads issuing reads")
+    parser.add_argument("--writers", type=int, default=4, help="threads issuing write transactions")
+    parser.add_argument("--async-writers", type=int, default=4, help="asyncio tasks issuing write transactions")
+    parser.add_argument("--rows", type=int, default=5000, help="rows inserted per write transaction")
+    parser.add_argument("--hold-ms", type=float, default=20.0, help="work done inside each write transaction")
+    return parser.parse_args()
+
+
+def build_session_factories(path: str, profile: bool):
+    """Sync and async sessions as deps.py builds them; both modes wait 5s on locks (driver default, SQLITE_BUSY_TIMEOUT_MS)."""
+    url = f"sqlite:///{path}"
+    async_url = async_database_url(url)
+    engine = create_engine(url, **engine_options(url))
+    async_engine = create_async_engine(async_url, **engine_options(async_url, asynchronous=True))
+    writer = create_engine(url, **writer_engine_options(engine_options(url))) if profile else None
+    async_writer = (
+        create_async_engine(async_url, **writer_engine_options(engine_options(async_url, asynchronous=True)))
+        if profile
+        else None
+    )
+    write_gate = WriteGate(timeout_seconds=30) if profile else None
+    for target in (engine, async_engine, writer, async_writer):
+        if target is not None:
+            configure_sqlite_connections(getattr(target, "sync_engine", target), profile)
+    Base.metadata.create_all(bind=engine)
+
+    def session_factory():
+        return SerializedWriteSession(bind=engine, writer=writer, write_gate=write_gate, autoflush=False)
+
+    async_session_factory = async_sessionmaker(
+        async_engine,
+        autoflush=False,
+        sync_session_class=SerializedWriteSession,
+        writer=async_writer.sync_engine if async_writer is not None else None,
+        write_gate=write_gate,
+    )
+    return session_factory, async_session_factory, [engine, writer], [async_engine, async_writer]
+
+
+# Rows are generated inside SQLite, which releases the GIL, so Python overhead does not hide lock waits.
+INSERT_BENCH_ROWS = text(
+    """
+    INSERT INTO audit_logs (id, actor_role, actor_id, action, entity_type, entity_id, created_at)
+    WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < :rows)
+    SELECT lower(hex(randomblob(16))), 'admin', lower(hex(randomblob(16))), 'bench', 'bench',
+           lower(hex(randomblob(16))), CURRENT_TIMESTAMP
+    FROM n
+    """
+)
+
+
+def run_mode(label: str, path: str, profile: bool, args: argparse.Namespace) -> None:
+    session_factory, async_session_factory, engines, async_engines = build_session_factories(path, profile)
+    deadline = clock.perf_counter() + args.seconds
+    read_latencies = []
+    counters = {"writes": 0, "read_errors": 0, "write_errors": 0, "async_writes": 0, "async_write_errors": 0}
+    lock = threading.Lock()
+
+    def reader() -> None:
+        while clock.perf_counter() < deadline:
+            started = clock.perf_counter()
+            try:
+                with session_factory() as db:
+                    db.execute(select(func.count(AuditLog.id)).where(AuditLog.entity_type == "bench")).scalar()
+            except OperationalError:
+                with lock:
+                    counters["read_errors"] += 1
+                continue
+            with lock:
+                read_latencies.append(clock.perf_counter() - started)
+
+    def writer() -> None:
+        while clock.perf_counter() < deadline:
+            try:
+                with session_factory() as db:
+                    db.execute(INSERT_BENCH_ROWS, {"rows": args.rows})
+                    clock.sleep(args.hold_ms / 1000)
+                    db.commit()
+            except OperationalError:
+                with lock:
+                    counters["write_errors"] += 1
+                continue
+            with lock:
+                counters["writes"] += 1
+
+    async def async_writer() -> None:
+        while clock.perf_counter() < deadline:
+            try:
+                async with async_session_factory() as db:
+                    await db.execute(INSERT_BENCH_ROWS, {"rows": args.rows})
+                    await asyncio.sleep(args.hold_ms / 1000)
+                    await db.commit()
+            except OperationalError:
+                counters["async_write_errors"] += 1
+                continue
+            counters["async_writes"] += 1
+
+    async def async_writers() -> None:
+        await asyncio.gather(*(async_writer() for _ in range(args.async_writers)))
+        for engine in async_engines:
+            if engine is not None:
+                await engine.dispose()
+
+    threads = [threading.Thread(target=reader) for _ in range(args.readers)]
+    threads += [threading.Thread(target=writer) for _ in range(args.writers)]
+    # Async endpoints write from the event loop; they share the database (and, with the profile, the write gate).
+    threads.append(threading.Thread(target=asyncio.run, args=(async_writers(),)))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for engine in engines:
+        if engine is not None:
+            engine.dispose()
+
+    samples = sorted(read_latencies)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))] if samples else 0.0
+    print(
+        f"{label:>12}: reads {len(samples) / args.seconds:7.0f}/s  "
+        f"median {statistics.median(samples) * 1000 if samples else 0.0:7.2f}ms  p95 {p95 * 1000:7.2f}ms  "
+        f"max {(samples[-1] if samples else 0.0) * 1000:7.1f}ms  read errors {counters['read_errors']}  "
+        f"| writes {counters['writes'] / args.seconds:5.1f}/s  write errors {counters['write_errors']}  "
+        f"| async writes {counters['async_writes'] / args.seconds:5.1f}/s  "
+        f"async write errors {counters['async_write_errors']}"
+    )
+
+
+def run() -> None:
+    args = parse_args()
+    print(
+        f"{args.readers} readers, {args.writers} sync and {args.async_writers} async writers inserting "
+        f"{args.rows} rows and holding {args.hold_ms:g}ms per transaction"
+    )
+    for label, profile in (("default", False), ("performance", True)):
+        with tempfile.TemporaryDirectory() as scratch:
+            run_mode(label, pathlib.Path(scratch, "bench.sqlite3").as_posix(), profile, args)
+
+
+if __name__ == "__main__":
+    run()
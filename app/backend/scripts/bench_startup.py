@@ -0,0 +1,91 @@
+import argparse
+import os
+import pathlib
+import statistics
+import subprocess
+import sys
+import tempfile
+import time as clock
+
+from sqlalchemy import create_engine
+
+SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
+BACKEND_ROOT = SCRIPT_DIR.parent
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.core.db_migrations import LEGACY_SQLITE_COLUMNS, add_missing_sqlite_columns, ensure_schema_current
+from app.models import *  # noqa: F401,F403
+from app.models.base import Base
+
+# Runs in a fresh interpreter: import-to-ready is the time until `app.main` can serve requests.
+IMPORT_PROBE = """
+import time
+started = time.perf_counter()
+import app.main
+print(time.perf_counter() - started)
+"""
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measure app import-to-ready time and the startup schema check on a SQLite database",
+    )
+    parser.add_argument("--starts", type=int, default=10, help="process starts against the migrated database")
+    parser.add_argument("--checks", type=int, default=200, help="in-process schema checks per strategy")
+    return parser.parse_args()
+
+
+def import_to_ready(database_url: str) -> float:
+    env = dict(os.environ, APP_ENV="development", DATABASE_URL=database_url)
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE],
+        cwd=BACKEND_ROOT,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def legacy_schema_sync(engine) -> None:
+    """What every start used to do: create_all, then PRAGMA table_info per patched column."""
+    with engine.begin() as conn:
+        Base.metadata.create_all(bind=conn)
+        for column in LEGACY_SQLITE_COLUMNS:
+            add_missing_sqlite_columns(conn, [column])
+
+
+def time_checks(label: str, check, runs: int) -> None:
+    samples = []
+    for _ in range(runs):
+        started = clock.perf_counter()
+        check()
+        samples.append(clock.perf_counter() - started)
+    print(f"{label:>22}: median {statistics.median(samples) * 1000:7.2f}ms  max {max(samples) * 1000:7.2f}ms")
+
+
+def run() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as scratch:
+        database_url = f"sqlite:///{pathlib.Path(scratch, 'startup.sqlite3').as_posix()}"
+        print(f"database: {database_url}")
+
+        first = import_to_ready(database_url)
+        print(f"{'first start (migrates)':>22}: {first * 1000:7.1f}ms")
+        starts = [import_to_ready(database_url) for _ in range(args.starts)]
+        print(
+            f"{'later starts':>22}: median {statistics.median(starts) * 1000:7.1f}ms  "
+            f"max {max(starts) * 1000:7.1f}ms over {args.starts} starts"
+        )
+
+        engine = create_engine(database_url, connect_args={"check_same_thread": False})
+        print("startup schema step alone, on the migrated database:")
+        time_checks("create_all + PRAGMAs", lambda: legacy_schema_sync(engine), args.checks)
+        time_checks("fingerprint lookup", lambda: ensure_schema_current(engine, Base.metadata), args.checks)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,146 @@
+import argparse
+import csv
+import pathlib
+import sys
+
+from sqlalchemy import bindparam, create_engine, delete, insert, select, update
+from sqlalchemy.orm import Session
+
+SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
+BACKEND_ROOT = SCRIPT_DIR.parent
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.core.config import DATABASE_URL
+from app.models.dealership import Dealership
+from app.models.geocode import PostalCodeGeocode, normalize_postal_code, resolve_postal_codes
+from app.models.job import Job
+from app.models.technician import Technician
+
+BATCH_SIZE = 500
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Load the offline postal code table and fill missing job, technician and dealership coordinates",
+    )
+    parser.add_argument(
+        "--load",
+        type=pathlib.Path,
+        help="CSV with postal_code,latitude,longitude[,city] columns to upsert into postal_code_geocodes",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="recompute coordinates for every row, not only rows without coordinates",
+    )
+    return parser.parse_args()
+
+
+def get_engine():
+    is_sqlite = DATABASE_URL.startswith("sqlite")
+    return create_engine(
+        DATABASE_URL,
+        connect_args={"check_same_thread": False} if is_sqlite else {},
+    )
+
+
+def load_geocodes(session: Session, path: pathlib.Path) -> int:
+    table = PostalCodeGeocode.__table__
+    loaded = 0
+    with path.open(encoding="utf-8-sig", newline="") as handle:
+        batch = {}
+        for row in csv.DictReader(handle):
+            postal_code = normalize_postal_code(row.get("postal_code"))
+            if postal_code is None:
+                continue
+            batch[postal_code] = {
+                "postal_code": postal_code,
+                "latitude": float(row["latitude"]),
+                "longitude": float(row["longitude"]),
+                "city": (row.get("city") or "").strip() or None,
+            }
+            if len(batch) >= BATCH_SIZE:
+                loaded += _replace_geocodes(session, table, batch)
+                batch = {}
+        if batch:
+            loaded += _replace_geocodes(session, table, batch)
+    return loaded
+
+
+def _replace_geocodes(session: Session, table, batch) -> int:
+    session.execute(delete(table).where(table.c.postal_code.in_(list(batch))))
+    session.execute(insert(table), list(batch.values()))
+    return len(batch)
+
+
+def backfill(session: Session, model, postal_code_columns, *, recompute: bool) -> int:
+    """Resolve coordinates in keyset-paged batches; one lookup query and one executemany per batch."""
+    table = model.__table__
+    columns = [table.c[name] for name in postal_code_columns]
+    conditions = [] if recompute else [table.c.latitude.is_(None)]
+    updated = 0
+    last_id = None
+    while True:
+        query = select(table.c.id, *columns).order_by(table.c.id).limit(BATCH_SIZE)
+        if conditions:
+            query = query.where(*conditions)
+        if last_id is not None:
+            query = query.where(table.c.id > last_id)
+        rows = session.execute(query).all()
+        if not rows:
+            return updated
+        last_id = rows[-1][0]
+        resolved = resolve_postal_codes(session.connection(), (value for row in rows for value in row[1:]))
+        values = []
+        for row in rows:
+            match = next(
+                (resolved[code] for code in map(normalize_postal_code, row[1:]) if code in resolved),
+                None,
+            )
+            if match is not None:
+                values.append({"row_id": row[0], "latitude": match[0], "longitude": match[1]})
+        if values:
+            session.execute(
+                update(table)
+                .where(table.c.id == bindparam("row_id"))
+                .values(latitude=bindparam("latitude"), longitude=bindparam("longitude")),
+                values,
+            )
+            updated += len(values)
+
+
+def backfill_jobs_from_dealerships(session: Session) -> int:
+    jobs = Job.__table__
+    dealerships = Dealership.__table__
+    same_dealership = dealerships.c.id == jobs.c.dealership_id
+    result = session.execute(
+        update(jobs)
+        .where(
+            jobs.c.latitude.is_(None),
+            select(dealerships.c.id).where(same_dealership, dealerships.c.latitude.is_not(None)).exists(),
+        )
+        .values(
+            latitude=select(dealerships.c.latitude).where(same_dealership).scalar_subquery(),
+            longitude=select(dealerships.c.longitude).where(same_dealership).scalar_subquery(),
+        )
+    )
+    return result.rowcount
+
+
+def run() -> None:
+    args = parse_args()
+    engine = get_engine()
+    with Session(engine) as session:
+        if args.load is not None:
+            print(f"{load_geocodes(session, args.load)} postal code(s) loaded")
+        technicians = backfill(session, Technician, ["postal_code"], recompute=args.all)
+        dealerships = backfill(session, Dealership, ["postal_code"], recompute=args.all)
+        jobs = backfill(session, Job, ["ship_to_zip_code", "customer_zip_code"], recompute=args.all)
+        jobs += backfill_jobs_from_dealerships(session)
+        session.commit()
+    print(f"coordinates set: {technicians} technician(s), {dealerships} dealership(s), {jobs} job(s)")
+
+
+if __name__ == "__main__":
+    run()
@@ -1,11 +1,9 @@
 import argparse
 import pathlib
 import sys
-from dataclasses import dataclass
-from datetime import datetime, time, timezone
-from typing import Iterable
+from datetime import time
 
-from sqlalchemy import and_, create_engine, insert, select, text
+from sqlalchemy import and_, create_engine, insert, select
 from sqlalchemy.orm import Session
 
 SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
@@ -14,29 +12,20 @@ if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
 
 from app.core.config import DATABASE_URL
+from app.core.db_migrations import (
+    MIGRATIONS,
+    apply_migration_sql,
+    ensure_migration_table,
+    load_applied_versions,
+    mark_versions_applied,
+    record_fingerprint,
+    schema_fingerprint,
+    sync_schema,
+)
 from app.models import Skill, Technician, WorkingHours, Zone, technician_skills, technician_zones
 from app.models.base import Base
 
 
-@dataclass(frozen=True)
-class Migration:
-    filename: str
-    seed: bool = False
-
-
-MIGRATIONS: list[Migration] = [
-    Migration("001_technician_module.sql"),
-    Migration("002_admin_technician_profile.sql"),
-    Migration("003_technician.sql", seed=True),
-    Migration("004_dealerships.sql"),
-    Migration("005_normalize_zone_names.sql"),
-    Migration("006_technician_signup_requests.sql"),
-    Migration("007_invoices.sql"),
-    Migration("008_dispatch_job_invoice_fields.sql"),
-    Migration("009_technician_profile_email_change_requests.sql"),
-]
-
-
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run SM2 backend schema migrations")
     parser.add_argument(
@@ -55,80 +44,6 @@ def get_engine():
     )
 
 
-def ensure_migration_table(conn) -> None:
-    conn.execute(
-        text(
-            """
-            CREATE TABLE IF NOT EXISTS schema_migrations (
-                version TEXT PRIMARY KEY,
-                applied_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
-            )
-            """
-        )
-    )
-
-
-def load_applied_versions(conn) -> set[str]:
-    rows = conn.execute(text("SELECT version FROM schema_migrations")).all()
-    return {row[0] for row in rows}
-
-
-def mark_versions_applied(conn, versions: Iterable[str]) -> None:
-    now = datetime.now(timezone.utc).isoformat()
-    for version in versions:
-        conn.execute(
-            text(
-                """
-                INSERT OR IGNORE INTO schema_migrations (version, applied_at)
-                VALUES (:version, :applied_at)
-                """
-            ),
-            {"version": version, "applied_at": now},
-        )
-
-
-def ensure_sqlite_technician_password_column(conn) -> None:
-    if not DATABASE_URL.startswith("sqlite"):
-        return
-
-    def ensure_column(table_name: str, column_name: str, ddl: str) -> None:
-        columns = {
-            row[1]
-            for row in conn.exec_driver_sql(f"PRAGMA table_info('{table_name}')").fetchall()
-        }
-        if columns and column_name not in columns:
-            conn.exec_driver_sql(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {ddl}")
-
-    ensure_column("technicians", "password", "VARCHAR(255)")
-    ensure_column("technicians", "full_name", "VARCHAR(255)")
-    ensure_column("technicians", "profile_picture_url", "TEXT")
-    ensure_column("technicians", "working_days", "TEXT DEFAULT '[]' NOT NULL")
-    ensure_column("technicians", "working_hours_start", "TIME")
-    ensure_column("technicians", "working_hours_end", "TIME")
-    ensure_column("technicians", "after_hours_enabled", "BOOLEAN DEFAULT 0 NOT NULL")
-    ensure_column("technicians", "updated_by", "CHAR(32)")
-    ensure_column("jobs", "dealership_id", "CHAR(32)")
-    ensure_column("jobs", "customer_name", "VARCHAR(255)")
-    ensure_column("jobs", "customer_address", "TEXT")
-    ensure_column("jobs", "customer_city", "VARCHAR(128)")
-    ensure_column("jobs", "customer_state", "VARCHAR(128)")
-    ensure_column("jobs", "customer_zip_code", "VARCHAR(32)")
-    ensure_column("jobs", "ship_to_name", "VARCHAR(255)")
-    ensure_column("jobs", "ship_to_address", "TEXT")
-    ensure_column("jobs", "ship_to_city", "VARCHAR(128)")
-    ensure_column("jobs", "ship_to_state", "VARCHAR(128)")
-    ensure_column("jobs", "ship_to_zip_code", "VARCHAR(32)")
-    ensure_column("jobs", "service_type", "VARCHAR(255)")
-    ensure_column("jobs", "hours_worked", "NUMERIC(10,2)")
-    ensure_column("jobs", "rate", "NUMERIC(12,2)")
-    ensure_column("jobs", "location", "TEXT")
-    ensure_column("jobs", "vehicle", "VARCHAR(255)")
-    ensure_column("jobs", "tax_code", "VARCHAR(32)")
-    ensure_column("jobs", "tax_rate", "NUMERIC(8,5)")
-    ensure_column("jobs", "completed_at", "DATETIME")
-    ensure_column("jobs", "invoice_id", "CHAR(32)")
-
-
 def seed_development_data(engine) -> None:
     with Session(engine) as session:
         zone_names = ["Quebec", "Levis", "Donnacona", "St-Raymond"]
@@ -298,32 +213,32 @@ def seed_development_data(engine) -> None:
 def run() -> None:
     args = parse_args()
     selected = [m for m in MIGRATIONS if args.with_seed or not m.seed]
-    selected_versions = [m.filename for m in selected]
 
     engine = get_engine()
     with engine.begin() as conn:
         ensure_migration_table(conn)
         applied = load_applied_versions(conn)
-        Base.metadata.create_all(bind=conn)
-        ensure_sqlite_technician_password_column(conn)
+        pending = [m for m in selected if m.filename not in applied]
+        sync_schema(conn, Base.metadata, pending)
 
-    pending = [version for version in selected_versions if version not in applied]
-    for version in selected_versions:
-        if version in applied:
-            print(f"SKIP {version} (already applied)")
+    for migration in selected:
+        if migration.filename in applied:
+            print(f"SKIP {migration.filename} (already applied)")
         else:
-            print(f"APPLY {version}")
+            print(f"APPLY {migration.filename}")
 
-    if args.with_seed and "003_technician.sql" in pending:
+    if args.with_seed and any(m.filename == "003_technician.sql" for m in pending):
         seed_development_data(engine)
 
     with engine.begin() as conn:
-        ensure_migration_table(conn)
-        mark_versions_applied(conn, pending)
-
-    for version in pending:
-        print(f"DONE  {version}")
-
+        for migration in pending:
+            apply_migration_sql(conn, migration.filename)
+        mark_versions_applied(conn, [m.filename for m in pending])
+        # Lets the app's startup check skip the schema sync until models or migrations change.
+        record_fingerprint(conn, schema_fingerprint(Base.metadata))
+
+    for migration in pending:
+        print(f"DONE  {migration.filename}")
 
 if __name__ == "__main__":
     run()
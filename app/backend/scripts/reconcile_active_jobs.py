@@ -0,0 +1,53 @@
+import argparse
+import pathlib
+import sys
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
+BACKEND_ROOT = SCRIPT_DIR.parent
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.core.config import DATABASE_URL
+from app.repositories.technician_repository import TechnicianRepository
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Repair drift between technicians.active_jobs and the jobs table",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="report drifted counters without updating them",
+    )
+    return parser.parse_args()
+
+
+def get_engine():
+    is_sqlite = DATABASE_URL.startswith("sqlite")
+    return create_engine(
+        DATABASE_URL,
+        connect_args={"check_same_thread": False} if is_sqlite else {},
+    )
+
+
+def run() -> None:
+    args = parse_args()
+    engine = get_engine()
+    with Session(engine) as session:
+        drifted = TechnicianRepository(session).reconcile_active_job_counters(apply=not args.dry_run)
+        for row in drifted:
+            print(f"DRIFT {row['technician_id']} stored={row['stored']} actual={row['actual']}")
+        if args.dry_run:
+            session.rollback()
+            print(f"{len(drifted)} technician counter(s) drifted (dry run, nothing changed)")
+        else:
+            session.commit()
+            print(f"{len(drifted)} technician counter(s) repaired")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,14 @@
+import pytest
+
+from app.core.query_stats import record_requests
+from query_budgets import over_budget
+
+
+@pytest.fixture(autouse=True)
+def enforce_query_budgets():
+    """Fail any test whose requests run more SQL statements than their endpoint's budget."""
+    with record_requests() as recorded:
+        yield recorded
+    failures = over_budget(recorded)
+    if failures:
+        pytest.fail("Query budget exceeded:\n" + "\n".join(failures))
@@ -0,0 +1,34 @@
+from typing import Iterable, List
+
+from app.core.query_stats import RequestQueryStats
+
+# Most SQL statements one request may run, keyed by (method, route template). Budgets hold for
+# any data size, so list endpoints have to batch their lookups instead of querying per row.
+# Each budget is the count the suite measures for that endpoint.
+QUERY_BUDGETS = {
+    ("GET", "/admin/technicians"): 6,
+    ("GET", "/admin/technicians/calendar"): 3,
+    ("GET", "/admin/technicians/nearest/{job_id}"): 4,
+    ("GET", "/admin/dealerships"): 1,
+    ("GET", "/admin/email-change-requests"): 2,
+    ("GET", "/admin/reports/overview"): 8,
+    ("GET", "/invoices"): 4,
+    ("GET", "/invoices/pending-approvals"): 1,
+    ("GET", "/invoices/{invoice_id}"): 3,
+    ("GET", "/technicians/me"): 7,
+    ("GET", "/technicians/me/jobs/available"): 3,
+    ("GET", "/technicians/me/sync"): 12,
+    ("POST", "/admin/technicians/status/bulk"): 4,
+    ("POST", "/admin/technicians/zones/bulk"): 7,
+    ("POST", "/admin/technicians/import"): 9,
+    ("POST", "/invoices"): 12,
+}
+
+
+def over_budget(recorded: Iterable[RequestQueryStats]) -> List[str]:
+    failures = []
+    for request in recorded:
+        budget = QUERY_BUDGETS.get((request.method, request.route))
+        if budget is not None and request.count > budget:
+            failures.append(f"{request.method} {request.route} ran {request.count} queries (budget {budget})")
+    return failures
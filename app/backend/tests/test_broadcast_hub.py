@@ -0,0 +1,93 @@
+import asyncio
+import threading
+import unittest
+from uuid import uuid4
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.core.broadcast import (
+    RESYNC_EVENT,
+    BroadcastEvent,
+    BroadcastHub,
+    InMemoryBroker,
+    get_broadcast_hub,
+    queue_broadcast,
+)
+
+
+class BroadcastHubTests(unittest.TestCase):
+    def test_events_reach_only_addressed_technicians_across_threads(self):
+        hub = BroadcastHub(InMemoryBroker(), max_queue=10)
+        addressed = uuid4()
+        other = uuid4()
+
+        async def scenario():
+            mine = hub.subscribe(addressed)
+            theirs = hub.subscribe(other)
+            publisher = threading.Thread(
+                target=hub.publish,
+                args=(BroadcastEvent(event="job.available", technician_ids=(addressed,), data={"job_code": "J-1"}),),
+            )
+            publisher.start()
+            publisher.join()
+            received = await asyncio.wait_for(mine.get(), timeout=1)
+            await asyncio.sleep(0)
+            self.assertTrue(theirs.queue.empty())
+            hub.unsubscribe(mine)
+            hub.unsubscribe(theirs)
+            return received
+
+        received = asyncio.run(scenario())
+        self.assertEqual(received.event, "job.available")
+        self.assertEqual(received.data, {"job_code": "J-1"})
+        self.assertEqual(hub.connection_count(), 0)
+
+    def test_slow_consumer_gets_single_resync_event(self):
+        hub = BroadcastHub(InMemoryBroker(), max_queue=2)
+        technician_id = uuid4()
+
+        async def scenario():
+            subscription = hub.subscribe(technician_id)
+            for index in range(5):
+                hub.publish(BroadcastEvent(event="job.available", technician_ids=(technician_id,), data={"n": index}))
+            await asyncio.sleep(0)
+            resync = await asyncio.wait_for(subscription.get(), timeout=1)
+            drained = subscription.queue.empty()
+            hub.publish(BroadcastEvent(event="job.taken", technician_ids=(technician_id,)))
+            following = await asyncio.wait_for(subscription.get(), timeout=1)
+            return subscription, resync, drained, following
+
+        subscription, resync, drained, following = asyncio.run(scenario())
+        self.assertEqual(resync.event, RESYNC_EVENT)
+        self.assertTrue(drained)
+        self.assertEqual(subscription.dropped, 5)
+        self.assertEqual(following.event, "job.taken")
+
+    def test_queued_events_publish_on_commit_only(self):
+        engine = create_engine("sqlite://")
+        technician_id = uuid4()
+        published = []
+        broadcast_hub = get_broadcast_hub()
+        original_publish = broadcast_hub.publish
+        broadcast_hub.publish = published.append
+        try:
+            with Session(engine) as session:
+                session.connection()
+                queue_broadcast(session, "job.taken", [technician_id])
+                session.rollback()
+                self.assertEqual(published, [])
+
+                session.connection()
+                queue_broadcast(session, "job.accepted", [technician_id, None, technician_id])
+                session.commit()
+        finally:
+            broadcast_hub.publish = original_publish
+            engine.dispose()
+
+        self.assertEqual([item.event for item in published], ["job.accepted"])
+        self.assertEqual(published[0].technician_ids, (technician_id,))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core.db_pool import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    async_database_url,
+    engine_options,
+    instrument_engine,
+    pool_status,
+)
+
+
+class DatabasePoolTests(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".sqlite3")
+        os.close(handle)
+        self.engine = create_engine(
+            f"sqlite:///{self.path}",
+            connect_args={"check_same_thread": False},
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.2,
+        )
+        instrument_engine(self.engine)
+
+    def tearDown(self):
+        self.engine.dispose()
+        os.remove(self.path)
+
+    def test_checkout_waits_timeouts_and_usage_are_reported(self):
+        held = self.engine.connect()
+        status = pool_status("primary", self.engine)
+        self.assertEqual(status["pool_class"], "InstrumentedQueuePool")
+        self.assertEqual(status["in_use"], 1)
+        self.assertEqual(status["overflow_in_use"], 0)
+
+        with self.assertRaises(PoolTimeoutError):
+            self.engine.connect()
+
+        released = threading.Timer(0.05, held.close)
+        released.start()
+        with self.engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        released.join()
+
+        status = pool_status("primary", self.engine)
+        self.assertEqual(status["checkouts"], 2)
+        self.assertEqual(status["checkout_timeouts"], 1)
+        self.assertEqual(status["connections_opened"], 1)
+        self.assertEqual(status["peak_in_use"], 1)
+        self.assertEqual(status["in_use"], 0)
+        self.assertGreaterEqual(status["wait_ms_max"], 150)
+
+    def test_metrics_survive_dispose(self):
+        with self.engine.connect():
+            pass
+        self.engine.dispose()
+        with self.engine.connect():
+            pass
+        status = pool_status("primary", self.engine)
+        self.assertEqual(status["checkouts"], 2)
+        self.assertEqual(status["connections_opened"], 2)
+
+    def test_in_memory_sqlite_keeps_default_pool(self):
+        self.assertNotIn("poolclass", engine_options("sqlite:///:memory:"))
+        self.assertIs(engine_options(f"sqlite:///{self.path}")["poolclass"], InstrumentedQueuePool)
+        self.assertNotIn("poolclass", engine_options("sqlite+aiosqlite:///:memory:", asynchronous=True))
+        self.assertIs(
+            engine_options(f"sqlite+aiosqlite:///{self.path}", asynchronous=True)["poolclass"],
+            InstrumentedAsyncQueuePool,
+        )
+
+    def test_async_database_url_swaps_in_asyncio_driver(self):
+        self.assertEqual(async_database_url("sqlite:///./local.db"), "sqlite+aiosqlite:///./local.db")
+        self.assertEqual(
+            async_database_url("postgresql+psycopg2://app:secret@db/dispatch"),
+            "postgresql+asyncpg://app:secret@db/dispatch",
+        )
+        self.assertEqual(async_database_url("postgres://db/dispatch"), "postgresql+asyncpg://db/dispatch")
+        self.assertEqual(async_database_url("postgresql+asyncpg://db/dispatch"), "postgresql+asyncpg://db/dispatch")
+
+
+if __name__ == "__main__":
+    unittest.main()
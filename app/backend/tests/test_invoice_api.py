@@ -1,3 +1,4 @@
+import asyncio
 import os
 import unittest
 from datetime import date, timedelta
@@ -13,7 +14,7 @@ if os.path.exists(_TEST_DB_FILE):
 os.environ["APP_ENV"] = "development"
 os.environ["DATABASE_URL"] = f"sqlite:///{_TEST_DB_FILE.replace(os.sep, '/')}"
 
-from app.api.deps import SessionLocal, engine
+from app.api.deps import SessionLocal, async_engine, engine
 from app.main import app
 from app.models.base import Base
 from app.models.dealership import Dealership
@@ -35,6 +36,7 @@ class InvoiceApiTests(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         engine.dispose()
+        asyncio.run(async_engine.dispose())
         if os.path.exists(_TEST_DB_FILE):
             os.remove(_TEST_DB_FILE)
 
@@ -0,0 +1,214 @@
+import asyncio
+import os
+import re
+import unittest
+from datetime import date, time, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+_TEST_DB_FILE = os.path.join(os.path.dirname(__file__), "query_budgets_test.sqlite3")
+if os.path.exists(_TEST_DB_FILE):
+    os.remove(_TEST_DB_FILE)
+
+os.environ["APP_ENV"] = "development"
+os.environ["DATABASE_URL"] = f"sqlite:///{_TEST_DB_FILE.replace(os.sep, '/')}"
+
+from app.api.deps import SessionLocal, async_engine, engine
+from app.core.query_stats import QUERY_START_KEY, QueryStatsMiddleware, record_requests
+from app.main import app
+from app.models.base import Base
+from app.models.dealership import Dealership
+from app.models.invoice import Invoice, InvoiceLineItem
+from app.models.job import Job
+from app.models.skill import Skill
+from app.models.technician import Technician
+from app.models.technician_email_change_request import TechnicianEmailChangeRequest
+from app.models.time_off import TimeOff
+from app.models.working_hours import WorkingHours
+from app.models.zone import Zone
+from query_budgets import QUERY_BUDGETS
+
+SERVER_TIMING_PATTERN = re.compile(r'^db;dur=\d+\.\d;desc="(\d+) queries"$')
+
+LIST_ENDPOINTS = [
+    "/admin/technicians",
+    "/admin/dealerships",
+    "/admin/email-change-requests",
+    "/invoices",
+]
+
+
+class QueryBudgetTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        Base.metadata.create_all(bind=engine)
+        cls.client = TestClient(app)
+        token_response = cls.client.post("/auth/dev/admin-token")
+        assert token_response.status_code == 200
+        cls.auth_header = {"Authorization": f"Bearer {token_response.json()['access_token']}"}
+
+    @classmethod
+    def tearDownClass(cls):
+        engine.dispose()
+        asyncio.run(async_engine.dispose())
+        if os.path.exists(_TEST_DB_FILE):
+            os.remove(_TEST_DB_FILE)
+
+    def setUp(self):
+        self._clear()
+
+    def tearDown(self):
+        # The database outlives this module, and later API suites start from empty tables.
+        self._clear()
+
+    def _clear(self) -> None:
+        with SessionLocal() as db:
+            db.query(InvoiceLineItem).delete()
+            db.query(Job).update({"invoice_id": None}, synchronize_session=False)
+            db.query(Invoice).delete()
+            db.query(Job).delete()
+            db.query(TechnicianEmailChangeRequest).delete()
+            db.query(TimeOff).delete()
+            db.query(WorkingHours).delete()
+            db.query(Technician).delete()
+            db.query(Dealership).delete()
+            db.commit()
+
+    def _seed(self, size: int) -> None:
+        """``size`` technicians, each with assignments, a schedule, time off, an email change and an invoice."""
+        suffix = uuid4().hex[:8]
+        with SessionLocal() as db:
+            zone = Zone(id=uuid4(), name=f"Zone {suffix}")
+            skill = Skill(id=uuid4(), name=f"Skill {suffix}")
+            job_ids = []
+            for index in range(size):
+                technician = Technician(
+                    id=uuid4(),
+                    name=f"Tech {suffix} {index}",
+                    email=f"tech-{suffix}-{index}@example.com",
+                    status="active",
+                    manual_availability=True,
+                    zones=[zone],
+                    skills=[skill],
+                )
+                dealership = Dealership(
+                    id=uuid4(),
+                    code=f"Q-{suffix}-{index}",
+                    name=f"Dealer {index}",
+                    address="1 Main St",
+                    city="Quebec",
+                    postal_code="G1R 2K4",
+                    status="active",
+                )
+                db.add_all([technician, dealership])
+                db.flush()
+                for day in range(7):
+                    db.add(
+                        WorkingHours(
+                            technician=technician,
+                            day_of_week=day,
+                            is_enabled=True,
+                            start_time=time(8),
+                            end_time=time(16),
+                        )
+                    )
+                db.add(
+                    TimeOff(
+                        technician=technician,
+                        entry_type="multi_day",
+                        start_date=date.today() + timedelta(days=index + 1),
+                        end_date=date.today() + timedelta(days=index + 2),
+                        reason="Vacation",
+                    )
+                )
+                db.add(
+                    TechnicianEmailChangeRequest(
+                        technician=technician,
+                        current_email=technician.email,
+                        requested_email=f"new-{suffix}-{index}@example.com",
+                    )
+                )
+                job = Job(
+                    id=uuid4(),
+                    job_code=f"SM2-{suffix}-{index}",
+                    status="COMPLETED",
+                    dealership_id=dealership.id,
+                    assigned_tech_id=technician.id,
+                    customer_name=dealership.name,
+                    customer_address=dealership.address,
+                    customer_city=dealership.city,
+                    customer_state="QC",
+                    customer_zip_code=dealership.postal_code,
+                    service_type="Service Call",
+                    hours_worked=Decimal("1.00"),
+                    rate=Decimal("45.00"),
+                    tax_code="GST",
+                )
+                db.add(job)
+                job_ids.append(str(job.id))
+            db.commit()
+
+        for job_id in job_ids:
+            res = self.client.post("/invoices", json={"dispatch_job_ids": [job_id]}, headers=self.auth_header)
+            self.assertEqual(res.status_code, 201, res.text)
+
+    def _list_query_counts(self, expected_rows: int) -> dict:
+        counts = {}
+        for path in LIST_ENDPOINTS:
+            with record_requests() as recorded:
+                res = self.client.get(path, headers=self.auth_header)
+            self.assertEqual(res.status_code, 200, res.text)
+            self.assertEqual(len(res.json()), expected_rows, path)
+            self.assertEqual(len(recorded), 1)
+            counts[recorded[0].route] = recorded[0].count
+        return counts
+
+    def test_list_endpoints_run_the_same_queries_for_any_number_of_rows(self):
+        self._seed(2)
+        small = self._list_query_counts(2)
+        self._seed(10)
+        large = self._list_query_counts(12)
+
+        self.assertEqual(small, large)
+        for route, count in large.items():
+            self.assertLessEqual(count, QUERY_BUDGETS[("GET", route)], route)
+
+    def test_responses_report_query_count_in_server_timing(self):
+        self._seed(1)
+        with record_requests() as recorded:
+            res = self.client.get("/admin/technicians", headers=self.auth_header)
+
+        self.assertEqual(res.status_code, 200, res.text)
+        match = SERVER_TIMING_PATTERN.match(res.headers["server-timing"])
+        self.assertIsNotNone(match, res.headers["server-timing"])
+        self.assertEqual(int(match.group(1)), recorded[0].count)
+        self.assertGreater(recorded[0].count, 0)
+
+    def test_failed_statements_are_counted_and_leave_no_start_time_on_the_connection(self):
+        scratch_engine = create_engine("sqlite://")
+        pending_starts = []
+
+        async def endpoint(scope, receive, send):
+            with scratch_engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+                with self.assertRaises(OperationalError):
+                    connection.execute(text("SELECT * FROM missing_table"))
+                pending_starts.extend(connection.info.get(QUERY_START_KEY, []))
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        with record_requests() as recorded:
+            res = TestClient(QueryStatsMiddleware(endpoint)).get("/scratch")
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(recorded[0].count, 2)
+        self.assertEqual(pending_starts, [])
+        scratch_engine.dispose()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+import pathlib
+import re
+import unittest
+from datetime import date, timedelta
+from uuid import uuid4
+
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.models import *  # noqa: F401,F403
+from app.models.audit_log import AuditLog
+from app.models.base import Base
+from app.models.invoice import Invoice, InvoiceLineItem
+from app.models.job import Job
+from app.repositories.invoice_repository import InvoiceRepository
+from app.repositories.signup_request_repository import SignupRequestRepository
+from app.repositories.technician_repository import TechnicianRepository
+from app.services.reports_service import ReportsService, _primary_job_by_invoice_id
+
+MIGRATIONS_DIR = pathlib.Path(__file__).resolve().parents[1] / "migrations"
+
+# Tables large enough in production that reading every row is a regression. Reports still list
+# every technician and dealership on purpose, so those tables are not guarded.
+HOT_TABLES = (
+    "jobs",
+    "job_rejections",
+    "invoices",
+    "invoice_line_items",
+    "technician_working_hours",
+    "audit_logs",
+)
+
+
+class QueryPlanTests(unittest.TestCase):
+    """Runs hot repository and report queries against the model schema and checks EXPLAIN QUERY PLAN."""
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(bind=self.engine)
+        self.db = Session(self.engine)
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _query_plans(self, work):
+        statements = []
+
+        def capture(_conn, _cursor, statement, parameters, _context, executemany):
+            if not executemany and statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+                statements.append((statement, parameters))
+
+        event.listen(self.engine, "before_cursor_execute", capture)
+        try:
+            work(self.db)
+        finally:
+            event.remove(self.engine, "before_cursor_execute", capture)
+        self.assertTrue(statements, "no statements were captured")
+        connection = self.db.connection()
+        return [
+            (statement, [row[3] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)])
+            for statement, parameters in statements
+        ]
+
+    def assertUsesIndex(self, work, index_name):
+        for statement, plan in self._query_plans(work):
+            if not any(index_name in detail for detail in plan):
+                self.fail(f"{index_name} not used: {plan}\n{statement}")
+
+    def assertNoHotTableScan(self, work):
+        for statement, plan in self._query_plans(work):
+            for detail in plan:
+                match = re.match(r"SCAN (\w+)", detail)
+                if match and match.group(1) in HOT_TABLES:
+                    self.fail(f"full scan of {match.group(1)}: {detail}\n{statement}")
+
+    def test_reports_overview_uses_indexes(self):
+        today = date.today()
+        self.assertNoHotTableScan(
+            lambda db: ReportsService(db).get_overview(from_date=today - timedelta(days=7), to_date=today)
+        )
+        self.assertNoHotTableScan(lambda db: _primary_job_by_invoice_id(db, [uuid4()]))
+
+    def test_invoice_queries_use_indexes(self):
+        self.assertNoHotTableScan(lambda db: InvoiceRepository(db).list_pending_approval_jobs())
+        self.assertNoHotTableScan(lambda db: InvoiceRepository(db).clear_jobs_for_invoice(uuid4()))
+        self.assertNoHotTableScan(
+            lambda db: db.execute(select(InvoiceLineItem).where(InvoiceLineItem.invoice_id == uuid4())).all()
+        )
+        self.assertNoHotTableScan(
+            lambda db: db.execute(
+                select(Invoice.id).where(Invoice.status.in_(["draft", "sent"]), Invoice.due_date < date.today())
+            ).all()
+        )
+
+    def test_technician_workload_and_schedule_queries_use_indexes(self):
+        repo_work = [
+            lambda repo: repo.list_active_jobs_for_technicians([uuid4(), uuid4()]),
+            lambda repo: repo.get_working_hours_for_day(uuid4(), 2),
+            lambda repo: repo.list_weekly_schedule(uuid4()),
+            lambda repo: repo.list_job_feed(uuid4(), after_job_id=uuid4()),
+        ]
+        for work in repo_work:
+            self.assertNoHotTableScan(lambda db: work(TechnicianRepository(db)))
+
+    def test_dealership_and_audit_lookups_use_indexes(self):
+        self.assertNoHotTableScan(lambda db: db.execute(select(Job.id).where(Job.dealership_id == uuid4())).all())
+        self.assertNoHotTableScan(
+            lambda db: db.execute(
+                select(AuditLog)
+                .where(AuditLog.entity_type == "technician", AuditLog.entity_id == uuid4())
+                .order_by(AuditLog.created_at.desc())
+            ).all()
+        )
+
+    def test_case_insensitive_lookups_use_lower_indexes(self):
+        self.assertUsesIndex(
+            lambda db: TechnicianRepository(db).get_technician_by_email("Tech@Example.com"),
+            "ix_technicians_email_lower",
+        )
+        self.assertUsesIndex(
+            lambda db: TechnicianRepository(db).email_exists("Tech@Example.com"),
+            "ix_technicians_email_lower",
+        )
+        self.assertUsesIndex(
+            lambda db: TechnicianRepository(db).find_existing_emails(["a@example.com", "B@example.com"]),
+            "ix_technicians_email_lower",
+        )
+        self.assertUsesIndex(
+            lambda db: SignupRequestRepository(db).get_by_email("New@Example.com"),
+            "ix_technician_signup_requests_email_lower",
+        )
+        self.assertUsesIndex(lambda db: TechnicianRepository(db).get_zone_by_name("North Shore"), "ix_zones_name_lower")
+        self.assertUsesIndex(lambda db: TechnicianRepository(db).get_skill_by_name("Brakes"), "ix_skills_name_lower")
+
+    def test_index_migrations_match_models(self):
+        declared = {index.name for table in Base.metadata.tables.values() for index in table.indexes}
+        for filename in ("015_hot_path_indexes.sql", "016_case_insensitive_lookup_indexes.sql"):
+            sql = (MIGRATIONS_DIR / filename).read_text(encoding="utf-8")
+            migrated = set(re.findall(r"CREATE INDEX IF NOT EXISTS (\w+)", sql))
+            self.assertTrue(migrated, filename)
+            self.assertLessEqual(migrated, declared, filename)
+
+
+if __name__ == "__main__":
+    unittest.main()
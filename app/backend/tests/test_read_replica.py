@@ -0,0 +1,130 @@
+import asyncio
+import os
+import sqlite3
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+_TEST_DB_FILE = os.path.join(os.path.dirname(__file__), "read_replica_primary_test.sqlite3")
+_REPLICA_DB_FILE = os.path.join(os.path.dirname(__file__), "read_replica_test.sqlite3")
+for _path in (_TEST_DB_FILE, _REPLICA_DB_FILE):
+    if os.path.exists(_path):
+        os.remove(_path)
+
+os.environ["APP_ENV"] = "development"
+os.environ["DATABASE_URL"] = f"sqlite:///{_TEST_DB_FILE.replace(os.sep, '/')}"
+
+from app.api import deps
+from app.core.db_replica import ReadReplica
+from app.main import app
+from app.models.base import Base
+from app.models.technician import Technician
+
+
+class ReadReplicaRoutingTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        Base.metadata.create_all(bind=deps.engine)
+        cls.client = TestClient(app)
+        admin_token_response = cls.client.post("/auth/dev/admin-token")
+        assert admin_token_response.status_code == 200
+        cls.admin_auth_header = {"Authorization": f"Bearer {admin_token_response.json()['access_token']}"}
+
+    @classmethod
+    def tearDownClass(cls):
+        deps.engine.dispose()
+        asyncio.run(deps.async_engine.dispose())
+        if os.path.exists(_TEST_DB_FILE):
+            os.remove(_TEST_DB_FILE)
+
+    def setUp(self):
+        # A zero check interval re-measures lag on every request.
+        self.replica = ReadReplica(
+            deps.engine,
+            f"sqlite:///{_REPLICA_DB_FILE.replace(os.sep, '/')}",
+            max_lag_seconds=10,
+            check_interval_seconds=0,
+        )
+        patcher = mock.patch.object(deps, "read_replica", self.replica)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.replica.engine.dispose()
+        asyncio.run(self.replica.async_engine.dispose())
+        if os.path.exists(_REPLICA_DB_FILE):
+            os.remove(_REPLICA_DB_FILE)
+
+    def _seed_technician(self, name: str) -> None:
+        with deps.SessionLocal() as db:
+            db.add(
+                Technician(
+                    id=uuid4(),
+                    name=name,
+                    full_name=name,
+                    email=f"{uuid4().hex[:12]}@replica.example.com",
+                    phone="+1-418-555-0101",
+                    status="active",
+                    manual_availability=True,
+                )
+            )
+            db.commit()
+
+    def _replicate(self) -> None:
+        """Stand-in for replication: copy the primary file over the replica."""
+        deps.engine.dispose()
+        self.replica.engine.dispose()
+        # The first test module to import the app decides which file the primary uses.
+        source = sqlite3.connect(deps.engine.url.database)
+        target = sqlite3.connect(_REPLICA_DB_FILE)
+        try:
+            source.backup(target)
+        finally:
+            source.close()
+            target.close()
+
+    def _listed_names(self) -> set:
+        res = self.client.get("/admin/technicians", headers=self.admin_auth_header)
+        self.assertEqual(res.status_code, 200, res.text)
+        return {item["name"] for item in res.json()}
+
+    def test_reads_use_caught_up_replica_and_fall_back_when_it_lags(self):
+        replicated = f"Replicated {uuid4().hex[:6]}"
+        primary_only = f"Primary Only {uuid4().hex[:6]}"
+
+        # No replica file yet: the lag check cannot read a heartbeat, so reads stay on the primary.
+        self._seed_technician(replicated)
+        self.assertIn(replicated, self._listed_names())
+        self.assertIsNone(self.replica.lag_seconds)
+
+        self._replicate()
+        self._seed_technician(primary_only)
+        names = self._listed_names()
+        self.assertIn(replicated, names)
+        self.assertNotIn(primary_only, names)
+        self.assertLess(self.replica.lag_seconds, 10)
+
+        invoices = self.client.get("/invoices", headers=self.admin_auth_header)
+        self.assertEqual(invoices.status_code, 200, invoices.text)
+        metrics = self.client.get("/admin/metrics/database-pool", headers=self.admin_auth_header)
+        self.assertEqual(
+            [pool["name"] for pool in metrics.json()["pools"]],
+            ["primary", "primary-async", "replica", "replica-async"],
+        )
+
+        stale = (datetime.now(timezone.utc) - timedelta(minutes=5)).replace(tzinfo=None)
+        replica_db = sqlite3.connect(_REPLICA_DB_FILE)
+        try:
+            replica_db.execute("UPDATE replication_heartbeat SET beat_at = ?", (stale.isoformat(sep=" "),))
+            replica_db.commit()
+        finally:
+            replica_db.close()
+        self.assertIn(primary_only, self._listed_names())
+        self.assertGreater(self.replica.lag_seconds, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+from datetime import date, time, timedelta
+from uuid import uuid4
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.models import *  # noqa: F401,F403
+from app.models.base import Base
+from app.models.dealership import Dealership
+from app.models.technician import Technician
+from app.models.time_off import TimeOff
+from app.models.working_hours import WorkingHours
+from app.models.zone import Zone
+from app.repositories.dealership_repository import DealershipRepository
+from app.repositories.technician_repository import TechnicianRepository
+
+
+class CachedLookupTests(unittest.TestCase):
+    """Cached lambda statements must bind each call's values, not the first call's."""
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(bind=self.engine)
+        self.db = Session(self.engine)
+        self.repo = TechnicianRepository(self.db)
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _technician(self, email: str) -> Technician:
+        technician = Technician(id=uuid4(), name=email, email=email, status="active", manual_availability=True)
+        self.db.add(technician)
+        self.db.flush()
+        return technician
+
+    def test_lookups_rebind_values_on_every_call(self):
+        first = self._technician("first@example.com")
+        second = self._technician("second@example.com")
+        self.db.add_all([Zone(name="Quebec"), Zone(name="Levis")])
+        self.db.add(Dealership(code="D-001", name="North", status="active"))
+        self.db.add(WorkingHours(technician_id=first.id, day_of_week=1, start_time=time(8), end_time=time(16)))
+        today = date.today()
+        self.db.add(
+            TimeOff(
+                technician_id=second.id,
+                entry_type="multi_day",
+                start_date=today,
+                end_date=today + timedelta(days=2),
+                reason="Vacation",
+            )
+        )
+        self.db.commit()
+
+        self.assertIs(self.repo.get_technician_by_id(first.id), first)
+        self.assertIs(self.repo.get_technician_by_id(second.id), second)
+        self.assertIsNone(self.repo.get_technician_by_id(uuid4()))
+        self.assertIs(self.repo.get_technician_by_email("SECOND@example.com"), second)
+        self.assertTrue(self.repo.email_exists("First@Example.com"))
+        self.assertFalse(self.repo.email_exists("third@example.com"))
+        self.assertEqual(self.repo.get_zone_by_name("levis").name, "Levis")
+        self.assertEqual(self.repo.get_zone_by_name("QUEBEC").name, "Quebec")
+        self.assertIsNotNone(self.repo.get_working_hours_for_day(first.id, 1))
+        self.assertIsNone(self.repo.get_working_hours_for_day(first.id, 2))
+        self.assertTrue(self.repo.has_active_time_off(second.id, today))
+        self.assertFalse(self.repo.has_active_time_off(first.id, today))
+        self.assertFalse(self.repo.has_active_time_off(second.id, today + timedelta(days=3)))
+        self.assertEqual(DealershipRepository(self.db).get_dealership_by_code(" d-001 ").name, "North")
+        self.assertIsNone(DealershipRepository(self.db).get_dealership_by_code("D-002"))
+
+
+if __name__ == "__main__":
+    unittest.main()
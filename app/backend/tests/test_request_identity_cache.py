@@ -0,0 +1,89 @@
+import unittest
+from uuid import uuid4
+
+from sqlalchemy import create_engine, event, update
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.identity_cache import expire_bulk_write_targets
+from app.models import *  # noqa: F401,F403
+from app.models.base import Base
+from app.models.job import Job
+from app.models.technician import Technician
+from app.repositories.technician_repository import TechnicianRepository
+from app.services.assignment_service import AssignmentService
+
+
+class RequestSession(Session):
+    pass
+
+
+event.listen(RequestSession, "do_orm_execute", expire_bulk_write_targets)
+
+
+class RequestIdentityCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(bind=self.engine)
+        self.session_factory = sessionmaker(bind=self.engine, class_=RequestSession, autoflush=False)
+        self.technician_id = uuid4()
+        with self.session_factory() as db:
+            db.add(
+                Technician(
+                    id=self.technician_id,
+                    name="Cache Tech",
+                    email="cache@example.com",
+                    status="active",
+                    manual_availability=True,
+                )
+            )
+            db.commit()
+        self.selects = []
+        event.listen(self.engine, "before_cursor_execute", self._record_select)
+
+    def tearDown(self):
+        event.remove(self.engine, "before_cursor_execute", self._record_select)
+        self.engine.dispose()
+
+    def _record_select(self, _conn, _cursor, statement, _parameters, _context, _executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.selects.append(statement)
+
+    def _technician_selects(self):
+        return [statement for statement in self.selects if "FROM technicians" in statement]
+
+    def test_repeated_lookups_in_one_request_hit_the_identity_map(self):
+        with self.session_factory() as db:
+            job = Job(id=uuid4(), job_code="JOB-CACHE", status="READY_FOR_TECH_ACCEPTANCE")
+            db.add(job)
+            db.commit()
+            self.selects.clear()
+
+            AssignmentService(db).check_assignment_readiness(self.technician_id, job.id)
+            AssignmentService(db).check_assignment_readiness(self.technician_id, job.id)
+
+        self.assertEqual(len(self._technician_selects()), 1, self._technician_selects())
+
+    def test_bulk_updates_expire_cached_instances(self):
+        with self.session_factory() as db:
+            repo = TechnicianRepository(db)
+            technician = repo.get_technician_by_id(self.technician_id)
+            self.assertEqual(technician.profile_version, 0)
+
+            repo.bump_profile_version(self.technician_id)
+            self.assertEqual(repo.get_technician_by_id(self.technician_id).profile_version, 1)
+
+            technician.name = "Renamed"
+            db.execute(update(Technician).where(Technician.id == self.technician_id).values(active_jobs=2))
+            # Unflushed edits survive; the instance is only reloaded once it is clean again.
+            self.assertEqual(repo.get_technician_by_id(self.technician_id).name, "Renamed")
+            db.commit()
+            self.assertEqual(repo.get_technician_by_id(self.technician_id).active_jobs, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
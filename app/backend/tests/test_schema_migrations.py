@@ -0,0 +1,70 @@
+import unittest
+
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, event, text
+from sqlalchemy.pool import StaticPool
+
+from app.core.db_migrations import (
+    FINGERPRINT_PREFIX,
+    MIGRATIONS,
+    ensure_migration_table,
+    ensure_schema_current,
+    mark_versions_applied,
+    schema_fingerprint,
+)
+from app.models import *  # noqa: F401,F403
+from app.models.base import Base
+
+
+class SchemaFingerprintTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def _columns(self, table_name):
+        with self.engine.connect() as conn:
+            return {row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info('{table_name}')")}
+
+    def test_current_database_costs_one_lookup(self):
+        self.assertTrue(ensure_schema_current(self.engine, Base.metadata))
+        with self.engine.connect() as conn:
+            versions = {row[0] for row in conn.execute(text("SELECT version FROM schema_migrations"))}
+        self.assertIn(f"{FINGERPRINT_PREFIX}{schema_fingerprint(Base.metadata)}", versions)
+        self.assertLessEqual({m.filename for m in MIGRATIONS if not m.seed}, versions)
+
+        statements = []
+        event.listen(self.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        self.assertFalse(ensure_schema_current(self.engine, Base.metadata))
+        self.assertEqual(len(statements), 1, statements)
+
+    def test_legacy_sqlite_columns_are_added_once_by_migration(self):
+        Base.metadata.create_all(bind=self.engine)
+        with self.engine.begin() as conn:
+            conn.exec_driver_sql("ALTER TABLE jobs DROP COLUMN vehicle")
+            conn.exec_driver_sql("ALTER TABLE technicians DROP COLUMN postal_code")
+            ensure_migration_table(conn)
+            applied = [m.filename for m in MIGRATIONS if m.filename != "017_legacy_sqlite_columns.sql"]
+            mark_versions_applied(conn, applied)
+        self.assertNotIn("vehicle", self._columns("jobs"))
+
+        self.assertTrue(ensure_schema_current(self.engine, Base.metadata))
+        self.assertIn("vehicle", self._columns("jobs"))
+        self.assertIn("postal_code", self._columns("technicians"))
+
+    def test_fingerprint_follows_model_changes(self):
+        metadata = MetaData()
+        for table in Base.metadata.tables.values():
+            table.to_metadata(metadata)
+        before = schema_fingerprint(metadata)
+        self.assertEqual(before, schema_fingerprint(Base.metadata))
+        Table("startup_probe", metadata, Column("id", Integer, primary_key=True))
+        self.assertNotEqual(before, schema_fingerprint(metadata))
+
+
+if __name__ == "__main__":
+    unittest.main()
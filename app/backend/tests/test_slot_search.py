@@ -0,0 +1,62 @@
+import unittest
+from datetime import date, datetime, time, timedelta, timezone
+from types import SimpleNamespace
+
+from app.services.slot_search_service import iter_free_windows, shift_windows_for_day
+from app.services.time_off_index import TimeOffInterval, TimeOffIntervalTree
+
+
+def _shift(start: time, end: time, enabled: bool = True):
+    return SimpleNamespace(is_enabled=enabled, start_time=start, end_time=end)
+
+
+def _utc(day: date, hour: int, minute: int = 0) -> datetime:
+    return datetime.combine(day, time(hour, minute), tzinfo=timezone.utc)
+
+
+class ShiftWindowTests(unittest.TestCase):
+    def setUp(self):
+        self.day = date(2026, 3, 2)
+
+    def test_disabled_day_has_no_windows(self):
+        self.assertEqual(shift_windows_for_day(self.day, _shift(time(8), time(16), enabled=False), []), [])
+        self.assertEqual(shift_windows_for_day(self.day, None, []), [])
+
+    def test_half_day_leave_trims_shift(self):
+        morning = TimeOffInterval(self.day, self.day, entry_type="half_day_morning")
+        afternoon = TimeOffInterval(self.day, self.day, entry_type="half_day_afternoon")
+        self.assertEqual(
+            shift_windows_for_day(self.day, _shift(time(8), time(16)), [morning]),
+            [(_utc(self.day, 12), _utc(self.day, 16))],
+        )
+        self.assertEqual(
+            shift_windows_for_day(self.day, _shift(time(8), time(16)), [afternoon]),
+            [(_utc(self.day, 8), _utc(self.day, 12))],
+        )
+        self.assertEqual(shift_windows_for_day(self.day, _shift(time(8), time(16)), [morning, afternoon]), [])
+
+    def test_full_day_leave_blocks_shift(self):
+        leave = TimeOffInterval(self.day, self.day + timedelta(days=2), entry_type="multi_day")
+        self.assertEqual(shift_windows_for_day(self.day, _shift(time(8), time(16)), [leave]), [])
+
+
+class FreeWindowIteratorTests(unittest.TestCase):
+    def test_skips_leave_and_respects_start_and_duration(self):
+        monday = date(2026, 3, 2)
+        schedule = {day: _shift(time(8), time(16)) for day in range(5)}
+        tree = TimeOffIntervalTree([TimeOffInterval(monday + timedelta(days=1), monday + timedelta(days=1), entry_type="full_day")])
+
+        windows = list(
+            iter_free_windows(
+                schedule_by_day=schedule,
+                time_off=tree,
+                not_before=_utc(monday, 15),
+                search_end=_utc(monday + timedelta(days=3), 0),
+                min_duration=timedelta(hours=2),
+            )
+        )
+        self.assertEqual(windows, [(_utc(monday + timedelta(days=2), 8), _utc(monday + timedelta(days=2), 16))])
+
+
+if __name__ == "__main__":
+    unittest.main()
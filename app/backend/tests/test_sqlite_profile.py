@@ -0,0 +1,160 @@
+import asyncio
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from sqlalchemy import create_engine, event, func, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.config import SQLITE_BUSY_TIMEOUT_MS
+from app.core.db_pool import async_database_url, engine_options, instrument_engine
+from app.core.db_sqlite import SerializedWriteSession, WriteGate, configure_sqlite_connections, writer_engine_options
+from app.models import *  # noqa: F401,F403
+from app.models.base import Base
+from app.models.zone import Zone
+
+
+class SqlitePerformanceProfileTests(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".sqlite3")
+        os.close(handle)
+        url = f"sqlite:///{self.path}"
+        self.url = url
+        self.write_gate = WriteGate(timeout_seconds=30)
+        self.engine = create_engine(url, **engine_options(url))
+        self.writer = create_engine(url, **writer_engine_options(engine_options(url)))
+        instrument_engine(self.writer)
+        for engine in (self.engine, self.writer):
+            configure_sqlite_connections(engine, performance_profile=True)
+        Base.metadata.create_all(bind=self.engine)
+
+    def tearDown(self):
+        self.engine.dispose()
+        self.writer.dispose()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.path + suffix):
+                os.remove(self.path + suffix)
+
+    def _session(self):
+        return SerializedWriteSession(bind=self.engine, writer=self.writer, write_gate=self.write_gate, autoflush=False)
+
+    def test_profile_pragmas_are_applied(self):
+        with self.engine.connect() as conn:
+            self.assertEqual(conn.exec_driver_sql("PRAGMA journal_mode").scalar(), "wal")
+            self.assertEqual(conn.exec_driver_sql("PRAGMA synchronous").scalar(), 1)
+            self.assertEqual(conn.exec_driver_sql("PRAGMA busy_timeout").scalar(), SQLITE_BUSY_TIMEOUT_MS)
+            self.assertEqual(conn.exec_driver_sql("PRAGMA foreign_keys").scalar(), 1)
+
+    def test_transaction_moves_to_writer_at_first_write(self):
+        with self._session() as db:
+            db.execute(select(Zone)).all()
+            self.assertIs(db.get_bind(), self.engine)
+            db.add(Zone(name="Levis"))
+            db.flush()
+            self.assertIs(db.get_bind(), self.writer)
+            db.commit()
+            self.assertIs(db.get_bind(), self.engine)
+
+            db.execute(text("UPDATE zones SET name = 'Quebec'"))
+            self.assertIs(db.get_bind(), self.writer)
+            db.rollback()
+            self.assertIs(db.get_bind(), self.engine)
+
+    def test_reads_do_not_wait_for_open_write(self):
+        with self._session() as writer_db, self._session() as reader_db:
+            writer_db.add(Zone(name="Donnacona"))
+            writer_db.flush()
+            # The write transaction still holds the only writer connection.
+            self.assertEqual(reader_db.execute(select(func.count(Zone.id))).scalar(), 0)
+            writer_db.commit()
+            self.assertEqual(reader_db.execute(select(func.count(Zone.id))).scalar(), 1)
+
+    def test_concurrent_writers_queue_on_one_connection(self):
+        errors = []
+
+        def write_zones(worker: int) -> None:
+            try:
+                for index in range(10):
+                    with self._session() as db:
+                        db.add(Zone(name=f"Zone {worker}-{index}"))
+                        db.commit()
+            except Exception as exc:  # noqa: BLE001 - surfaced by the assertion below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=write_zones, args=(worker,)) for worker in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        with self._session() as db:
+            self.assertEqual(db.execute(select(func.count(Zone.id))).scalar(), 80)
+        self.assertEqual(self.writer.pool.metrics.peak_in_use, 1)
+        self.assertEqual(self.writer.pool.metrics.checkouts, 80)
+
+    def test_sync_and_async_writers_share_the_write_gate(self):
+        async_url = async_database_url(self.url)
+        async_engine = create_async_engine(async_url, **engine_options(async_url, asynchronous=True))
+        async_writer = create_async_engine(async_url, **writer_engine_options(engine_options(async_url, asynchronous=True)))
+        self.addCleanup(lambda: asyncio.run(async_writer.dispose()))
+        self.addCleanup(lambda: asyncio.run(async_engine.dispose()))
+        for engine in (async_engine.sync_engine, async_writer.sync_engine):
+            configure_sqlite_connections(engine, performance_profile=True)
+        # Without SQLite's own busy wait, a sync and an async write that overlap fail at once.
+        for engine in (self.writer, async_writer.sync_engine):
+            event.listen(engine, "connect", _disable_busy_timeout)
+        async_session_factory = async_sessionmaker(
+            async_engine,
+            autoflush=False,
+            sync_session_class=SerializedWriteSession,
+            writer=async_writer.sync_engine,
+            write_gate=self.write_gate,
+        )
+        errors = []
+
+        def sync_writer(worker: int) -> None:
+            try:
+                for index in range(10):
+                    with self._session() as db:
+                        db.add(Zone(name=f"Sync {worker}-{index}"))
+                        db.flush()
+                        time.sleep(0.002)
+                        db.commit()
+            except Exception as exc:  # noqa: BLE001 - surfaced by the assertion below
+                errors.append(exc)
+
+        async def async_writer_task(worker: int) -> None:
+            for index in range(10):
+                async with async_session_factory() as db:
+                    db.add(Zone(name=f"Async {worker}-{index}"))
+                    await db.flush()
+                    await asyncio.sleep(0.002)
+                    await db.commit()
+
+        async def async_writers() -> None:
+            results = await asyncio.gather(*(async_writer_task(worker) for worker in range(4)), return_exceptions=True)
+            errors.extend(result for result in results if isinstance(result, Exception))
+
+        threads = [threading.Thread(target=sync_writer, args=(worker,)) for worker in range(4)]
+        threads.append(threading.Thread(target=asyncio.run, args=(async_writers(),)))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        with self._session() as db:
+            self.assertEqual(db.execute(select(func.count(Zone.id))).scalar(), 80)
+
+
+def _disable_busy_timeout(dbapi_connection, _record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA busy_timeout=0")
+    cursor.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
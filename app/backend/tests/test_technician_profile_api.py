@@ -1,10 +1,12 @@
+import asyncio
 import os
 import unittest
-from datetime import date, timedelta
+from datetime import date, datetime, time, timedelta, timezone
 from uuid import uuid4
 
 from fastapi.testclient import TestClient
 from pydantic import ValidationError
+from sqlalchemy import event
 
 _TEST_DB_FILE = os.path.join(os.path.dirname(__file__), "technician_profile_test.sqlite3")
 if os.path.exists(_TEST_DB_FILE):
@@ -13,17 +15,28 @@ if os.path.exists(_TEST_DB_FILE):
 os.environ["APP_ENV"] = "development"
 os.environ["DATABASE_URL"] = f"sqlite:///{_TEST_DB_FILE.replace(os.sep, '/')}"
 
-from app.api.deps import SessionLocal, engine
+from app.api.deps import SessionLocal, async_engine, engine
+from app.core.broadcast import get_broadcast_hub
 from app.main import app
+from app.models.audit_log import AuditLog
 from app.models.base import Base
+from app.models.dealership import Dealership
+from app.models.geocode import PostalCodeGeocode
 from app.models.invoice import Invoice, InvoiceLineItem
 from app.models.job import Job
+from app.models.job_candidate import job_candidates
+from app.models.job_rejection import JobRejection
 from app.models.signup_request import SignupRequest
+from app.models.skill import Skill, technician_skills
 from app.models.technician import Technician
 from app.models.technician_email_change_request import TechnicianEmailChangeRequest
 from app.models.time_off import TimeOff
 from app.models.working_hours import WorkingHours
+from app.models.zone import Zone, technician_zones
 from app.schemas.technician_profile import TechnicianAvailabilityUpdateRequest
+from app.repositories.technician_repository import TechnicianRepository
+from app.services.slot_search_service import SlotSearchService
+from app.services.technician_profile_loader import TechnicianProfileLoader, profile_cache
 
 
 class TechnicianProfileApiTests(unittest.TestCase):
@@ -38,6 +51,7 @@ class TechnicianProfileApiTests(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         engine.dispose()
+        asyncio.run(async_engine.dispose())
         if os.path.exists(_TEST_DB_FILE):
             os.remove(_TEST_DB_FILE)
 
@@ -78,6 +92,29 @@ class TechnicianProfileApiTests(unittest.TestCase):
         self.assertEqual(token_res.status_code, 200, token_res.text)
         return {"Authorization": f"Bearer {token_res.json()['access_token']}"}
 
+    def _seed_dispatch_pool(self, technician_ids) -> tuple:
+        """Put technicians in a fresh zone and skill with round-the-clock shifts."""
+        with SessionLocal() as db:
+            zone = Zone(id=uuid4(), name=f"Zone {uuid4().hex[:8]}")
+            skill = Skill(id=uuid4(), name=f"Skill {uuid4().hex[:8]}")
+            db.add_all([zone, skill])
+            db.flush()
+            for tech_id in technician_ids:
+                db.execute(technician_zones.insert().values(technician_id=tech_id, zone_id=zone.id))
+                db.execute(technician_skills.insert().values(technician_id=tech_id, skill_id=skill.id))
+                for day in range(7):
+                    db.add(
+                        WorkingHours(
+                            technician_id=tech_id,
+                            day_of_week=day,
+                            is_enabled=True,
+                            start_time=time.min,
+                            end_time=time.max,
+                        )
+                    )
+            db.commit()
+            return zone.id, skill.id
+
     def test_availability_validation_rules(self):
         with self.assertRaises(ValidationError):
             TechnicianAvailabilityUpdateRequest(
@@ -239,6 +276,845 @@ class TechnicianProfileApiTests(unittest.TestCase):
         self.assertFalse(approved_row["has_pending_email_change_request"])
         self.assertEqual(approved_row["email"], "dany.new@sm2dispatch.com")
 
+    def test_team_calendar_expands_schedule_and_time_off_with_etag(self):
+        tech = self._seed_technician(name="Calendar Tech", email="calendar@sm2dispatch.com")
+        monday = date.today() + timedelta(days=7 - date.today().weekday())
+        schedule_res = self.client.put(
+            f"/admin/technicians/{tech.id}/weekly-schedule",
+            json=[
+                {"day_of_week": day, "is_enabled": day < 5, "start_time": "08:00", "end_time": "16:00"}
+                for day in range(7)
+            ],
+            headers=self.admin_auth_header,
+        )
+        self.assertEqual(schedule_res.status_code, 200, schedule_res.text)
+        for start_offset, end_offset, entry_type in ((1, 2, "multi_day"), (3, 3, "half_day_morning")):
+            time_off_res = self.client.post(
+                f"/admin/technicians/{tech.id}/time-off",
+                json={
+                    "start_date": str(monday + timedelta(days=start_offset)),
+                    "end_date": str(monday + timedelta(days=end_offset)),
+                    "reason": "Leave",
+                    "entry_type": entry_type,
+                },
+                headers=self.admin_auth_header,
+            )
+            self.assertEqual(time_off_res.status_code, 201, time_off_res.text)
+
+        params = {"from_date": str(monday), "to_date": str(monday + timedelta(days=6))}
+        res = self.client.get("/admin/technicians/calendar", params=params, headers=self.admin_auth_header)
+        self.assertEqual(res.status_code, 200, res.text)
+        row = next(item for item in res.json()["technicians"] if item["technician_id"] == str(tech.id))
+        self.assertEqual(row["days"], "WOOPW--")
+        self.assertEqual(row["working_days_count"], 3)
+        self.assertEqual(
+            row["time_off_ranges"],
+            [{"start_date": str(monday + timedelta(days=1)), "end_date": str(monday + timedelta(days=2))}],
+        )
+
+        etag = res.headers["ETag"]
+        cached_res = self.client.get(
+            "/admin/technicians/calendar",
+            params=params,
+            headers={**self.admin_auth_header, "If-None-Match": etag},
+        )
+        self.assertEqual(cached_res.status_code, 304)
+
+        # Lists, strong forms of the weak tag and "*" match too; other tags do not.
+        strong = etag.removeprefix("W/")
+        for if_none_match, expected_status in (
+            (f'"stale", {strong}', 304),
+            ("*", 304),
+            ('W/"stale", "other"', 200),
+        ):
+            conditional_res = self.client.get(
+                "/admin/technicians/calendar",
+                params=params,
+                headers={**self.admin_auth_header, "If-None-Match": if_none_match},
+            )
+            self.assertEqual(conditional_res.status_code, expected_status, if_none_match)
+
+    def test_earliest_slots_orders_qualified_technicians_by_start(self):
+        monday = date.today() + timedelta(days=7 - date.today().weekday())
+        early = self._seed_technician(name="Early Bird", email="early@sm2dispatch.com")
+        on_leave = self._seed_technician(name="On Leave", email="leave@sm2dispatch.com")
+        unqualified = self._seed_technician(name="Other Zone", email="other@sm2dispatch.com")
+
+        with SessionLocal() as db:
+            zone = Zone(id=uuid4(), name=f"Zone {uuid4().hex[:8]}")
+            skill = Skill(id=uuid4(), name=f"Skill {uuid4().hex[:8]}")
+            db.add_all([zone, skill])
+            db.flush()
+            for tech_id, start_hour in ((early.id, 10), (on_leave.id, 8), (unqualified.id, 6)):
+                for day in range(5):
+                    db.add(
+                        WorkingHours(
+                            technician_id=tech_id,
+                            day_of_week=day,
+                            is_enabled=True,
+                            start_time=time(start_hour, 0),
+                            end_time=time(17, 0),
+                        )
+                    )
+            for tech_id in (early.id, on_leave.id):
+                db.execute(technician_zones.insert().values(technician_id=tech_id, zone_id=zone.id))
+                db.execute(technician_skills.insert().values(technician_id=tech_id, skill_id=skill.id))
+            db.add(
+                TimeOff(
+                    technician_id=on_leave.id,
+                    entry_type="full_day",
+                    start_date=monday,
+                    end_date=monday,
+                    reason="Leave",
+                )
+            )
+            job = Job(id=uuid4(), job_code="SLOT-1", status="READY_FOR_TECH_ACCEPTANCE", zone_id=zone.id, skill_id=skill.id)
+            db.add(job)
+            db.commit()
+
+            response = SlotSearchService(db).find_earliest_slots_for_job(
+                job.id,
+                limit=5,
+                now=datetime.combine(monday, time(6, 0), tzinfo=timezone.utc),
+            )
+
+        self.assertEqual([slot.technician_id for slot in response.slots], [early.id, on_leave.id])
+        self.assertEqual(response.slots[0].start_at, datetime.combine(monday, time(10, 0), tzinfo=timezone.utc))
+        self.assertEqual(
+            response.slots[1].start_at,
+            datetime.combine(monday + timedelta(days=1), time(8, 0), tzinfo=timezone.utc),
+        )
+
+    def test_active_jobs_counter_tracks_assignment_and_status_changes(self):
+        first = self._seed_technician(name="Counter One", email="counter1@sm2dispatch.com")
+        second = self._seed_technician(name="Counter Two", email="counter2@sm2dispatch.com")
+
+        def counters(db):
+            db.expire_all()
+            return [db.get(Technician, first.id).active_jobs, db.get(Technician, second.id).active_jobs]
+
+        with SessionLocal() as db:
+            job = Job(id=uuid4(), job_code="CNT-1", status="ASSIGNED", assigned_tech_id=first.id)
+            db.add_all([job, Job(id=uuid4(), job_code="CNT-2", status="COMPLETED", assigned_tech_id=first.id)])
+            db.commit()
+            self.assertEqual(counters(db), [1, 0])
+
+            job.assigned_tech_id = second.id
+            job.status = "IN_PROGRESS"
+            db.commit()
+            self.assertEqual(counters(db), [0, 1])
+
+            job.status = "COMPLETED"
+            db.commit()
+            self.assertEqual(counters(db), [0, 0])
+
+            job.status = "DELAYED"
+            db.commit()
+            db.delete(job)
+            db.commit()
+            self.assertEqual(counters(db), [0, 0])
+
+    def test_reconcile_active_job_counters_repairs_drift(self):
+        tech = self._seed_technician(name="Drift", email="drift@sm2dispatch.com")
+        with SessionLocal() as db:
+            db.add(Job(id=uuid4(), job_code="DRIFT-1", status="READY_FOR_TECH_ACCEPTANCE"))
+            db.commit()
+            db.query(Job).update({"assigned_tech_id": tech.id, "status": "assigned"}, synchronize_session=False)
+            db.commit()
+
+            repo = TechnicianRepository(db)
+            self.assertEqual(repo.get_current_jobs_count(tech.id), 0)
+            drifted = repo.reconcile_active_job_counters()
+            db.commit()
+
+            self.assertEqual(drifted, [{"technician_id": tech.id, "stored": 0, "actual": 1}])
+            self.assertEqual(repo.get_current_jobs_count(tech.id), 1)
+            self.assertEqual(repo.reconcile_active_job_counters(), [])
+
+    def test_job_acceptance_is_first_writer_wins(self):
+        winner = self._seed_technician(name="Winner", email="winner@sm2dispatch.com")
+        loser = self._seed_technician(name="Loser", email="loser@sm2dispatch.com")
+
+        zone_id, skill_id = self._seed_dispatch_pool([winner.id, loser.id])
+        with SessionLocal() as db:
+            job = Job(id=uuid4(), job_code="CAS-1", status="READY_FOR_TECH_ACCEPTANCE", zone_id=zone_id, skill_id=skill_id)
+            db.add(job)
+            db.commit()
+            job_id = job.id
+            initial_version = job.version
+
+        accepted = self.client.post(
+            f"/technicians/me/jobs/{job_id}/accept",
+            headers=self._technician_auth_header(email="winner@sm2dispatch.com"),
+        )
+        self.assertEqual(accepted.status_code, 200, accepted.text)
+        self.assertEqual(accepted.json()["version"], initial_version + 1)
+        self.assertEqual(accepted.json()["assigned_tech_id"], str(winner.id))
+
+        rejected = self.client.post(
+            f"/technicians/me/jobs/{job_id}/accept",
+            headers=self._technician_auth_header(email="loser@sm2dispatch.com"),
+        )
+        self.assertEqual(rejected.status_code, 409, rejected.text)
+
+        with SessionLocal() as db:
+            self.assertEqual(db.get(Job, job_id).version, initial_version + 1)
+            self.assertEqual(db.get(Technician, winner.id).active_jobs, 1)
+            self.assertEqual(db.get(Technician, loser.id).active_jobs, 0)
+            self.assertEqual(db.execute(job_candidates.select()).all(), [])
+
+    def test_job_candidates_follow_job_and_technician_changes(self):
+        first = self._seed_technician(name="Cand One", email="cand1@sm2dispatch.com")
+        second = self._seed_technician(name="Cand Two", email="cand2@sm2dispatch.com")
+        zone_id, skill_id = self._seed_dispatch_pool([first.id, second.id])
+
+        def candidates(db):
+            rows = db.execute(job_candidates.select().order_by(job_candidates.c.technician_id)).all()
+            return {row.technician_id for row in rows}
+
+        with SessionLocal() as db:
+            job = Job(id=uuid4(), job_code="CAND-1", status="DRAFT", zone_id=zone_id, skill_id=skill_id)
+            db.add(job)
+            db.commit()
+            self.assertEqual(candidates(db), set())
+
+            job.status = "READY_FOR_TECH_ACCEPTANCE"
+            db.commit()
+            self.assertEqual(candidates(db), {first.id, second.id})
+            job_id = job.id
+
+        removed = self.client.delete(
+            f"/admin/technicians/{second.id}/skills/{skill_id}",
+            headers=self.admin_auth_header,
+        )
+        self.assertEqual(removed.status_code, 200, removed.text)
+        with SessionLocal() as db:
+            self.assertEqual(candidates(db), {first.id})
+
+        feed = self.client.get(
+            "/technicians/me/jobs/available",
+            headers=self._technician_auth_header(email="cand1@sm2dispatch.com"),
+        )
+        self.assertEqual(feed.status_code, 200, feed.text)
+        self.assertEqual([item["job_id"] for item in feed.json()["items"]], [str(job_id)])
+
+        with SessionLocal() as db:
+            db.add(JobRejection(job_id=job_id, tech_id=first.id, reason="Too far"))
+            db.commit()
+            self.assertEqual(candidates(db), set())
+            self.assertEqual(TechnicianRepository(db).rebuild_job_candidates(), 1)
+            self.assertEqual(candidates(db), set())
+
+    def test_job_broadcasts_reach_candidates_after_commit(self):
+        winner = self._seed_technician(name="Push Winner", email="push1@sm2dispatch.com")
+        other = self._seed_technician(name="Push Other", email="push2@sm2dispatch.com")
+        zone_id, skill_id = self._seed_dispatch_pool([winner.id, other.id])
+        winner_header = self._technician_auth_header(email="push1@sm2dispatch.com")
+
+        def publish_and_accept():
+            with SessionLocal() as db:
+                job = Job(id=uuid4(), job_code="PUSH-1", status="READY_FOR_TECH_ACCEPTANCE", zone_id=zone_id, skill_id=skill_id)
+                db.add(job)
+                db.commit()
+                job_id = job.id
+            response = self.client.post(f"/technicians/me/jobs/{job_id}/accept", headers=winner_header)
+            self.assertEqual(response.status_code, 200, response.text)
+            return job_id
+
+        broadcast_hub = get_broadcast_hub()
+
+        async def scenario():
+            winner_events = broadcast_hub.subscribe(winner.id)
+            other_events = broadcast_hub.subscribe(other.id)
+            try:
+                job_id = await asyncio.to_thread(publish_and_accept)
+                received = {
+                    "winner": [(await asyncio.wait_for(winner_events.get(), timeout=1)) for _ in range(2)],
+                    "other": [(await asyncio.wait_for(other_events.get(), timeout=1)) for _ in range(2)],
+                }
+                return job_id, received
+            finally:
+                broadcast_hub.unsubscribe(winner_events)
+                broadcast_hub.unsubscribe(other_events)
+
+        job_id, received = asyncio.run(scenario())
+        self.assertEqual([item.event for item in received["winner"]], ["job.available", "job.accepted"])
+        self.assertEqual([item.event for item in received["other"]], ["job.available", "job.taken"])
+        self.assertEqual(received["other"][1].data["job_id"], str(job_id))
+
+    def test_job_feed_pages_by_created_at_and_skips_rejected_or_unqualified(self):
+        tech = self._seed_technician(name="Feed Tech", email="feed@sm2dispatch.com")
+        zone_id, skill_id = self._seed_dispatch_pool([tech.id])
+        other_zone_id, _ = self._seed_dispatch_pool([])
+        base = datetime(2026, 3, 2, 8, 0, tzinfo=timezone.utc)
+
+        with SessionLocal() as db:
+            expected = []
+            for index in range(5):
+                job = Job(
+                    id=uuid4(),
+                    job_code=f"FEED-{index}",
+                    status="READY_FOR_TECH_ACCEPTANCE",
+                    zone_id=zone_id,
+                    skill_id=skill_id,
+                    created_at=base + timedelta(minutes=index // 2),
+                )
+                db.add(job)
+                expected.append(job)
+            rejected = expected.pop(1)
+            db.add_all(
+                [
+                    Job(id=uuid4(), job_code="FEED-ZONE", status="READY_FOR_TECH_ACCEPTANCE", zone_id=other_zone_id, skill_id=skill_id),
+                    Job(id=uuid4(), job_code="FEED-DONE", status="COMPLETED", zone_id=zone_id, skill_id=skill_id),
+                ]
+            )
+            db.flush()
+            db.add(JobRejection(job_id=rejected.id, tech_id=tech.id))
+            db.commit()
+            expected_ids = [
+                str(job.id) for job in sorted(expected, key=lambda item: (item.created_at, item.id.hex))
+            ]
+
+        header = self._technician_auth_header(email="feed@sm2dispatch.com")
+        seen = []
+        pages = 0
+        cursor = None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["after"] = cursor
+            response = self.client.get("/technicians/me/jobs/available", params=params, headers=header)
+            self.assertEqual(response.status_code, 200, response.text)
+            body = response.json()
+            seen.extend(item["job_id"] for item in body["items"])
+            pages += 1
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+
+        self.assertEqual(seen, expected_ids)
+        self.assertEqual(pages, 2)
+
+
+    def test_profile_loader_serves_cached_aggregate_until_profile_changes(self):
+        tech = self._seed_technician(name="Cached Tech", email="cached.tech@example.com")
+        self._seed_dispatch_pool([tech.id])
+        tech_auth = self._technician_auth_header(email="cached.tech@example.com")
+        profile_cache.clear()
+        statements = []
+
+        def count_statement(*_args):
+            statements.append(1)
+
+        def load_profile():
+            statements.clear()
+            with SessionLocal() as db:
+                event.listen(engine, "before_cursor_execute", count_statement)
+                try:
+                    aggregate = TechnicianProfileLoader(db).load(tech.id)
+                finally:
+                    event.remove(engine, "before_cursor_execute", count_statement)
+            return aggregate, len(statements)
+
+        first, cold_statements = load_profile()
+        second, warm_statements = load_profile()
+        self.assertIs(second, first)
+        self.assertEqual(warm_statements, 1)
+        self.assertLessEqual(cold_statements, 7)
+        self.assertEqual(len(first.zones), 1)
+
+        with SessionLocal() as db:
+            zone = Zone(id=uuid4(), name=f"Extra {uuid4().hex[:8]}")
+            db.add(zone)
+            db.commit()
+            zone_id = zone.id
+        add_res = self.client.post(
+            f"/admin/technicians/{tech.id}/zones",
+            headers=self.admin_auth_header,
+            json={"zone_id": str(zone_id)},
+        )
+        self.assertEqual(add_res.status_code, 200, add_res.text)
+
+        refreshed, _ = load_profile()
+        self.assertEqual(refreshed.profile_version, first.profile_version + 1)
+        self.assertIn(zone_id, [zone.id for zone in refreshed.zones])
+
+        with SessionLocal() as db:
+            TechnicianRepository(db).update_technician_fields(tech.id, {"phone": "+1-418-555-0199"})
+            uncommitted = TechnicianProfileLoader(db).load(tech.id)
+            self.assertEqual(uncommitted.phone, "+1-418-555-0199")
+            db.rollback()
+
+        after_rollback, _ = load_profile()
+        self.assertIs(after_rollback, refreshed)
+        me_res = self.client.get("/technicians/me", headers=tech_auth)
+        self.assertEqual(me_res.status_code, 200, me_res.text)
+        self.assertEqual(me_res.json()["phone"], "+1-418-555-0101")
+        self.assertEqual(len(me_res.json()["zones"]), 2)
+
+
+    def test_sync_bundle_returns_deltas_since_token(self):
+        tech = self._seed_technician(name="Sync Tech", email="sync.tech@example.com")
+        self._seed_dispatch_pool([tech.id])
+        tech_auth = self._technician_auth_header(email="sync.tech@example.com")
+        first_start = date.today() + timedelta(days=10)
+        first_res = self.client.post(
+            "/technician/time-off",
+            headers=tech_auth,
+            json={
+                "entry_type": "full_day",
+                "start_date": first_start.isoformat(),
+                "end_date": first_start.isoformat(),
+                "reason": "Training",
+            },
+        )
+        self.assertEqual(first_res.status_code, 200, first_res.text)
+        with SessionLocal() as db:
+            an_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
+            db.query(WorkingHours).filter(WorkingHours.technician_id == tech.id).update({"updated_at": an_hour_ago})
+            db.query(TimeOff).filter(TimeOff.technician_id == tech.id).update({"updated_at": an_hour_ago})
+            db.commit()
+
+        full_res = self.client.get("/technicians/me/sync", headers={**tech_auth, "Accept-Encoding": "gzip"})
+        self.assertEqual(full_res.status_code, 200, full_res.text)
+        self.assertEqual(full_res.headers.get("content-encoding"), "gzip")
+        full = full_res.json()
+        self.assertTrue(full["full_sync"])
+        self.assertEqual(len(full["weekly_schedule"]), 7)
+        self.assertEqual([item["id"] for item in full["time_off"]], [first_res.json()["id"]])
+        self.assertNotIn("weekly_schedule", full["profile"])
+        etag = full_res.headers["ETag"]
+        self.assertEqual(etag, f'"{full["sync_token"]}"')
+
+        cached_res = self.client.get("/technicians/me/sync", headers={**tech_auth, "If-None-Match": etag})
+        self.assertEqual(cached_res.status_code, 304)
+
+        second_start = date.today() + timedelta(days=20)
+        second_res = self.client.post(
+            "/technician/time-off",
+            headers=tech_auth,
+            json={
+                "entry_type": "full_day",
+                "start_date": second_start.isoformat(),
+                "end_date": second_start.isoformat(),
+                "reason": "Vacation",
+            },
+        )
+        self.assertEqual(second_res.status_code, 200, second_res.text)
+
+        delta_res = self.client.get("/technicians/me/sync", headers={**tech_auth, "If-None-Match": etag})
+        self.assertEqual(delta_res.status_code, 200, delta_res.text)
+        delta = delta_res.json()
+        self.assertFalse(delta["full_sync"])
+        self.assertEqual(delta["weekly_schedule"], [])
+        self.assertEqual([item["id"] for item in delta["time_off"]], [second_res.json()["id"]])
+        self.assertEqual(set(delta["time_off_ids"]), {first_res.json()["id"], second_res.json()["id"]})
+        self.assertEqual(delta["email_change_requests"], [])
+
+        unchanged_res = self.client.get(
+            "/technicians/me/sync",
+            headers=tech_auth,
+            params={"since": delta["sync_token"]},
+        )
+        self.assertFalse(unchanged_res.json()["full_sync"])
+        self.assertEqual(unchanged_res.json()["time_off"], [])
+
+        garbage_res = self.client.get("/technicians/me/sync", headers=tech_auth, params={"since": "not-a-token"})
+        self.assertTrue(garbage_res.json()["full_sync"])
+
+
+    def test_availability_save_applies_diff_and_keeps_history(self):
+        tech = self._seed_technician(name="Diff Tech", email="diff.tech@example.com")
+        tech_auth = self._technician_auth_header(email="diff.tech@example.com")
+        vacation = (date.today() + timedelta(days=3), date.today() + timedelta(days=4))
+        dentist = date.today() + timedelta(days=10)
+        conference = date.today() + timedelta(days=20)
+
+        def save(working_days, ranges):
+            res = self.client.put(
+                "/technicians/me/availability",
+                json={
+                    "working_days": working_days,
+                    "working_hours_start": "08:00",
+                    "working_hours_end": "16:00",
+                    "after_hours_enabled": False,
+                    "out_of_office_ranges": [
+                        {"start_date": str(start), "end_date": str(end), "note": note} for start, end, note in ranges
+                    ],
+                },
+                headers=tech_auth,
+            )
+            self.assertEqual(res.status_code, 200, res.text)
+
+        def snapshot():
+            with SessionLocal() as db:
+                schedule = db.query(WorkingHours).filter_by(technician_id=tech.id).all()
+                time_off = db.query(TimeOff).filter_by(technician_id=tech.id).all()
+                return (
+                    {row.day_of_week: (row.id, row.is_enabled) for row in schedule},
+                    {row.start_date: row for row in time_off},
+                )
+
+        save([0, 1, 2, 3, 4], [(vacation[0], vacation[1], "Vacation"), (dentist, dentist, "Dentist")])
+        with SessionLocal() as db:
+            db.add(
+                TimeOff(
+                    technician_id=tech.id,
+                    entry_type="full_day",
+                    start_date=date.today() - timedelta(days=30),
+                    end_date=date.today() - timedelta(days=30),
+                    reason="Old",
+                    cancelled_at=datetime.now(timezone.utc),
+                )
+            )
+            db.commit()
+        schedule_before, time_off_before = snapshot()
+
+        with SessionLocal() as db:
+            repo = TechnicianRepository(db)
+            version = repo.get_profile_version(tech.id)
+            repo.replace_weekly_schedule(
+                tech.id,
+                [
+                    {"day_of_week": day, "is_enabled": day < 5, "start_time": time(8, 0), "end_time": time(16, 0)}
+                    for day in range(7)
+                ],
+            )
+            repo.replace_out_of_office_ranges(
+                tech.id,
+                [
+                    {
+                        "entry_type": row.entry_type,
+                        "start_date": row.start_date,
+                        "end_date": row.end_date,
+                        "reason": row.reason,
+                    }
+                    for row in time_off_before.values()
+                    if row.cancelled_at is None
+                ],
+            )
+            self.assertEqual(repo.get_profile_version(tech.id), version)
+            db.commit()
+
+        save([0, 1, 2, 3, 4, 5], [(vacation[0], vacation[1], "Family trip"), (conference, conference, "Conference")])
+        schedule_after, time_off_after = snapshot()
+
+        self.assertEqual(
+            {day: item[0] for day, item in schedule_after.items()},
+            {day: item[0] for day, item in schedule_before.items()},
+        )
+        self.assertTrue(schedule_after[5][1])
+        self.assertEqual(time_off_after[vacation[0]].id, time_off_before[vacation[0]].id)
+        self.assertEqual(time_off_after[vacation[0]].reason, "Family trip")
+        self.assertIsNotNone(time_off_after[dentist].cancelled_at)
+        self.assertIsNone(time_off_after[conference].cancelled_at)
+        self.assertIn(date.today() - timedelta(days=30), time_off_after)
+
+
+    def test_bulk_zone_assignment_reports_per_pair_results(self):
+        first = self._seed_technician(name="Bulk One", email="bulk1@sm2dispatch.com")
+        second = self._seed_technician(name="Bulk Two", email="bulk2@sm2dispatch.com")
+        _, skill_id = self._seed_dispatch_pool([first.id, second.id])
+        with SessionLocal() as db:
+            north = Zone(id=uuid4(), name=f"North {uuid4().hex[:8]}")
+            south = Zone(id=uuid4(), name=f"South {uuid4().hex[:8]}")
+            db.add_all([north, south])
+            db.flush()
+            db.execute(technician_zones.insert().values(technician_id=second.id, zone_id=south.id))
+            job = Job(
+                id=uuid4(),
+                job_code="BULK-1",
+                status="READY_FOR_TECH_ACCEPTANCE",
+                zone_id=north.id,
+                skill_id=skill_id,
+            )
+            db.add(job)
+            db.commit()
+            north_id, south_id, job_id = north.id, south.id, job.id
+        missing_id = uuid4()
+
+        def pairs(*items):
+            return [{"technician_id": str(tech_id), "zone_id": str(zone_id)} for tech_id, zone_id in items]
+
+        add_res = self.client.post(
+            "/admin/technicians/zones/bulk",
+            headers=self.admin_auth_header,
+            json={
+                "operation": "add",
+                "assignments": pairs(
+                    (first.id, north_id),
+                    (second.id, south_id),
+                    (first.id, north_id),
+                    (missing_id, north_id),
+                    (first.id, missing_id),
+                ),
+            },
+        )
+        self.assertEqual(add_res.status_code, 200, add_res.text)
+        self.assertEqual(add_res.json()["applied"], 1)
+        self.assertEqual(
+            [item["status"] for item in add_res.json()["results"]],
+            ["added", "already_assigned", "technician_not_found", "zone_not_found"],
+        )
+        with SessionLocal() as db:
+            candidate_rows = db.execute(job_candidates.select().where(job_candidates.c.job_id == job_id)).all()
+            self.assertEqual({row.technician_id for row in candidate_rows}, {first.id})
+            audit_rows = (
+                db.query(AuditLog)
+                .filter(
+                    AuditLog.action == "admin.technician.zone_added",
+                    AuditLog.entity_id.in_([first.id, second.id]),
+                )
+                .all()
+            )
+            self.assertEqual(
+                [(row.entity_id, row.metadata_json["zone_id"]) for row in audit_rows],
+                [(first.id, str(north_id))],
+            )
+
+        remove_res = self.client.post(
+            "/admin/technicians/zones/bulk",
+            headers=self.admin_auth_header,
+            json={"operation": "remove", "assignments": pairs((first.id, north_id), (first.id, south_id))},
+        )
+        self.assertEqual(remove_res.status_code, 200, remove_res.text)
+        self.assertEqual([item["status"] for item in remove_res.json()["results"]], ["removed", "not_assigned"])
+        with SessionLocal() as db:
+            self.assertEqual(db.execute(job_candidates.select().where(job_candidates.c.job_id == job_id)).all(), [])
+
+    def test_bulk_status_deactivates_filtered_technicians_in_one_update(self):
+        first = self._seed_technician(name="Season One", email="season1@sm2dispatch.com")
+        second = self._seed_technician(name="Season Two", email="season2@sm2dispatch.com")
+        idle = self._seed_technician(name="Season Idle", email="season3@sm2dispatch.com")
+        outside = self._seed_technician(name="Season Outside", email="season4@sm2dispatch.com")
+        zone_id, skill_id = self._seed_dispatch_pool([first.id, second.id, idle.id])
+        self._seed_dispatch_pool([outside.id])
+        with SessionLocal() as db:
+            db.query(Technician).filter(Technician.id == idle.id).update({"status": "deactivated"})
+            job = Job(
+                id=uuid4(),
+                job_code="SEASON-1",
+                status="READY_FOR_TECH_ACCEPTANCE",
+                zone_id=zone_id,
+                skill_id=skill_id,
+            )
+            db.add(job)
+            db.flush()
+            TechnicianRepository(db).refresh_job_candidates(job)
+            db.commit()
+            job_id = job.id
+            versions_before = dict(
+                db.query(Technician.id, Technician.profile_version).filter(Technician.id.in_([first.id, second.id]))
+            )
+
+        missing = self.client.post(
+            "/admin/technicians/status/bulk",
+            headers=self.admin_auth_header,
+            json={"status": "deactivated"},
+        )
+        self.assertEqual(missing.status_code, 422)
+
+        technician_updates = []
+
+        def count_technician_updates(_conn, _cursor, statement, _parameters, _context, _executemany):
+            if statement.lstrip().upper().startswith("UPDATE TECHNICIANS"):
+                technician_updates.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count_technician_updates)
+        try:
+            res = self.client.post(
+                "/admin/technicians/status/bulk",
+                headers=self.admin_auth_header,
+                json={"status": "deactivated", "zone_id": str(zone_id)},
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", count_technician_updates)
+        self.assertEqual(res.status_code, 200, res.text)
+        self.assertEqual(res.json()["updated"], 2)
+        self.assertEqual(set(res.json()["technician_ids"]), {str(first.id), str(second.id)})
+        self.assertEqual(len(technician_updates), 1)
+
+        with SessionLocal() as db:
+            rows = {
+                row.id: row
+                for row in db.query(Technician).filter(Technician.id.in_([first.id, second.id, outside.id])).all()
+            }
+            self.assertEqual(rows[outside.id].status, "active")
+            for tech_id in (first.id, second.id):
+                self.assertEqual(rows[tech_id].status, "deactivated")
+                self.assertFalse(rows[tech_id].manual_availability)
+                self.assertEqual(rows[tech_id].profile_version, versions_before[tech_id] + 1)
+            self.assertEqual(db.execute(job_candidates.select().where(job_candidates.c.job_id == job_id)).all(), [])
+            audit_rows = (
+                db.query(AuditLog)
+                .filter(
+                    AuditLog.action == "admin.technician.updated",
+                    AuditLog.entity_id.in_([first.id, second.id, idle.id]),
+                )
+                .all()
+            )
+            self.assertEqual({row.entity_id for row in audit_rows}, {first.id, second.id})
+            self.assertEqual(
+                audit_rows[0].metadata_json["changes"],
+                {"status": "deactivated", "manual_availability": False},
+            )
+
+        reactivate = self.client.post(
+            "/admin/technicians/status/bulk",
+            headers=self.admin_auth_header,
+            json={"status": "active", "technician_ids": [str(first.id), str(outside.id)]},
+        )
+        self.assertEqual(reactivate.status_code, 200, reactivate.text)
+        self.assertEqual(reactivate.json()["technician_ids"], [str(first.id)])
+
+    def test_nearest_technicians_ranks_candidates_by_distance(self):
+        near = self._seed_technician(name="Near Tech", email="near@sm2dispatch.com")
+        far = self._seed_technician(name="Far Tech", email="far@sm2dispatch.com")
+        unlocated = self._seed_technician(name="Unlocated Tech", email="unlocated@sm2dispatch.com")
+        outsider = self._seed_technician(name="Outsider Tech", email="outsider@sm2dispatch.com")
+        zone_id, skill_id = self._seed_dispatch_pool([near.id, far.id, unlocated.id])
+        self._seed_dispatch_pool([outsider.id])
+        with SessionLocal() as db:
+            db.query(PostalCodeGeocode).delete()
+            db.add_all(
+                [
+                    PostalCodeGeocode(postal_code="G1R", latitude=46.8123, longitude=-71.2145),
+                    PostalCodeGeocode(postal_code="G6V3Z9", latitude=46.8033, longitude=-71.1779),
+                    PostalCodeGeocode(postal_code="H2X", latitude=45.5088, longitude=-73.5617),
+                ]
+            )
+            db.commit()
+            for tech_id, postal_code in ((far.id, "H2X 1Y4"), (outsider.id, "G1R 2B5")):
+                db.get(Technician, tech_id).postal_code = postal_code
+            dealership = Dealership(id=uuid4(), code=f"D-{uuid4().hex[:6]}", name="Quebec Motors", postal_code="g1r 4p5")
+            db.add(dealership)
+            db.flush()
+            job = Job(
+                id=uuid4(),
+                job_code="GEO-1",
+                status="READY_FOR_TECH_ACCEPTANCE",
+                zone_id=zone_id,
+                skill_id=skill_id,
+                dealership_id=dealership.id,
+            )
+            db.add(job)
+            db.commit()
+            job_id = job.id
+            self.assertAlmostEqual(job.latitude, 46.8123)
+
+        update_res = self.client.put(
+            f"/admin/technicians/{near.id}",
+            headers=self.admin_auth_header,
+            json={"postal_code": "g6v 3z9"},
+        )
+        self.assertEqual(update_res.status_code, 200, update_res.text)
+        self.assertEqual(update_res.json()["postal_code"], "G6V 3Z9")
+
+        res = self.client.get(f"/admin/technicians/nearest/{job_id}", headers=self.admin_auth_header)
+        self.assertEqual(res.status_code, 200, res.text)
+        body = res.json()
+        self.assertEqual(body["candidate_count"], 3)
+        self.assertEqual(
+            [item["technician_name"] for item in body["technicians"]],
+            ["Near Tech", "Far Tech", "Unlocated Tech"],
+        )
+        near_km, far_km, unlocated_km = [item["distance_km"] for item in body["technicians"]]
+        self.assertLess(near_km, 5)
+        self.assertTrue(200 < far_km < 260, far_km)
+        self.assertIsNone(unlocated_km)
+
+        radius_res = self.client.get(
+            f"/admin/technicians/nearest/{job_id}?max_distance_km=50",
+            headers=self.admin_auth_header,
+        )
+        self.assertEqual([item["technician_id"] for item in radius_res.json()["technicians"]], [str(near.id)])
+
+        moved = self.client.put(
+            f"/admin/technicians/{far.id}",
+            headers=self.admin_auth_header,
+            json={"postal_code": "G1R 1A1"},
+        )
+        self.assertEqual(moved.status_code, 200, moved.text)
+        reranked = self.client.get(f"/admin/technicians/nearest/{job_id}?limit=1", headers=self.admin_auth_header)
+        self.assertEqual(reranked.json()["technicians"][0]["technician_id"], str(far.id))
+        self.assertEqual(reranked.json()["technicians"][0]["distance_km"], 0.0)
+
+    def test_technician_import_streams_batches_and_reports_row_errors(self):
+        self._seed_technician(name="Existing", email="existing.import@example.com")
+        with SessionLocal() as db:
+            audits_before = db.query(AuditLog).filter(AuditLog.action == "admin.technician.created").count()
+        lines = ["name,email,phone,status"]
+        lines += [f"Tech {index},import{index}@example.com,+1418555{index:04d}," for index in range(1200)]
+        lines += [
+            "Broken,not-an-email,,",
+            "Dup,import5@example.com,,",
+            "Existing,EXISTING.import@example.com,,",
+            "Too,many@example.com,,active,extra",
+            "Inactive,inactive.import@example.com,,deactivated",
+        ]
+        csv_res = self.client.post(
+            "/admin/technicians/import",
+            headers={**self.admin_auth_header, "Content-Type": "text/csv"},
+            content="\n".join(lines).encode(),
+        )
+        self.assertEqual(csv_res.status_code, 200, csv_res.text)
+        body = csv_res.json()
+        self.assertEqual((body["processed"], body["created"], body["failed"]), (1205, 1201, 4))
+        self.assertEqual(
+            [(item["line"], item["email"]) for item in body["errors"]],
+            [
+                (1202, "not-an-email"),
+                (1203, "import5@example.com"),
+                (1204, "existing.import@example.com"),
+                (1205, None),
+            ],
+        )
+        with SessionLocal() as db:
+            self.assertEqual(db.query(Technician).filter(Technician.email.like("import%@example.com")).count(), 1200)
+            inactive = db.query(Technician).filter_by(email="inactive.import@example.com").one()
+            self.assertEqual(inactive.status, "deactivated")
+            self.assertEqual(
+                db.query(AuditLog).filter(AuditLog.action == "admin.technician.created").count() - audits_before,
+                1201,
+            )
+
+        ndjson_res = self.client.post(
+            "/admin/technicians/import",
+            params={"format": "ndjson"},
+            headers=self.admin_auth_header,
+            content=b'{"name": "Json Tech", "email": "json.import@example.com", "manual_availability": false}\n'
+            b"\n"
+            b"not json\n"
+            b'["array"]\n',
+        )
+        self.assertEqual(ndjson_res.status_code, 200, ndjson_res.text)
+        self.assertEqual(ndjson_res.json()["created"], 1)
+        self.assertEqual([item["line"] for item in ndjson_res.json()["errors"]], [3, 4])
+
+        unsupported = self.client.post(
+            "/admin/technicians/import",
+            headers={**self.admin_auth_header, "Content-Type": "application/xml"},
+            content=b"<technicians/>",
+        )
+        self.assertEqual(unsupported.status_code, 415)
+
+    def test_database_pool_metrics_are_admin_only(self):
+        self.client.get("/admin/technicians", headers=self.admin_auth_header)
+        res = self.client.get("/admin/metrics/database-pool", headers=self.admin_auth_header)
+        self.assertEqual(res.status_code, 200, res.text)
+        primary = res.json()["pools"][0]
+        self.assertEqual((primary["name"], primary["pool_class"]), ("primary", "InstrumentedQueuePool"))
+        self.assertGreaterEqual(primary["checkouts"], 1)
+        self.assertEqual(primary["in_use"], 0)
+        self.assertEqual(res.json()["pools"][1]["pool_class"], "InstrumentedAsyncQueuePool")
+
+        technician = self._seed_technician(name="Metrics Tech", email="metrics.tech@sm2dispatch.com")
+        forbidden = self.client.get(
+            "/admin/metrics/database-pool",
+            headers=self._technician_auth_header(email=technician.email),
+        )
+        self.assertEqual(forbidden.status_code, 403)
+
 
 if __name__ == "__main__":
     unittest.main()
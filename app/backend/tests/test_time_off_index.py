@@ -0,0 +1,78 @@
+import random
+import unittest
+from datetime import date, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.services.time_off_index import TimeOffIndex, TimeOffInterval, TimeOffIntervalTree
+
+
+def _interval(start: date, days: int) -> TimeOffInterval:
+    return TimeOffInterval(start_date=start, end_date=start + timedelta(days=days))
+
+
+class TimeOffIntervalTreeTests(unittest.TestCase):
+    def test_empty_tree_has_no_overlaps(self):
+        tree = TimeOffIntervalTree()
+        self.assertFalse(tree.covers(date(2026, 1, 1)))
+        self.assertEqual(tree.overlapping(date(2026, 1, 1), date(2026, 12, 31)), [])
+        self.assertIsNone(tree.next_start_on_or_after(date(2026, 1, 1)))
+
+    def test_inclusive_boundaries(self):
+        tree = TimeOffIntervalTree([_interval(date(2026, 3, 10), 2)])
+        self.assertTrue(tree.covers(date(2026, 3, 10)))
+        self.assertTrue(tree.covers(date(2026, 3, 12)))
+        self.assertFalse(tree.covers(date(2026, 3, 9)))
+        self.assertFalse(tree.covers(date(2026, 3, 13)))
+        self.assertTrue(tree.overlaps(date(2026, 3, 1), date(2026, 3, 10)))
+
+    def test_next_start_on_or_after(self):
+        tree = TimeOffIntervalTree(
+            [_interval(date(2026, 5, 1), 0), _interval(date(2026, 4, 1), 3), _interval(date(2026, 6, 1), 1)]
+        )
+        self.assertEqual(tree.next_start_on_or_after(date(2026, 4, 2)), date(2026, 5, 1))
+        self.assertEqual(tree.next_start_on_or_after(date(2026, 4, 1)), date(2026, 4, 1))
+        self.assertIsNone(tree.next_start_on_or_after(date(2026, 6, 2)))
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(26)
+        origin = date(2026, 1, 1)
+        intervals = [
+            _interval(origin + timedelta(days=rng.randint(0, 700)), rng.randint(0, 20))
+            for _ in range(2000)
+        ]
+        tree = TimeOffIntervalTree(intervals)
+
+        for _ in range(300):
+            start = origin + timedelta(days=rng.randint(-10, 720))
+            end = start + timedelta(days=rng.randint(0, 15))
+            expected = sorted(
+                (item for item in intervals if item.start_date <= end and item.end_date >= start),
+                key=lambda item: (item.start_date, item.end_date),
+            )
+            self.assertEqual(tree.overlapping(start, end), expected)
+            self.assertEqual(tree.overlaps(start, end), bool(expected))
+
+
+class TimeOffIndexTests(unittest.TestCase):
+    def test_loaded_technicians_without_rows_get_empty_tree(self):
+        with_leave = uuid4()
+        without_leave = uuid4()
+        rows = [
+            SimpleNamespace(
+                id=uuid4(),
+                technician_id=with_leave,
+                entry_type="full_day",
+                start_date=date(2026, 2, 2),
+                end_date=date(2026, 2, 2),
+            )
+        ]
+        index = TimeOffIndex([with_leave, without_leave], rows)
+
+        self.assertTrue(index.get(with_leave).covers(date(2026, 2, 2)))
+        self.assertEqual(len(index.get(without_leave)), 0)
+        self.assertIsNone(index.get(uuid4()))
+
+
+if __name__ == "__main__":
+    unittest.main()